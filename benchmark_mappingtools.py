@@ -0,0 +1,200 @@
+#!/usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+
+__author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
+
+#-------------------------------------------------------------------------
+#
+#  benchmark_mappingtools.py measures throughput, peak memory and match
+#  quality of dirtystringtools and mappingtools on synthetic dirty names
+#
+#  usage: ./benchmark_mappingtools.py num_firms num_records [seed]
+#
+#-------------------------------------------------------------------------
+import bisect
+import random
+import resource
+import time
+
+NAME_PARTS = ["Nordic", "Atlantic", "Capital", "Union", "Savings", "Trust", "Credit", "Commerce", "Merchant",
+              "Cooperative", "Investment", "Mutual", "National", "Federal", "Pacific", "Central", "Standard",
+              "Royal", "Eastern", "Western", "Alpine", "Baltic", "Danske", "Societe", "Generale", "Deutsche",
+              "Zuercher", "Helvetia", "Iberia", "Lusitania", "Hanse", "Rhein", "Nordea", "Sparebank"]
+LEGAL_FORMS = ["Bank", "Limited", "Corporation", "Holding", "Company", "Incorporated"]
+ABBREVIATIONS = {"Bank": "Bk", "Limited": "Ltd", "Corporation": "Corp", "Holding": "Hldg",
+                 "Company": "Co", "Incorporated": "Inc", "International": "Intl"}
+REDUNDANT_WORDS = ["The", "of", "Group"]
+ACCENTS = {"a": u"á", "e": u"é", "o": u"ø", "u": u"ü", "c": u"ç", "n": u"ñ"}
+CITIES = ["Oslo", "Copenhagen", "Stockholm", "Helsinki", "Reykjavik", "Zurich", "Frankfurt", "Lisbon"]
+
+
+def generate_firms(num_firms, rng):
+    """
+    Generate num_firms distinct canonical firm names, each with a city.
+    """
+    firms = set()
+    while len(firms) < num_firms:
+        name = " ".join(rng.sample(NAME_PARTS, rng.randint(1, 3)) + [rng.choice(LEGAL_FORMS)])
+        firms.add((name, rng.choice(CITIES)))
+    return sorted(firms)
+
+
+def make_typo(word, rng):
+    if len(word) < 3:
+        return word
+    i = rng.randrange(len(word) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:  # swap
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if kind == 1:  # delete
+        return word[:i] + word[i + 1:]
+    if kind == 2:  # insert
+        return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i:]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]  # replace
+
+
+def make_dirty(name, rng, noise):
+    """
+    Return a noisy UTF-8 encoded version of name: typos, abbreviations, redundant words, casing, accents and
+    interpunctuation, each applied with probability noise.
+    """
+    words = name.split(" ")
+    if rng.random() < noise:
+        words = [ABBREVIATIONS.get(word, word) for word in words]
+    if rng.random() < noise:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(REDUNDANT_WORDS))
+    if rng.random() < noise:
+        i = rng.randrange(len(words))
+        words[i] = make_typo(words[i], rng)
+    dirty = u" ".join(words)
+    if rng.random() < noise:
+        dirty = u"".join(ACCENTS.get(c, c) if rng.random() < 0.3 else c for c in dirty)
+    if rng.random() < noise:
+        dirty = rng.choice([dirty.upper(), dirty.lower(), dirty.title()])
+    if rng.random() < noise:
+        dirty = dirty.replace(u" ", rng.choice([u"  ", u", ", u". ", u"-"]), 1) + rng.choice([u".", u",", u""])
+    return dirty.encode('utf-8')
+
+
+def generate_records(firms, num_records, rng, noise=0.3):
+    """
+    Draw num_records noisy records from firms with Zipf-like firm sizes. Returns the records as (name, city)
+    tuples and the index of the true firm of every record.
+    """
+    weights = [1.0/(rank + 1) for rank in range(len(firms))]
+    total = sum(weights)
+    cumulative = []
+    running = 0.0
+    for weight in weights:
+        running += weight/total
+        cumulative.append(running)
+    records, truth = [], []
+    for _ in xrange(num_records):
+        u = rng.random()
+        firm = min(bisect.bisect_left(cumulative, u), len(firms) - 1)  # rounding may leave cumulative[-1] < u
+        records.append((make_dirty(firms[firm][0], rng, noise), firms[firm][1]))
+        truth.append(firm)
+    return records, truth
+
+
+def peak_memory_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0
+
+
+def report(stage, num_items, start_time):
+    elapsed = time.time() - start_time
+    print "%-34s %10d items %9.3f s %12.0f items/s %9.1f MB peak" % \
+        (stage, num_items, elapsed, num_items/max(elapsed, 1e-9), peak_memory_mb())
+
+
+def match_quality(records, truth, resolved, key):
+    """
+    Share of records that are resolved to the most frequent variant of their true firm.
+    """
+    from collections import Counter
+    variants = {}
+    for record, firm in zip(records, truth):
+        variants.setdefault(firm, Counter())[key(record)] += 1
+    representative = dict((firm, counter.most_common(1)[0][0]) for firm, counter in variants.items())
+    correct = sum(1 for record, firm in zip(records, truth) if resolved(record) == representative[firm])
+    return correct/float(len(records))
+
+
+if __name__ == '__main__':
+
+#
+# VARIABLES
+#
+    import sys
+
+    import src.dirtystringtools as DST
+    import src.mappingtools as MT
+
+    args = sys.argv
+    num_firms = int(args[1])
+    num_records = int(args[2])
+    seed = int(args[3]) if len(args) > 3 else 0
+
+    rng = random.Random(seed)
+    firms = generate_firms(num_firms, rng)
+    records, truth = generate_records(firms, num_records, rng)
+    redundant_strings = [word.upper() for word in REDUNDANT_WORDS]
+
+    print "MappingTools version: " + str(MT.__version__) + ", DirtyStringTools version: " + str(DST.__version__)
+    print "%d firms, %d records, seed %d" % (num_firms, num_records, seed)
+
+    #
+    # standardization
+    #
+    start_time = time.time()
+    names = DST.clean_strings([name for name, _ in records])
+    report("clean_strings", len(records), start_time)
+
+    mapping = MT.Mapping(DST.StringCache())
+    start_time = time.time()
+    names = [mapping.standardize_string(name, redundant_strings) for name in names]
+    report("standardize_string (cached)", len(records), start_time)
+    print "  string cache: ", mapping.string_cache.info()
+
+    #
+    # frequency counting
+    #
+    start_time = time.time()
+    frequencies = mapping.compute_string_frequency(names)
+    report("compute_string_frequency", len(names), start_time)
+
+    start_time = time.time()
+    with MT.StreamingCounter(max(1, len(frequencies)//4)) as counter:
+        counter.update(names)
+        streamed_frequencies = counter.to_dict()
+    report("StreamingCounter", len(names), start_time)
+    assert streamed_frequencies == frequencies
+
+    #
+    # best match
+    #
+    start_time = time.time()
+    best_matches = mapping.find_best_matches(frequencies, 4, 80)
+    report("find_best_matches", len(frequencies), start_time)
+    standardized = dict(zip(records, names))
+    quality = match_quality(records, truth, lambda record: best_matches[standardized[record]],
+                            lambda record: standardized[record])
+    print "  match quality: %.3f (unmatched: %.3f)" % \
+        (quality, match_quality(records, truth, lambda record: standardized[record],
+                                lambda record: standardized[record]))
+
+    #
+    # tuple match
+    #
+    tuples = [(name, city.upper()) for name, (_, city) in zip(names, records)]
+    tuple_frequencies = mapping.compute_string_frequency(tuples)
+    blocks = mapping.block_tuples(tuple_frequencies, MT.field_blocking_key(1))
+    print "  block size distribution: ", dict(mapping.block_size_distribution(blocks))
+    start_time = time.time()
+    best_tuple_matches = mapping.find_best_matches_tuple(tuple_frequencies, 80.0, 50.0,
+                                                         blocking_key=MT.field_blocking_key(1))
+    report("find_best_matches_tuple (blocked)", len(tuple_frequencies), start_time)
+    standardized_tuples = dict(zip(records, tuples))
+    quality = match_quality(records, truth, lambda record: best_tuple_matches[standardized_tuples[record]][0],
+                            lambda record: standardized_tuples[record])
+    print "  match quality: %.3f" % quality
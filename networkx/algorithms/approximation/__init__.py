@@ -4,3 +4,4 @@ from networkx.algorithms.approximation.independent_set import *
 from networkx.algorithms.approximation.matching import *
 from networkx.algorithms.approximation.ramsey import *
 from networkx.algorithms.approximation.vertex_cover import *
+from networkx.algorithms.approximation.clustering_coefficient import *
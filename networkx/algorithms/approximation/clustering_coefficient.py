@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+***************************************
+Approximate Clustering and Transitivity
+***************************************
+
+Estimates of the average clustering coefficient and the transitivity
+from uniformly sampled wedges, paths of length two, with a confidence
+interval.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from bisect import bisect_right
+import math
+import random
+import networkx as nx
+__all__ = ['average_clustering', 'transitivity']
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+
+def average_clustering(G, epsilon=0.01, delta=0.05, max_samples=None,
+                       seed=None):
+    r"""Estimate the average clustering coefficient of G.
+
+    A node is chosen uniformly at random and then two of its neighbors;
+    the fraction of these wedges that are closed by an edge is an
+    unbiased estimate of the average clustering [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+      Undirected graph
+
+    epsilon : float, optional (default=0.01)
+      Half width of the confidence interval.
+
+    delta : float, optional (default=0.05)
+      Probability that the average clustering is outside the interval.
+
+    max_samples : int, optional (default=None)
+      Sample at most this many wedges. The interval is then wider than
+      epsilon if fewer than the required samples are taken.
+
+    seed : hashable, optional (default=None)
+      Seed of the random number generator.
+
+    Returns
+    -------
+    estimate : float
+      Estimated average clustering.
+
+    interval : tuple
+      (low, high) bounds that contain the average clustering with
+      probability at least 1-delta.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> estimate, (low, high) = approx.average_clustering(G, seed=1)
+    >>> print(estimate)
+    1.0
+    >>> print(round(low, 2))
+    0.99
+
+    Notes
+    -----
+    All nodes are included in the average, nodes of degree less than two
+    with clustering 0, as in average_clustering(G, count_zeros=True).
+    By Hoeffding's inequality `\ln(2/\delta)/(2\epsilon^2)` samples
+    suffice, independent of the size of G. Self loops are ignored.
+
+    References
+    ----------
+    .. [1] Thomas Schank and Dorothea Wagner,
+       Approximating Clustering Coefficient and Transitivity.
+       Journal of Graph Algorithms and Applications 9(2):265-275, 2005.
+
+    See Also
+    --------
+    networkx.average_clustering
+    """
+    nodes = _check(G)
+    random.seed(seed)
+    k = _samples(epsilon, delta, max_samples)
+    if k == 0 or len(nodes) == 0:
+        return 0.0, (0.0, 1.0)
+    closed = 0
+    neighbors = _Neighbors(G)
+    for i in range(k):
+        v = nodes[random.randrange(len(nodes))]
+        closed += neighbors.closed_wedge(v)
+    return _estimate(closed, k, delta)
+
+
+def transitivity(G, epsilon=0.01, delta=0.05, max_samples=None, seed=None):
+    r"""Estimate the transitivity of G.
+
+    Wedges are sampled uniformly among all wedges of G, by choosing the
+    center node with probability proportional to its number of wedges;
+    the fraction of them closed by an edge is an unbiased estimate of
+    the transitivity [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+      Undirected graph
+
+    epsilon : float, optional (default=0.01)
+      Half width of the confidence interval.
+
+    delta : float, optional (default=0.05)
+      Probability that the transitivity is outside the interval.
+
+    max_samples : int, optional (default=None)
+      Sample at most this many wedges. The interval is then wider than
+      epsilon if fewer than the required samples are taken.
+
+    seed : hashable, optional (default=None)
+      Seed of the random number generator.
+
+    Returns
+    -------
+    estimate : float
+      Estimated transitivity.
+
+    interval : tuple
+      (low, high) bounds that contain the transitivity with probability
+      at least 1-delta.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> estimate, (low, high) = approx.transitivity(G, seed=1)
+    >>> print(estimate)
+    1.0
+    >>> print(round(low, 2))
+    0.99
+
+    Notes
+    -----
+    The wedge counts of all nodes are computed once in O(n) time, after
+    which each sample takes O(log n) time for nodes already sampled and
+    O(deg) for the first sample at a node. Self loops are ignored.
+
+    References
+    ----------
+    .. [1] Thomas Schank and Dorothea Wagner,
+       Approximating Clustering Coefficient and Transitivity.
+       Journal of Graph Algorithms and Applications 9(2):265-275, 2005.
+
+    See Also
+    --------
+    networkx.transitivity
+    """
+    nodes = _check(G)
+    random.seed(seed)
+    k = _samples(epsilon, delta, max_samples)
+    # cumulative number of wedges, d(d-1)/2 at a node of degree d
+    cumulative = []
+    total = 0
+    for v in nodes:
+        d = len(G[v]) - (v in G[v])
+        total += d*(d-1)//2
+        cumulative.append(total)
+    if k == 0 or total == 0:
+        return 0.0, (0.0, 1.0) if total > 0 else (0.0, 0.0)
+    closed = 0
+    neighbors = _Neighbors(G)
+    for i in range(k):
+        v = nodes[bisect_right(cumulative, random.randrange(total))]
+        closed += neighbors.closed_wedge(v)
+    return _estimate(closed, k, delta)
+
+
+def _check(G):
+    if G.is_directed():
+        raise nx.NetworkXError("Clustering algorithms are not defined "
+                               "for directed graphs.")
+    if G.is_multigraph():
+        raise nx.NetworkXError("Not defined for multigraphs.")
+    return list(G)
+
+def _samples(epsilon, delta, max_samples):
+    # number of samples for an error of at most epsilon with probability
+    # 1-delta by Hoeffding's inequality
+    if not 0 < epsilon or not 0 < delta < 1:
+        raise nx.NetworkXError("epsilon must be positive and delta "
+                               "in (0, 1).")
+    if max_samples is not None and max_samples < 0:
+        raise nx.NetworkXError("max_samples must be non-negative.")
+    k = int(math.ceil(math.log(2.0/delta)/(2.0*epsilon*epsilon)))
+    if max_samples is not None:
+        k = min(k, max_samples)
+    return k
+
+def _estimate(closed, k, delta):
+    estimate = closed/float(k)
+    half_width = math.sqrt(math.log(2.0/delta)/(2.0*k))
+    return estimate, (max(0.0, estimate - half_width),
+                      min(1.0, estimate + half_width))
+
+class _Neighbors(object):
+    # neighbor lists without self loops of the sampled nodes, built on
+    # first use so that high degree nodes are listed only once
+    def __init__(self, G):
+        self.G = G
+        self.lists = {}
+
+    def closed_wedge(self, v):
+        # 1 if a random pair of neighbors of v is adjacent, 0 otherwise
+        # or if v has less than two neighbors
+        nbrs = self.lists.get(v)
+        if nbrs is None:
+            nbrs = self.lists[v] = [u for u in self.G[v] if u != v]
+        if len(nbrs) < 2:
+            return 0
+        u, w = random.sample(nbrs, 2)
+        return int(w in self.G[u])
@@ -0,0 +1,46 @@
+from nose.tools import *
+import networkx as nx
+import networkx.algorithms.approximation as a
+
+def test_complete_and_empty():
+    G = nx.complete_graph(6)
+    for f in (a.average_clustering, a.transitivity):
+        estimate, (low, high) = f(G, seed=1)
+        assert_equal(estimate, 1.0)
+        assert_equal(high, 1.0)
+        assert_true(low > 0.98)
+    G = nx.path_graph(5)
+    assert_equal(a.transitivity(G, seed=1)[0], 0.0)
+    assert_equal(a.transitivity(nx.empty_graph(3)), (0.0, (0.0, 0.0)))
+    assert_equal(a.average_clustering(nx.Graph()), (0.0, (0.0, 1.0)))
+
+def test_estimates_within_interval():
+    G = nx.powerlaw_cluster_graph(300, 3, 0.5, seed=2)
+    G.add_edge(0, 0)
+    for f, exact in ((a.average_clustering, nx.average_clustering(G)),
+                     (a.transitivity, nx.transitivity(G))):
+        estimate, (low, high) = f(G, epsilon=0.02, delta=0.01, seed=3)
+        assert_true(low <= exact <= high)
+        assert_almost_equal(high - low, 0.04, places=3)
+
+def test_max_samples():
+    G = nx.karate_club_graph()
+    estimate, (low, high) = a.transitivity(G, max_samples=100, seed=1)
+    assert_true(high - low > 0.2)
+    estimate, interval = a.transitivity(G, max_samples=0)
+    assert_equal(interval, (0.0, 1.0))
+
+def test_seed():
+    G = nx.karate_club_graph()
+    assert_equal(a.average_clustering(G, seed=5),
+                 a.average_clustering(G, seed=5))
+
+def test_errors():
+    assert_raises(nx.NetworkXError, a.transitivity, nx.DiGraph())
+    assert_raises(nx.NetworkXError, a.average_clustering, nx.MultiGraph())
+    assert_raises(nx.NetworkXError, a.transitivity, nx.Graph(), epsilon=0)
+    assert_raises(nx.NetworkXError, a.transitivity, nx.Graph(), delta=1)
+    assert_raises(nx.NetworkXError, a.transitivity, nx.path_graph(3),
+                  max_samples=-3)
+    assert_raises(nx.NetworkXError, a.average_clustering, nx.path_graph(3),
+                  max_samples=-1)
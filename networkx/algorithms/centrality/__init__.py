@@ -1,5 +1,6 @@
 from networkx.algorithms.centrality.betweenness import *
 from networkx.algorithms.centrality.betweenness_subset import *
+from networkx.algorithms.centrality.betweenness_approximate import *
 from networkx.algorithms.centrality.closeness import *
 from networkx.algorithms.centrality.current_flow_closeness import *
 from networkx.algorithms.centrality.current_flow_betweenness import *
@@ -9,7 +10,9 @@ from networkx.algorithms.centrality.eigenvector import *
 from networkx.algorithms.centrality.katz import *
 from networkx.algorithms.centrality.load import *
 from networkx.algorithms.centrality.communicability_alg import *
+from networkx.algorithms.centrality.dynamic import *
 import networkx.algorithms.centrality.betweenness
+import networkx.algorithms.centrality.betweenness_approximate
 import networkx.algorithms.centrality.closeness
 import networkx.algorithms.centrality.current_flow_betweenness
 import networkx.algorithms.centrality.current_flow_closeness
@@ -18,3 +21,4 @@ import networkx.algorithms.centrality.eigenvector
 import networkx.algorithms.centrality.load
 import networkx.algorithms.centrality.communicability_alg
 import networkx.algorithms.centrality.katz
+import networkx.algorithms.centrality.dynamic
@@ -13,12 +13,13 @@ import random
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 
 __all__ = ['betweenness_centrality',
+           'betweenness_centrality_numpy',
            'edge_betweenness_centrality',
            'edge_betweenness']
 
 def betweenness_centrality(G, k=None, normalized=True, weight=None, 
                            endpoints=False, 
-                           seed=None):
+                           seed=None, processes=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -56,6 +57,10 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional  
       If True include the endpoints in the shortest path counts.
 
+    processes : int, optional (default=None)
+      If not None, split the source nodes across a pool of this many
+      worker processes and sum their partial betweenness values.
+
     Returns
     -------
     nodes : dictionary
@@ -79,6 +84,10 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length 
     paths between pairs of nodes.
 
+    The contributions of the source nodes are independent, so on large
+    graphs setting processes to the number of available cores gives a
+    near linear speedup. Each worker receives a copy of G.
+
     References
     ----------
     .. [1]  A Faster Algorithm for Betweenness Centrality.
@@ -94,23 +103,16 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        International Journal of Bifurcation and Chaos 17(7):2303-2318, 2007.
        http://www.inf.uni-konstanz.de/algo/publications/bp-celn-06.pdf
     """
-    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=_single_source_shortest_path_basic(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
-        # accumulation
-        if endpoints:
-            betweenness=_accumulate_endpoints(betweenness,S,P,sigma,s)
-        else:
-            betweenness=_accumulate_basic(betweenness,S,P,sigma,s)
+    if processes is None:
+        betweenness=_betweenness_sources(G,nodes,weight,endpoints)
+    else:
+        betweenness=_parallel_sources(G,nodes,processes,
+                                      _betweenness_sources,weight,endpoints)
     # rescaling
     betweenness=_rescale(betweenness, len(G),
                          normalized=normalized,
@@ -119,7 +121,8 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     return betweenness
 
 
-def edge_betweenness_centrality(G,normalized=True,weight=None):
+def edge_betweenness_centrality(G,normalized=True,weight=None,k=None,
+                                seed=None,processes=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -147,6 +150,17 @@ def edge_betweenness_centrality(G,normalized=True,weight=None):
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    k : int, optional (default=None)
+      If k is not None use k node samples to estimate betweenness.
+      The value of k <= n where n is the number of nodes in the graph.
+
+    seed : hashable, optional (default=None)
+      Seed of the random number generator used to sample k nodes.
+
+    processes : int, optional (default=None)
+      If not None, split the source nodes across a pool of this many
+      worker processes and sum their partial betweenness values.
+
     Returns
     -------
     edges : dictionary
@@ -175,23 +189,100 @@ def edge_betweenness_centrality(G,normalized=True,weight=None):
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
-    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(),0.0))
-    for s in G:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S,P,sigma=_single_source_shortest_path_basic(G,s)
-        else:  # use Dijkstra's algorithm
-            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
-        # accumulation
-        betweenness=_accumulate_edges(betweenness,S,P,sigma,s)
+    if k is None:
+        nodes = G
+    else:
+        random.seed(seed)
+        nodes = random.sample(G.nodes(), k)
+    if processes is None:
+        betweenness=_edge_betweenness_sources(G,nodes,weight)
+    else:
+        betweenness=_parallel_sources(G,nodes,processes,
+                                      _edge_betweenness_sources,weight)
     # rescaling
     for n in G: # remove nodes to only return edges 
         del betweenness[n]
     betweenness=_rescale_e(betweenness, len(G),
                            normalized=normalized,
-                           directed=G.is_directed())
+                           directed=G.is_directed(),
+                           k=k)
+    return betweenness
+
+def betweenness_centrality_numpy(G, k=None, normalized=True, weight=None,
+                                 endpoints=False, seed=None, processes=None):
+    r"""Compute the shortest-path betweenness centrality for nodes
+    with array-based shortest path searches.
+
+    This gives the same values as betweenness_centrality() (up to
+    floating point rounding) but relabels the nodes to 0..n-1 once and
+    runs Brandes' algorithm on CSR adjacency arrays with preallocated
+    per-node arrays instead of building dictionaries for every source.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph 
+
+    k : int, optional (default=None)
+      If k is not None use k node samples to estimate betweenness.
+      The value of k <= n where n is the number of nodes in the graph.
+
+    normalized : bool, optional  
+      If True the betweenness values are normalized by `2/((n-1)(n-2))` 
+      for graphs, and `1/((n-1)(n-2))` for directed graphs where `n` 
+      is the number of nodes in G.
+
+    weight : None or string, optional  
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    endpoints : bool, optional  
+      If True include the endpoints in the shortest path counts.
+
+    processes : int, optional (default=None)
+      If not None, split the source nodes across a pool of this many
+      worker processes and sum their partial betweenness values.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with betweenness centrality as the value.
+
+    See Also
+    --------
+    betweenness_centrality
+    csr_arrays
+
+    Notes
+    -----
+    Without weights the breadth-first search and the dependency
+    accumulation are vectorized over all nodes of a BFS level. With
+    weights Dijkstra's algorithm runs on flat lists over the CSR arrays.
+    In both cases the shortest-path predecessors are kept in a flat
+    buffer with one slot per arc instead of a list per node.
+
+    The graph is fastest to convert if it is a CSRGraph or CSRDiGraph.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "betweenness_centrality_numpy() requires NumPy: http://scipy.org/")
+    if k is None:
+        nodes = G
+    else:
+        random.seed(seed)
+        nodes = random.sample(G.nodes(), k)
+    if processes is None:
+        betweenness=_betweenness_sources_numpy(G,nodes,weight,endpoints)
+    else:
+        betweenness=_parallel_sources(G,nodes,processes,
+                                      _betweenness_sources_numpy,
+                                      weight,endpoints)
+    betweenness=_rescale(betweenness, len(G),
+                         normalized=normalized,
+                         directed=G.is_directed(),
+                         k=k)
     return betweenness
 
 # obsolete name
@@ -201,6 +292,226 @@ def edge_betweenness(G,normalized=True,weight=None):
 
 # helpers for betweenness centrality
 
+def _betweenness_sources(G,sources,weight=None,endpoints=False):
+    # betweenness accumulated over the shortest paths from sources
+    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S,P,sigma=_single_source_shortest_path_basic(G,s)
+        else:  # use Dijkstra's algorithm
+            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
+        # accumulation
+        if endpoints:
+            betweenness=_accumulate_endpoints(betweenness,S,P,sigma,s)
+        else:
+            betweenness=_accumulate_basic(betweenness,S,P,sigma,s)
+    return betweenness
+
+def _edge_betweenness_sources(G,sources,weight=None):
+    # node and edge betweenness accumulated over the shortest paths
+    # from sources
+    betweenness=dict.fromkeys(G,0.0) # b[v]=0 for v in G
+    # b[e]=0 for e in G.edges()
+    betweenness.update(dict.fromkeys(G.edges(),0.0))
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S,P,sigma=_single_source_shortest_path_basic(G,s)
+        else:  # use Dijkstra's algorithm
+            S,P,sigma=_single_source_dijkstra_path_basic(G,s,weight)
+        # accumulation
+        betweenness=_accumulate_edges(betweenness,S,P,sigma,s)
+    return betweenness
+
+def _betweenness_sources_numpy(G,sources,weight=None,endpoints=False):
+    # array version of _betweenness_sources
+    import numpy as np
+    nodelist,indptr,indices,weights=nx.csr_arrays(G,weight)
+    index=dict((v,i) for i,v in enumerate(nodelist))
+    betweenness=np.zeros(len(nodelist))
+    if weight is None:
+        kernel=_brandes_bfs_arrays(indptr,indices)
+    else:
+        kernel=_brandes_dijkstra_arrays(indptr,indices,weights)
+    for s in sources:
+        s=index[s]
+        visited,delta,distance=kernel(s) # s is visited[0]
+        if endpoints:
+            betweenness[s]+=len(visited)-1
+            betweenness[visited[1:]]+=delta[1:]+1
+        else:
+            betweenness[visited[1:]]+=delta[1:]
+    return dict(zip(nodelist,betweenness.tolist()))
+
+def _brandes_bfs_arrays(indptr,indices):
+    # Return a function computing, for a source index s, the visited nodes
+    # (s first), their dependencies delta and distances from s. BFS levels are processed as
+    # whole arrays; the arcs of the shortest-path DAG are stored level by
+    # level in the flat buffers pred_src/pred_dst.
+    import numpy as np
+    n=len(indptr)-1
+    degree=np.diff(indptr)
+    dist=np.empty(n,dtype=np.int_)
+    dist.fill(-1)
+    sigma=np.zeros(n)
+    delta=np.zeros(n)
+    pred_src=np.empty(len(indices),dtype=indices.dtype)
+    pred_dst=np.empty(len(indices),dtype=indices.dtype)
+    def kernel(s):
+        dist[s]=0
+        sigma[s]=1.0
+        frontier=np.array([s],dtype=indices.dtype)
+        levels=[frontier]
+        bounds=[0]
+        d=0
+        while True:
+            counts=degree[frontier]
+            total=counts.sum()
+            if total==0:
+                break
+            # positions of all arcs leaving the frontier
+            offsets=np.cumsum(counts)-counts
+            arcs=(np.repeat(indptr[frontier]-offsets,counts)
+                  +np.arange(total))
+            targets=indices[arcs]
+            sources=np.repeat(frontier,counts)
+            new=np.unique(targets[dist[targets]<0])
+            if len(new)==0:
+                break
+            dist[new]=d+1
+            shortest=dist[targets]==d+1
+            targets=targets[shortest]
+            sources=sources[shortest]
+            start=bounds[-1]
+            pred_src[start:start+len(targets)]=sources
+            pred_dst[start:start+len(targets)]=targets
+            bounds.append(start+len(targets))
+            # sigma[w] = sum of sigma[v] over shortest-path predecessors v
+            sigma[new]=np.bincount(np.searchsorted(new,targets),
+                                   weights=sigma[sources],
+                                   minlength=len(new))
+            levels.append(new)
+            frontier=new
+            d+=1
+        for level in range(len(levels)-2,-1,-1):
+            sources=pred_src[bounds[level]:bounds[level+1]]
+            targets=pred_dst[bounds[level]:bounds[level+1]]
+            c=sigma[sources]*((1.0+delta[targets])/sigma[targets])
+            nodes=levels[level]
+            delta[nodes]+=np.bincount(np.searchsorted(nodes,sources),
+                                      weights=c,minlength=len(nodes))
+        visited=np.concatenate(levels)
+        result=delta[visited]
+        distance=dist[visited].astype(float)
+        # reset only the entries touched by this source
+        dist[visited]=-1
+        sigma[visited]=0.0
+        delta[visited]=0.0
+        return visited,result,distance
+    return kernel
+
+def _brandes_dijkstra_arrays(indptr,indices,weights):
+    # Dijkstra version of _brandes_bfs_arrays. Scalar access in the heap
+    # loop is faster on lists than on NumPy arrays, so the CSR arrays
+    # and the per-node state are kept in preallocated lists. The
+    # predecessors of node w are stored in pred[in_ptr[w]:in_ptr[w]+
+    # pred_count[w]], one slot per incoming arc.
+    import numpy as np
+    n=len(indptr)-1
+    in_ptr=np.zeros(n+1,dtype=np.int_)
+    in_ptr[1:]=np.cumsum(np.bincount(indices,minlength=n))
+    in_ptr=in_ptr.tolist()
+    ptr=indptr.tolist()
+    nbrs=indices.tolist()
+    wts=weights.tolist()
+    pred=[0]*len(nbrs)
+    pred_count=[0]*n
+    sigma=[0.0]*n
+    delta=[0.0]*n
+    seen=[None]*n
+    done=[False]*n
+    push=heapq.heappush
+    pop=heapq.heappop
+    def kernel(s):
+        S=[]
+        seen[s]=0
+        sigma[s]=1.0
+        Q=[(0,s,s)]
+        while Q:
+            (dist,p,v)=pop(Q)
+            if done[v]:
+                continue # already searched this node.
+            done[v]=True
+            sigma[v]+=sigma[p] # count paths
+            S.append(v)
+            for a in range(ptr[v],ptr[v+1]):
+                w=nbrs[a]
+                vw_dist=dist+wts[a]
+                if not done[w] and (seen[w] is None or vw_dist<seen[w]):
+                    seen[w]=vw_dist
+                    push(Q,(vw_dist,v,w))
+                    sigma[w]=0.0
+                    pred[in_ptr[w]]=v
+                    pred_count[w]=1
+                elif vw_dist==seen[w]: # handle equal paths
+                    sigma[w]+=sigma[v]
+                    pred[in_ptr[w]+pred_count[w]]=v
+                    pred_count[w]+=1
+        for w in reversed(S):
+            coeff=(1.0+delta[w])/sigma[w]
+            base=in_ptr[w]
+            for i in range(base,base+pred_count[w]):
+                v=pred[i]
+                delta[v]+=sigma[v]*coeff
+        result=np.array([delta[v] for v in S])
+        distance=np.array([seen[v] for v in S],dtype=float)
+        for v in S:
+            sigma[v]=0.0
+            delta[v]=0.0
+            seen[v]=None
+            done[v]=False
+            pred_count[v]=0
+        return np.array(S,dtype=np.int_),result,distance
+    return kernel
+
+# state of a worker process, set once by _init_worker so that the graph
+# is not sent again with every chunk of sources
+_worker_graph=None
+_worker_args=None
+
+def _init_worker(G,func,args):
+    global _worker_graph,_worker_args
+    _worker_graph=G
+    _worker_args=(func,args)
+
+def _run_worker(sources):
+    func,args=_worker_args
+    return func(_worker_graph,sources,*args)
+
+def _parallel_sources(G,sources,processes,func,*args):
+    # split sources into chunks, accumulate each chunk with
+    # func(G,chunk,*args) in a pool of worker processes and sum the
+    # partial results
+    from multiprocessing import Pool
+    sources=list(sources)
+    # a few chunks per process balance sources with unequal work
+    num_chunks=min(len(sources),4*processes)
+    chunks=[sources[i::num_chunks] for i in range(num_chunks)]
+    pool=Pool(processes,_init_worker,(G,func,args))
+    try:
+        partials=pool.map(_run_worker,chunks)
+    finally:
+        pool.close()
+        pool.join()
+    if not partials:
+        return func(G,[],*args)
+    betweenness=partials[0]
+    for partial in partials[1:]:
+        for v,value in partial.items():
+            betweenness[v]+=value
+    return betweenness
+
 def _single_source_shortest_path_basic(G,s):
     S=[]
     P={}
@@ -317,7 +628,7 @@ def _rescale(betweenness,n,normalized,directed=False,k=None):
             betweenness[v] *= scale
     return betweenness
 
-def _rescale_e(betweenness,n,normalized,directed=False):
+def _rescale_e(betweenness,n,normalized,directed=False,k=None):
     if normalized is True:
         if n <=1:
             scale=None  # no normalization b=0 for all nodes
@@ -329,6 +640,8 @@ def _rescale_e(betweenness,n,normalized,directed=False):
         else:
             scale=None
     if scale is not None:
+        if k is not None:
+            scale=scale*n/k
         for v in betweenness:
             betweenness[v] *= scale
     return betweenness
@@ -0,0 +1,255 @@
+"""
+Approximate betweenness centrality by adaptive source sampling.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import math
+import random
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import \
+    _brandes_bfs_arrays, _brandes_dijkstra_arrays
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+
+__all__ = ['approximate_betweenness_centrality',
+           'top_betweenness_centrality']
+
+def approximate_betweenness_centrality(G, epsilon=0.01, delta=0.1,
+                                       normalized=True, weight=None,
+                                       seed=None, max_samples=None):
+    r"""Estimate the shortest-path betweenness centrality for nodes
+    to a given accuracy.
+
+    Shortest paths are computed from randomly sampled source nodes in
+    batches of doubling size until, with probability at least `1-delta`,
+    the normalized betweenness of every node is within `epsilon` of the
+    estimate.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    epsilon : float, optional (default=0.01)
+      Maximal absolute error of the normalized betweenness values.
+
+    delta : float, optional (default=0.1)
+      Maximal probability that any estimate is off by more than epsilon.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized as in
+      betweenness_centrality(). Epsilon always refers to the
+      normalized values.
+
+    weight : None or string, optional
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    seed : hashable, optional (default=None)
+      Seed of the random number generator used to sample sources.
+
+    max_samples : int, optional (default=None)
+      Stop after this many sources even if the accuracy is not reached.
+      If None, at most all n nodes are used, which gives the exact values.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with estimated betweenness centrality as value.
+
+    See Also
+    --------
+    betweenness_centrality
+    top_betweenness_centrality
+
+    Notes
+    -----
+    The normalized betweenness of `v` is the mean over all sources `s` of
+    `n\delta_s(v)/((n-1)(n-2))` where `\delta_s(v)` is the dependency of
+    `s` on `v` computed by Brandes' algorithm [1]_, so sampling sources
+    gives an unbiased estimate [2]_. After each batch the error of every
+    node is bounded with the empirical Bernstein inequality [3]_, with a
+    union bound over all nodes and batches. Nodes with small variance,
+    typically most of them, need far fewer samples than the worst-case
+    Hoeffding bound suggests.
+
+    References
+    ----------
+    .. [1]  A Faster Algorithm for Betweenness Centrality.
+       Ulrik Brandes,
+       Journal of Mathematical Sociology 25(2):163-177, 2001.
+    .. [2] Ulrik Brandes and Christian Pich:
+       Centrality Estimation in Large Networks.
+       International Journal of Bifurcation and Chaos 17(7):2303-2318, 2007.
+    .. [3] Andreas Maurer and Massimiliano Pontil:
+       Empirical Bernstein Bounds and Sample Variance Penalization.
+       Proceedings of COLT 2009.
+    """
+    def converged(mean, bound):
+        return bound.max() <= epsilon
+    nodelist, mean, bound = _adaptive_sampling(G, delta, weight, seed,
+                                               max_samples, converged)
+    return _scale(G, dict(zip(nodelist, mean.tolist())), normalized)
+
+
+def top_betweenness_centrality(G, top, epsilon=0.0, delta=0.1,
+                               normalized=True, weight=None, seed=None,
+                               max_samples=None):
+    r"""Find the nodes with the highest shortest-path betweenness
+    centrality.
+
+    Sources are sampled as in approximate_betweenness_centrality() but
+    sampling stops as soon as the `top` most central nodes are separated
+    from all other nodes, so only the ranking at the top is guaranteed.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    top : int
+      The number of nodes to return.
+
+    epsilon : float, optional (default=0.0)
+      Tolerance of the normalized betweenness: a node within epsilon of
+      the smallest value in the top set may be exchanged for it. With
+      epsilon=0 ties at the boundary are resolved exactly, which may
+      require all nodes as sources.
+
+    delta : float, optional (default=0.1)
+      Maximal probability that the returned set is wrong.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized as in
+      betweenness_centrality().
+
+    weight : None or string, optional
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    seed : hashable, optional (default=None)
+      Seed of the random number generator used to sample sources.
+
+    max_samples : int, optional (default=None)
+      Stop after this many sources even if the top nodes are not
+      separated.
+
+    Returns
+    -------
+    nodes : list
+       List of (node, estimated betweenness) pairs of the top nodes in
+       order of decreasing betweenness.
+
+    Examples
+    --------
+    >>> G = nx.barabasi_albert_graph(100, 2, seed=1)
+    >>> hubs = nx.top_betweenness_centrality(G, len(G)//100 + 1, seed=1)
+
+    See Also
+    --------
+    approximate_betweenness_centrality
+    betweenness_centrality
+    """
+    if top < 0:
+        raise nx.NetworkXError("top must be non-negative.")
+    import numpy as np
+    def converged(mean, bound):
+        if top == 0 or top >= len(mean):
+            return True
+        order = np.argsort(-mean)
+        lower = (mean - bound)[order[:top]].min()
+        upper = (mean + bound)[order[top:]].max()
+        return lower + epsilon >= upper
+    nodelist, mean, bound = _adaptive_sampling(G, delta, weight, seed,
+                                               max_samples, converged)
+    betweenness = _scale(G, dict(zip(nodelist, mean.tolist())), normalized)
+    ranked = sorted(betweenness.items(), key=lambda x: -x[1])
+    return ranked[:top]
+
+
+def _adaptive_sampling(G, delta, weight, seed, max_samples, converged):
+    # Sample sources without replacement in batches of doubling size until
+    # converged(mean, bound) holds. Returns the nodes, the mean normalized
+    # dependencies and their error bounds as arrays.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Adaptive betweenness requires NumPy: "
+                          "http://scipy.org/")
+    if not 0 < delta <= 1:
+        raise nx.NetworkXError("delta must be in (0, 1].")
+    if max_samples is not None and max_samples < 1:
+        raise nx.NetworkXError("max_samples must be at least 1.")
+    nodelist, indptr, indices, weights = nx.csr_arrays(G, weight)
+    n = len(nodelist)
+    if n <= 2: # every betweenness is 0
+        return nodelist, np.zeros(n), np.zeros(n)
+    if weight is None:
+        kernel = _brandes_bfs_arrays(indptr, indices)
+    else:
+        kernel = _brandes_dijkstra_arrays(indptr, indices, weights)
+    if max_samples is None or max_samples > n:
+        max_samples = n
+    # dependencies are scaled to samples in [0, r] with mean equal to the
+    # normalized betweenness
+    scale = n/((n-1.0)*(n-2.0))
+    r = scale*(n-2)
+    checkpoints = []
+    k = min(max_samples, 16)
+    while k < max_samples:
+        checkpoints.append(k)
+        k *= 2
+    checkpoints.append(max_samples)
+    log_term = math.log(4.0*n*len(checkpoints)/delta)
+
+    random.seed(seed)
+    sources = list(range(n))
+    random.shuffle(sources)
+    total = np.zeros(n)
+    total_sq = np.zeros(n)
+    k = 0
+    for checkpoint in checkpoints:
+        while k < checkpoint:
+            visited, dependency, distance = kernel(sources[k])
+            x = scale*dependency[1:]
+            total[visited[1:]] += x
+            total_sq[visited[1:]] += x*x
+            k += 1
+        mean = total/k
+        if k == n: # all sources used, the values are exact
+            bound = np.zeros(n)
+        elif k == 1:
+            bound = np.empty(n)
+            bound.fill(r)
+        else:
+            variance = np.maximum(total_sq - k*mean*mean, 0.0)/(k-1)
+            bound = (np.sqrt(2.0*variance*log_term/k)
+                     + 7.0*r*log_term/(3.0*(k-1)))
+        if converged(mean, bound):
+            break
+    return nodelist, mean, bound
+
+
+def _scale(G, betweenness, normalized):
+    # convert normalized betweenness to the unnormalized values of
+    # betweenness_centrality()
+    if normalized:
+        return betweenness
+    n = len(G)
+    scale = (n-1.0)*(n-2.0)
+    if not G.is_directed():
+        scale = scale/2.0
+    for v in betweenness:
+        betweenness[v] *= scale
+    return betweenness
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
@@ -0,0 +1,298 @@
+"""
+Betweenness and closeness centrality of a changing graph.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import \
+    _brandes_bfs_arrays, _brandes_dijkstra_arrays, _rescale
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+
+__all__ = ['DynamicCentrality']
+
+class DynamicCentrality(object):
+    """Maintain betweenness and closeness centrality of a graph under
+    edge insertions, deletions and reweighting.
+
+    The distances between all pairs of nodes are kept. When an edge
+    changes, only the sources for which the edge is or becomes part of
+    a shortest path are affected; their contributions to betweenness
+    are recomputed with Brandes' algorithm on the graph before and after
+    the change, and their rows of the distance matrix are replaced.
+    All other contributions remain valid.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph or digraph. It is copied; later changes must be
+      made through this object.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+      The same weights are used as distances for closeness.
+
+    threshold : float, optional (default=0.5)
+      If a change affects more than this fraction of the sources, the
+      centralities are recomputed from scratch, which is cheaper since
+      updating a source takes two shortest path searches.
+
+    Attributes
+    ----------
+    G : graph
+      The current graph. Do not modify it directly.
+
+    updated_sources : int
+      Number of sources recomputed by incremental updates so far.
+
+    full_updates : int
+      Number of complete recomputations, including the initial one.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> dc = nx.DynamicCentrality(G)
+    >>> dc.betweenness()[1]
+    0.6666666666666666
+    >>> dc.add_edge(0, 3)
+    >>> dc.betweenness()[1]
+    0.16666666666666666
+    >>> dc.closeness()[0]
+    0.75
+
+    Notes
+    -----
+    The distance matrix needs 8n^2 bytes of memory.
+
+    See Also
+    --------
+    betweenness_centrality
+    closeness_centrality
+    """
+    def __init__(self, G, weight=None, threshold=0.5):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "DynamicCentrality requires NumPy: http://scipy.org/")
+        if G.is_multigraph():
+            raise nx.NetworkXError("DynamicCentrality does not support "
+                                   "multigraphs.")
+        self.G = G.copy()
+        self.weight = weight
+        self.threshold = threshold
+        self.updated_sources = 0
+        self.full_updates = 0
+        self.recompute()
+
+    def recompute(self):
+        """Recompute all centralities from scratch."""
+        import numpy as np
+        self._nodelist = list(self.G)
+        self._index = dict((v, i) for i, v in enumerate(self._nodelist))
+        n = len(self._nodelist)
+        self._dist = np.empty((n, n))
+        self._dist.fill(np.inf)
+        self._betweenness = np.zeros(n)
+        self._kernel = None
+        kernel = self._get_kernel()
+        for s in range(n):
+            visited, delta, distance = kernel(s)
+            self._betweenness[visited[1:]] += delta[1:]
+            self._dist[s, visited] = distance
+        self.full_updates += 1
+
+    def _get_kernel(self):
+        # Brandes kernel on the current graph, rebuilt after each change
+        if self._kernel is None:
+            nodelist, indptr, indices, weights = nx.csr_arrays(
+                self.G, self.weight, self._nodelist)
+            if self.weight is None:
+                self._kernel = _brandes_bfs_arrays(indptr, indices)
+            else:
+                self._kernel = _brandes_dijkstra_arrays(indptr, indices,
+                                                        weights)
+        return self._kernel
+
+    def _edge_weight(self, data):
+        if self.weight is None:
+            return 1
+        return data.get(self.weight, 1)
+
+    def _affected(self, u, v, w):
+        # sources s for which an edge (u,v) of weight w is on a shortest
+        # path, i.e. d(s,u) + w <= d(s,v)
+        import numpy as np
+        d = self._dist
+        i, j = self._index[u], self._index[v]
+        def tight(i, j):
+            du, dv = d[:, i], d[:, j]
+            tol = 1e-9*np.maximum(1.0, np.abs(dv))
+            return np.isfinite(du) & (du + w <= dv + tol)
+        mask = tight(i, j)
+        if not self.G.is_directed():
+            mask |= tight(j, i)
+        return mask
+
+    def _change_edge(self, u, v, old, new, change):
+        # Apply change() to the graph, where the weight of edge (u,v)
+        # changes from old to new (None for a missing edge).
+        import numpy as np
+        mask = np.zeros(len(self._nodelist), dtype=bool)
+        if u != v:
+            if old is not None:
+                mask |= self._affected(u, v, old)
+            if new is not None:
+                mask |= self._affected(u, v, new)
+        sources = np.flatnonzero(mask)
+        if len(sources) > self.threshold*len(self._nodelist):
+            change()
+            self.recompute()
+            return
+        if len(sources) > 0:
+            kernel = self._get_kernel()
+            for s in sources:
+                visited, delta, distance = kernel(s)
+                self._betweenness[visited[1:]] -= delta[1:]
+        change()
+        self._kernel = None
+        if len(sources) > 0:
+            kernel = self._get_kernel()
+            for s in sources:
+                visited, delta, distance = kernel(s)
+                self._betweenness[visited[1:]] += delta[1:]
+                self._dist[s].fill(np.inf)
+                self._dist[s, visited] = distance
+            self.updated_sources += len(sources)
+
+    def add_node(self, n, attr_dict=None, **attr):
+        """Add an isolated node n, see Graph.add_node()."""
+        import numpy as np
+        self.G.add_node(n, attr_dict, **attr)
+        if n in self._index:
+            return
+        self._index[n] = len(self._nodelist)
+        self._nodelist.append(n)
+        num = len(self._nodelist)
+        dist = np.empty((num, num))
+        dist.fill(np.inf)
+        dist[:-1, :-1] = self._dist
+        dist[-1, -1] = 0.0
+        self._dist = dist
+        self._betweenness = np.append(self._betweenness, 0.0)
+        self._kernel = None
+
+    def remove_node(self, n):
+        """Remove node n and its edges, see Graph.remove_node()."""
+        import numpy as np
+        if n not in self._index:
+            raise nx.NetworkXError("The node %s is not in the graph."%(n,))
+        if self.G.is_directed():
+            edges = self.G.in_edges(n) + self.G.out_edges(n)
+        else:
+            edges = self.G.edges(n)
+        self.remove_edges_from(set(edges))
+        # n is now isolated: it is on no shortest path and reaches no node
+        i = self._index.pop(n)
+        self.G.remove_node(n)
+        del self._nodelist[i]
+        self._index = dict((v, j) for j, v in enumerate(self._nodelist))
+        self._dist = np.delete(np.delete(self._dist, i, 0), i, 1)
+        self._betweenness = np.delete(self._betweenness, i)
+        self._kernel = None
+
+    def add_edge(self, u, v, attr_dict=None, **attr):
+        """Add or update the edge (u,v), see Graph.add_edge().
+
+        Changing the weight attribute of an existing edge updates the
+        centralities.
+        """
+        for n in (u, v):
+            if n not in self._index:
+                self.add_node(n)
+        data = {}
+        if self.G.has_edge(u, v):
+            old = self._edge_weight(self.G[u][v])
+            data.update(self.G[u][v])
+        else:
+            old = None
+        if attr_dict is not None:
+            data.update(attr_dict)
+        data.update(attr)
+        new = self._edge_weight(data)
+        if old == new:
+            self.G.add_edge(u, v, attr_dict, **attr)
+            return
+        self._change_edge(u, v, old, new,
+                          lambda: self.G.add_edge(u, v, attr_dict, **attr))
+
+    def add_edges_from(self, ebunch, attr_dict=None, **attr):
+        """Add or update all edges in ebunch, see Graph.add_edges_from()."""
+        for e in ebunch:
+            if len(e) == 3:
+                u, v, d = e
+                data = {}
+                if attr_dict is not None:
+                    data.update(attr_dict)
+                data.update(d)
+            else:
+                u, v = e
+                data = attr_dict
+            self.add_edge(u, v, data, **attr)
+
+    def remove_edge(self, u, v):
+        """Remove the edge (u,v), see Graph.remove_edge()."""
+        if not self.G.has_edge(u, v):
+            raise nx.NetworkXError("The edge %s-%s is not in the graph."%(u,v))
+        old = self._edge_weight(self.G[u][v])
+        self._change_edge(u, v, old, None,
+                          lambda: self.G.remove_edge(u, v))
+
+    def remove_edges_from(self, ebunch):
+        """Remove all edges in ebunch that are in the graph."""
+        for e in ebunch:
+            u, v = e[:2]
+            if self.G.has_edge(u, v):
+                self.remove_edge(u, v)
+
+    def betweenness(self, normalized=True):
+        """Return the betweenness centrality of the current graph.
+
+        The values are those of betweenness_centrality(G, weight=weight,
+        normalized=normalized) up to floating point rounding.
+        """
+        betweenness = dict(zip(self._nodelist, self._betweenness.tolist()))
+        return _rescale(betweenness, len(self._nodelist),
+                        normalized=normalized,
+                        directed=self.G.is_directed())
+
+    def closeness(self, normalized=True):
+        """Return the closeness centrality of the current graph.
+
+        The values are those of closeness_centrality(G, distance=weight,
+        normalized=normalized) up to floating point rounding.
+        """
+        import numpy as np
+        n = len(self._nodelist)
+        finite = np.isfinite(self._dist)
+        reached = finite.sum(axis=1) - 1.0
+        total = np.where(finite, self._dist, 0.0).sum(axis=1)
+        closeness = np.zeros(n)
+        if n > 1:
+            positive = total > 0
+            closeness[positive] = reached[positive]/total[positive]
+            if normalized:
+                closeness *= reached/(n - 1)
+        return dict(zip(self._nodelist, closeness.tolist()))
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
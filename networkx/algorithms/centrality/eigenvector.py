@@ -12,7 +12,8 @@ __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Pieter Swart (swart@lanl.gov)',
                         'Sasha Gutfraind (ag362@cornell.edu)'])
 __all__ = ['eigenvector_centrality',
-           'eigenvector_centrality_numpy']
+           'eigenvector_centrality_numpy',
+           'eigenvector_centrality_scipy']
 
 def eigenvector_centrality(G,max_iter=100,tol=1.0e-6,nstart=None):
     """Compute the eigenvector centrality for the graph G.
@@ -159,6 +160,63 @@ def eigenvector_centrality_numpy(G):
     return centrality
 
 
+def eigenvector_centrality_scipy(G,max_iter=100,tol=1.0e-6,nstart=None,
+                                 weight='weight'):
+    """Compute the eigenvector centrality for the graph G with SciPy
+    sparse matrices.
+
+    This computes the same values as eigenvector_centrality() with the
+    power iteration of PowerIterationEngine. For CSRGraph and CSRDiGraph
+    the sparse matrix is built only once per graph.
+
+    Parameters
+    ----------
+    G : graph
+      A networkx graph 
+
+    max_iter : interger, optional
+      Maximum number of iterations in power method.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method iteration.
+
+    nstart : dictionary, optional
+      Starting value of eigenvector iteration for each node, e.g. the
+      result of a previous call.
+
+    weight : key, optional (default='weight')
+      Edge data key to use as weight. If None all weights are 1.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with eigenvector centrality as the value.
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> centrality=nx.eigenvector_centrality_scipy(G)
+    >>> print(['%s %0.2f'%(node,centrality[node]) for node in centrality])
+    ['0 0.37', '1 0.60', '2 0.60', '3 0.37']
+
+    See Also
+    --------
+    eigenvector_centrality
+    eigenvector_centrality_numpy
+    PowerIterationEngine
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError('Requires SciPy: http://scipy.org/')
+
+    if G.is_multigraph():
+        raise nx.NetworkXException('Not defined for multigraphs.')
+    from networkx.algorithms.link_analysis.power_iteration import _get_engine
+    return _get_engine(G, weight).eigenvector(max_iter=max_iter, tol=tol,
+                                              nstart=nstart)
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -167,3 +225,7 @@ def setup_module(module):
         import numpy.linalg
     except:
         raise SkipTest("numpy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("scipy not available")
@@ -15,7 +15,8 @@ __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Vincent Gauthier (vgauthier@luxbulb.org)'])
 
 __all__ = ['katz_centrality',
-           'katz_centrality_numpy']
+           'katz_centrality_numpy',
+           'katz_centrality_scipy']
 
 @not_implemented_for('multigraph')
 def katz_centrality(G, alpha=0.1, beta=1.0,
@@ -286,6 +287,77 @@ def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True):
     return centrality
 
 
+@not_implemented_for('multigraph')
+def katz_centrality_scipy(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
+                          nstart=None, normalized=True, weight='weight'):
+    r"""Compute the Katz centrality for the nodes of the graph G with
+    SciPy sparse matrices.
+
+    This computes the same values as katz_centrality() with the power
+    iteration of PowerIterationEngine. For CSRGraph and CSRDiGraph the
+    sparse matrix is built only once per graph.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    alpha : float
+      Attenuation factor
+
+    beta : scalar or dictionary, optional (default=1.0)
+      Weight attributed to the immediate neighborhood. If not a scalar the
+      dictionary must have an value for every node.
+
+    max_iter : integer, optional (default=1000)
+      Maximum number of iterations in power method.
+
+    tol : float, optional (default=1.0e-6)
+      Error tolerance used to check convergence in power method iteration.
+
+    nstart : dictionary, optional
+      Starting value of Katz iteration for each node, e.g. the
+      unnormalized result of a previous call.
+
+    normalized : bool, optional (default=True)
+      If True normalize the resulting values.
+
+    weight : key, optional (default='weight')
+      Edge data key to use as weight. If None all weights are 1.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with Katz centrality as the value.
+
+    Examples
+    --------
+    >>> import math
+    >>> G = nx.path_graph(4)
+    >>> phi = (1+math.sqrt(5))/2.0 # largest eigenvalue of adj matrix
+    >>> centrality = nx.katz_centrality_scipy(G,1/phi-0.01)
+    >>> for n,c in sorted(centrality.items()):
+    ...    print("%d %0.2f"%(n,c))
+    0 0.37
+    1 0.60
+    2 0.60
+    3 0.37
+
+    See Also
+    --------
+    katz_centrality
+    katz_centrality_numpy
+    PowerIterationEngine
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError('Requires SciPy: http://scipy.org/')
+    from networkx.algorithms.link_analysis.power_iteration import _get_engine
+    return _get_engine(G, weight).katz(alpha=alpha, beta=beta,
+                                       max_iter=max_iter, tol=tol,
+                                       nstart=nstart, normalized=normalized)
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
@@ -294,3 +366,7 @@ def setup_module(module):
         import numpy.linalg
     except:
         raise SkipTest("numpy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("scipy not available")
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+from nose import SkipTest
 from nose.tools import *
 import networkx as nx
 
@@ -460,3 +461,101 @@ class TestWeightedEdgeBetweennessCentrality(object):
         for n in sorted(G.edges()):
             assert_almost_equal(b[n],b_answer[n]/norm)
 
+
+
+class TestParallelBetweennessCentrality(object):
+
+    def test_betweenness(self):
+        G=nx.krackhardt_kite_graph()
+        b=nx.betweenness_centrality(G,processes=2)
+        b_answer=nx.betweenness_centrality(G)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_weighted_endpoints(self):
+        G=nx.gnp_random_graph(30,0.2,seed=1,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%3+1
+        b=nx.betweenness_centrality(G,weight='weight',endpoints=True,
+                                    processes=3)
+        b_answer=nx.betweenness_centrality(G,weight='weight',endpoints=True)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_k_sample(self):
+        G=nx.florentine_families_graph()
+        b=nx.betweenness_centrality(G,k=5,seed=3,processes=2)
+        b_answer=nx.betweenness_centrality(G,k=5,seed=3)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_more_processes_than_sources(self):
+        G=nx.path_graph(3)
+        b=nx.betweenness_centrality(G,normalized=False,processes=8)
+        assert_equal(b,{0:0.0,1:1.0,2:0.0})
+
+    def test_edge_betweenness(self):
+        G=nx.ladder_graph(5)
+        b=nx.edge_betweenness_centrality(G,processes=2)
+        b_answer=nx.edge_betweenness_centrality(G)
+        for e in sorted(G.edges()):
+            assert_almost_equal(b[e],b_answer[e])
+
+    def test_edge_betweenness_k_sample(self):
+        G=nx.balanced_tree(r=2,h=3)
+        b=nx.edge_betweenness_centrality(G,k=len(G),seed=1)
+        b_answer=nx.edge_betweenness_centrality(G)
+        for e in sorted(G.edges()):
+            assert_almost_equal(b[e],b_answer[e])
+        b=nx.edge_betweenness_centrality(G,k=4,seed=1,processes=2)
+        b_answer=nx.edge_betweenness_centrality(G,k=4,seed=1)
+        for e in sorted(G.edges()):
+            assert_almost_equal(b[e],b_answer[e])
+
+
+class TestBetweennessCentralityNumpy(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def check(self, G, **kwds):
+        b=nx.betweenness_centrality_numpy(G,**kwds)
+        b_answer=nx.betweenness_centrality(G,**kwds)
+        assert_equal(sorted(b),sorted(b_answer))
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_krackhardt_kite_graph(self):
+        G=nx.krackhardt_kite_graph()
+        self.check(G)
+        self.check(G,normalized=False)
+        self.check(G,endpoints=True)
+
+    def test_disconnected_directed(self):
+        G=nx.gnp_random_graph(40,0.05,seed=2,directed=True)
+        G.add_edge(3,3)
+        self.check(G)
+        self.check(G,endpoints=True)
+        self.check(nx.CSRDiGraph(G))
+
+    def test_weighted(self):
+        G=nx.ladder_graph(6)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%3+1
+        self.check(G,weight='weight')
+        self.check(G,weight='weight',endpoints=True)
+        self.check(nx.CSRGraph(G),weight='weight')
+        self.check(G.to_directed(),weight='weight')
+
+    def test_k_sample(self):
+        G=nx.florentine_families_graph()
+        self.check(G,k=5,seed=3)
+        self.check(G,k=5,seed=3,processes=2)
+
+    def test_empty(self):
+        self.check(nx.Graph())
+        self.check(nx.empty_graph(3))
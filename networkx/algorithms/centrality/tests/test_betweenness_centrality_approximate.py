@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+class TestApproximateBetweennessCentrality(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_exact_with_all_samples(self):
+        G=nx.krackhardt_kite_graph()
+        b=nx.approximate_betweenness_centrality(G,epsilon=0.0,seed=1)
+        b_answer=nx.betweenness_centrality(G)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+        b=nx.approximate_betweenness_centrality(G,epsilon=0.0,seed=1,
+                                                normalized=False)
+        b_answer=nx.betweenness_centrality(G,normalized=False)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_weighted_directed(self):
+        G=nx.gnp_random_graph(30,0.1,seed=3,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%4+1
+        b=nx.approximate_betweenness_centrality(G,epsilon=0.0,
+                                                weight='weight')
+        b_answer=nx.betweenness_centrality(G,weight='weight')
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_accuracy(self):
+        G=nx.barabasi_albert_graph(2000,2,seed=1)
+        b=nx.approximate_betweenness_centrality(G,epsilon=0.05,delta=0.1,
+                                                seed=1)
+        b_answer=nx.betweenness_centrality_numpy(G)
+        assert_true(max(abs(b[n]-b_answer[n]) for n in G) <= 0.05)
+
+    def test_max_samples(self):
+        G=nx.path_graph(50)
+        b=nx.approximate_betweenness_centrality(G,epsilon=0.0,seed=1,
+                                                max_samples=10)
+        assert_equal(sorted(b),sorted(G))
+        for max_samples in (0,-1):
+            assert_raises(nx.NetworkXError,
+                          nx.approximate_betweenness_centrality,G,
+                          max_samples=max_samples)
+            assert_raises(nx.NetworkXError,nx.top_betweenness_centrality,
+                          G,2,max_samples=max_samples)
+
+    def test_delta(self):
+        G=nx.path_graph(10)
+        for delta in (0,-0.1,1.5):
+            assert_raises(nx.NetworkXError,
+                          nx.approximate_betweenness_centrality,G,
+                          delta=delta)
+
+    def test_small(self):
+        assert_equal(nx.approximate_betweenness_centrality(nx.Graph()),{})
+        assert_equal(nx.approximate_betweenness_centrality(nx.path_graph(2)),
+                     {0:0.0,1:0.0})
+
+    def test_top(self):
+        G=nx.barabasi_albert_graph(500,2,seed=2)
+        b_answer=nx.betweenness_centrality(G)
+        top=nx.top_betweenness_centrality(G,5,seed=1)
+        assert_equal(len(top),5)
+        assert_equal([n for n,b in top],
+                     sorted(G,key=lambda n:-b_answer[n])[:5])
+        values=[b for n,b in top]
+        assert_equal(values,sorted(values,reverse=True))
+
+    def test_top_all(self):
+        G=nx.star_graph(4)
+        assert_equal(nx.top_betweenness_centrality(G,1),[(0,1.0)])
+        assert_equal(len(nx.top_betweenness_centrality(G,10)),5)
+        assert_equal(nx.top_betweenness_centrality(G,0),[])
+        assert_raises(nx.NetworkXError,nx.top_betweenness_centrality,G,-1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+import random
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+class TestDynamicCentrality(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def check(self, dc):
+        G=dc.G
+        weight=dc.weight
+        for normalized in [True,False]:
+            b=dc.betweenness(normalized=normalized)
+            b_answer=nx.betweenness_centrality(G,weight=weight,
+                                               normalized=normalized)
+            assert_equal(sorted(b),sorted(b_answer))
+            for n in sorted(G):
+                assert_almost_equal(b[n],b_answer[n])
+            c=dc.closeness(normalized=normalized)
+            c_answer=nx.closeness_centrality(G,distance=weight,
+                                             normalized=normalized)
+            for n in sorted(G):
+                assert_almost_equal(c[n],c_answer[n])
+
+    def test_path(self):
+        dc=nx.DynamicCentrality(nx.path_graph(6),threshold=1.0)
+        self.check(dc)
+        dc.add_edge(0,5)
+        self.check(dc)
+        dc.remove_edge(2,3)
+        self.check(dc)
+        assert_equal(dc.full_updates,1)
+        assert_true(dc.updated_sources>0)
+
+    def test_unaffected(self):
+        G=nx.path_graph(4)
+        G.add_edge(10,11)
+        dc=nx.DynamicCentrality(G,threshold=1.0)
+        dc.add_edge(11,12)
+        assert_equal(dc.updated_sources,3)
+        self.check(dc)
+
+    def test_reweight(self):
+        G=nx.cycle_graph(6)
+        dc=nx.DynamicCentrality(G,weight='weight',threshold=1.0)
+        dc.add_edge(0,1,weight=5)
+        self.check(dc)
+        dc.add_edge(0,1,color='red')
+        self.check(dc)
+        dc.add_edges_from([(2,3,{'weight':0.5}),(3,4)],weight=2)
+        self.check(dc)
+
+    def test_threshold(self):
+        dc=nx.DynamicCentrality(nx.path_graph(6),threshold=0.0)
+        dc.add_edge(0,5)
+        assert_equal(dc.full_updates,2)
+        assert_equal(dc.updated_sources,0)
+        self.check(dc)
+
+    def test_nodes(self):
+        dc=nx.DynamicCentrality(nx.star_graph(4))
+        dc.add_edge(4,'a')
+        self.check(dc)
+        dc.remove_node(0)
+        self.check(dc)
+        dc.add_node('b')
+        self.check(dc)
+        assert_raises(nx.NetworkXError,dc.remove_node,0)
+        assert_raises(nx.NetworkXError,dc.remove_edge,1,2)
+
+    def test_random_changes(self):
+        rng=random.Random(1)
+        for directed in [False,True]:
+            G=nx.gnp_random_graph(25,0.1,seed=2,directed=directed)
+            for u,v in G.edges():
+                G[u][v]['weight']=rng.choice([1,2,3])
+            dc=nx.DynamicCentrality(G,weight='weight')
+            for i in range(15):
+                u,v=rng.choice(dc.G.edges())
+                dc.remove_edge(u,v)
+                dc.add_edge(rng.randrange(25),rng.randrange(25),
+                            weight=rng.choice([1,2,3]))
+                self.check(dc)
+
+    def test_multigraph(self):
+        assert_raises(nx.NetworkXError,nx.DynamicCentrality,nx.MultiGraph())
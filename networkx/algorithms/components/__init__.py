@@ -3,3 +3,5 @@ from networkx.algorithms.components.strongly_connected import *
 from networkx.algorithms.components.weakly_connected import *
 from networkx.algorithms.components.attracting import *
 from networkx.algorithms.components.biconnected import *
+from networkx.algorithms.components.streaming import *
+from networkx.algorithms.components.dynamic import *
@@ -9,6 +9,7 @@ Attracting components.
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.algorithms.components.strongly_connected import _scc_labels
 __authors__ = "\n".join(['Christopher Ellison'])
 __all__ = ['number_attracting_components', 
            'attracting_components',
@@ -45,9 +46,21 @@ def attracting_components(G):
     attracting_component_subgraphs
 
     """
-    scc = nx.strongly_connected_components(G)
-    cG = nx.condensation(G, scc)
-    attractors = [scc[n] for n in cG if cG.out_degree(n) == 0]
+    if not G.is_directed():
+        raise nx.NetworkXError("""Not allowed for undirected graph G. 
+              Use connected_components() """)
+    nodelist,indptr,indices,scc,labels = _scc_labels(G)
+    # a component is attracting if no edge leaves it
+    leaving = [False]*len(scc)
+    for v in range(len(nodelist)):
+        c = labels[v]
+        if not leaving[c]:
+            for a in range(indptr[v],indptr[v+1]):
+                if labels[indices[a]] != c:
+                    leaving[c] = True
+                    break
+    attractors = [[nodelist[v] for v in scc[c]]
+                  for c in range(len(scc)) if not leaving[c]]
     attractors.sort(key=len,reverse=True)
     return attractors
 
@@ -46,12 +46,12 @@ def connected_components(G):
     if G.is_directed():
         raise nx.NetworkXError("""Not allowed for directed graph G.
               Use UG=G.to_undirected() to create an undirected graph.""")
-    seen={}
+    seen=set()
     components=[]
     for v in G:      
         if v not in seen:
-            c=nx.single_source_shortest_path_length(G,v)
-            components.append(list(c.keys()))
+            c=_plain_bfs(G,v)
+            components.append(c)
             seen.update(c)
     components.sort(key=len,reverse=True)            
     return components            
@@ -117,8 +117,7 @@ Use UG=G.to_undirected() to create an undirected graph.""")
         raise nx.NetworkXPointlessConcept(
             """Connectivity is undefined for the null graph.""")
 
-    return len(nx.single_source_shortest_path_length(G,
-                                              next(G.nodes_iter())))==len(G)
+    return len(_plain_bfs(G,next(G.nodes_iter())))==len(G)
 
 
 def connected_component_subgraphs(G):
@@ -187,6 +186,19 @@ def node_connected_component(G,n):
     if G.is_directed():
         raise nx.NetworkXError("""Not allowed for directed graph G.
               Use UG=G.to_undirected() to create an undirected graph.""")
-    return list(nx.single_source_shortest_path_length(G,n).keys())
-
-        
+    return _plain_bfs(G,n)
+
+
+def _plain_bfs(G, source):
+    """Return the list of nodes reachable from source in breadth-first
+    order, without the distances single_source_shortest_path_length()
+    keeps."""
+    Gadj=G.adj
+    seen=set([source])
+    nodes=[source]
+    for v in nodes: # nodes grows while it is iterated
+        for w in Gadj[v]:
+            if w not in seen:
+                seen.add(w)
+                nodes.append(w)
+    return nodes
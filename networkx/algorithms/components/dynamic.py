@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Connected components maintained under edge and node updates.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+__all__ = ['DynamicComponents']
+
+class DynamicComponents(object):
+    """Connected components of a graph kept up to date as it changes.
+
+    The graph is wrapped and changed through the methods add_node(),
+    add_edge(), remove_edge(), etc. of this class, which call the same
+    methods of the graph and update the components. Queries then take
+    constant time instead of a search of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       Graph to wrap, of any type. The components of directed graphs are
+       the weakly connected components.
+
+    Attributes
+    ----------
+    G : NetworkX graph
+       The wrapped graph. Changes made to G directly instead of through
+       this class are not tracked.
+
+    Examples
+    --------
+    >>> D = nx.DynamicComponents(nx.path_graph(4))
+    >>> D.number_connected_components()
+    1
+    >>> D.remove_edge(1, 2)
+    >>> D.number_connected_components()
+    2
+    >>> sorted(D.node_connected_component(3))
+    [2, 3]
+    >>> D.add_edge(3, 0)
+    >>> D.connected(1, 2)
+    True
+
+    Notes
+    -----
+    Each component has a label and a set of nodes. Adding an edge between
+    two components relabels the nodes of the smaller one, so adding m
+    edges relabels each node at most log(n) times.
+
+    Removing an edge (u, v) inside a component searches the graph from u
+    and from v alternately until the searches meet or one of them is
+    exhausted. In the latter case its nodes are a new component, found in
+    time proportional to the size of the smaller part. Removing a node
+    runs such a search from each of its neighbors.
+
+    See Also
+    --------
+    connected_components
+    weakly_connected_components
+    union_find_components
+    """
+    def __init__(self, G):
+        self.G = G
+        self._label = {}
+        self._members = {}
+        self._next = 0
+        if G.is_directed():
+            components = nx.weakly_connected_components(G)
+        else:
+            components = nx.connected_components(G)
+        for c in components:
+            self._new_component(c)
+
+    def _new_component(self, nodes):
+        # give the nodes a new label
+        c = self._next
+        self._next += 1
+        label = self._label
+        for n in nodes:
+            label[n] = c
+        self._members[c] = set(nodes)
+        return c
+
+    def _neighbors(self, n):
+        G = self.G
+        if G.is_directed():
+            return list(G.succ[n]) + list(G.pred[n])
+        return list(G.adj[n])
+
+    def _add_nodes(self, nodes):
+        for n in nodes:
+            if n not in self._label:
+                self._new_component([n])
+
+    def _union(self, u, v):
+        # merge the components of u and v, relabeling the smaller one
+        label = self._label
+        a, b = label[u], label[v]
+        if a == b:
+            return
+        members = self._members
+        if len(members[a]) < len(members[b]):
+            a, b = b, a
+        for n in members[b]:
+            label[n] = a
+        members[a] |= members.pop(b)
+
+    def _separate(self, sources):
+        # split the component of the nodes in sources, which were
+        # connected, into the components of the graph now. One search
+        # per source expands a node in turn; searches that meet are
+        # merged and a search that is exhausted first is a component.
+        owner = {}
+        seen = []
+        stacks = []
+        for i, s in enumerate(set(sources)):
+            owner[s] = i
+            seen.append(set([s]))
+            stacks.append([s])
+        merged = list(range(len(seen)))
+        def find(i):
+            while merged[i] != i:
+                merged[i] = i = merged[merged[i]]
+            return i
+        live = set(merged)
+        while len(live) > 1:
+            for i in list(live):
+                if i not in live:
+                    continue
+                if not stacks[i]:
+                    live.remove(i)
+                    c = self._label[next(iter(seen[i]))]
+                    self._members[c] -= seen[i]
+                    self._new_component(seen[i])
+                    if len(live) == 1:
+                        break
+                    continue
+                v = stacks[i].pop()
+                for w in self._neighbors(v):
+                    j = owner.get(w)
+                    if j is None:
+                        owner[w] = i
+                        seen[i].add(w)
+                        stacks[i].append(w)
+                        continue
+                    j = find(j)
+                    if j != i: # the searches met, continue as one
+                        if len(seen[i]) < len(seen[j]):
+                            i, j = j, i
+                        merged[j] = i
+                        live.discard(j)
+                        seen[i] |= seen[j]
+                        stacks[i].extend(stacks[j])
+                        seen[j] = stacks[j] = None
+
+    def add_node(self, n, *args, **attr):
+        """Add node n to the graph, see Graph.add_node()."""
+        self.G.add_node(n, *args, **attr)
+        self._add_nodes([n])
+
+    def add_nodes_from(self, nodes, **attr):
+        """Add the nodes to the graph, see Graph.add_nodes_from()."""
+        nodes = list(nodes)
+        self.G.add_nodes_from(nodes, **attr)
+        for i, n in enumerate(nodes):
+            try:
+                n in self._label
+            except TypeError: # (node, attribute dict) tuple
+                nodes[i] = n[0]
+        self._add_nodes(nodes)
+
+    def remove_node(self, n):
+        """Remove node n from the graph, see Graph.remove_node()."""
+        try:
+            nbrs = set(self._neighbors(n))
+        except KeyError:
+            raise nx.NetworkXError("The node %s is not in the graph."%(n,))
+        self.G.remove_node(n)
+        c = self._label.pop(n)
+        self._members[c].discard(n)
+        if not self._members[c]:
+            del self._members[c]
+        nbrs.discard(n)
+        if len(nbrs) > 1:
+            self._separate(nbrs)
+
+    def remove_nodes_from(self, nodes):
+        """Remove the nodes from the graph, see Graph.remove_nodes_from()."""
+        for n in nodes:
+            if n in self._label:
+                self.remove_node(n)
+
+    def add_edge(self, u, v, *args, **attr):
+        """Add an edge between u and v to the graph, see Graph.add_edge()."""
+        self.G.add_edge(u, v, *args, **attr)
+        self._add_nodes([u, v])
+        self._union(u, v)
+
+    def add_edges_from(self, ebunch, *args, **attr):
+        """Add the edges in ebunch to the graph, see Graph.add_edges_from()."""
+        ebunch = list(ebunch)
+        self.G.add_edges_from(ebunch, *args, **attr)
+        for e in ebunch:
+            self._add_nodes(e[:2])
+            self._union(e[0], e[1])
+
+    def remove_edge(self, u, v, *args):
+        """Remove an edge between u and v from the graph, see
+        Graph.remove_edge()."""
+        self.G.remove_edge(u, v, *args)
+        self._disconnect(u, v)
+
+    def remove_edges_from(self, ebunch):
+        """Remove the edges in ebunch from the graph, see
+        Graph.remove_edges_from()."""
+        # the components are updated after each edge, a search for a
+        # split assumes that the rest of the component is still connected
+        for e in ebunch:
+            self.G.remove_edges_from([e])
+            if e[0] in self._label and e[1] in self._label:
+                self._disconnect(e[0], e[1])
+
+    def _disconnect(self, u, v):
+        # update the components after edges between u and v are removed
+        G = self.G
+        if u == v or self._label[u] != self._label[v]:
+            return
+        if G.has_edge(u, v) or (G.is_directed() and G.has_edge(v, u)):
+            return # a parallel or reverse edge remains
+        self._separate([u, v])
+
+    def number_connected_components(self):
+        """Return the number of connected components."""
+        return len(self._members)
+
+    def connected_components(self):
+        """Return the connected components as lists of nodes, ordered from
+        largest to smallest."""
+        components = [list(c) for c in self._members.values()]
+        components.sort(key=len, reverse=True)
+        return components
+
+    def node_connected_component(self, n):
+        """Return the nodes in the component of node n as a list."""
+        try:
+            return list(self._members[self._label[n]])
+        except KeyError:
+            raise nx.NetworkXError("The node %s is not in the graph."%(n,))
+
+    def connected(self, u, v):
+        """Return True if u and v are in the same connected component."""
+        try:
+            return self._label[u] == self._label[v]
+        except KeyError as e:
+            raise nx.NetworkXError("The node %s is not in the graph."
+                                   % (e.args[0],))
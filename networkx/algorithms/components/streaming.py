@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Connected components of a stream of edges by union-find.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.utils import ArrayUnionFind, open_file
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+__all__ = ['union_find_components',
+           'read_edgelist_components']
+
+def union_find_components(edges, nodes=None):
+    """Return the connected components of a graph given by its edges.
+
+    The edges are read once and only a union-find structure over the
+    nodes is kept, so no graph is built and any iterable of edges, for
+    example a generator reading a file, can be used.
+
+    Parameters
+    ----------
+    edges : iterable or NetworkX graph
+       Edges as tuples (u, v) or (u, v, data). If a graph is given its
+       nodes and edges are used, for directed graphs this gives the
+       weakly connected components.
+
+    nodes : iterable, optional
+       Nodes to include, isolated nodes appear only if given here.
+
+    Returns
+    -------
+    comp : list of lists
+       A list of nodes for each component, ordered from largest to
+       smallest.
+
+    Examples
+    --------
+    >>> edges = [(1, 2), (3, 4), (2, 5)]
+    >>> nx.union_find_components(edges, nodes=[6])
+    [[1, 2, 5], [3, 4], [6]]
+
+    See Also
+    --------
+    connected_components
+    weakly_connected_components
+    read_edgelist_components
+    """
+    if isinstance(edges, nx.Graph):
+        if nodes is None:
+            nodes = edges
+        edges = edges.edges_iter()
+    index = {}
+    uf = ArrayUnionFind()
+    if nodes is not None:
+        for v in nodes:
+            if v not in index:
+                index[v] = uf.add()
+    # the union is inlined, this loop runs once per edge
+    parents = uf.parents
+    ranks = uf.ranks
+    for e in edges:
+        u, v = e[0], e[1]
+        i = index.get(u)
+        if i is None:
+            i = index[u] = uf.add()
+        j = index.get(v)
+        if j is None:
+            j = index[v] = uf.add()
+        # find the roots with path halving
+        while parents[i] != i:
+            parents[i] = i = parents[parents[i]]
+        while parents[j] != j:
+            parents[j] = j = parents[parents[j]]
+        if i != j:
+            if ranks[i] < ranks[j]:
+                i, j = j, i
+            parents[j] = i
+            if ranks[i] == ranks[j]:
+                ranks[i] += 1
+            uf.count -= 1
+    labels = [None]*len(index)
+    for v, i in index.items():
+        labels[i] = v
+    components = [[labels[i] for i in s] for s in uf.sets()]
+    components.sort(key=len, reverse=True)
+    return components
+
+
+@open_file(0, mode='rb')
+def read_edgelist_components(path, comments='#', delimiter=None,
+                             nodetype=None, encoding='utf-8'):
+    """Return the connected components of a graph in an edge list file.
+
+    The file is read line by line without building a graph, see
+    union_find_components().
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it must be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, Python type, optional
+       Convert node data from strings to specified type
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+
+    Returns
+    -------
+    comp : list of lists
+       A list of nodes for each component, ordered from largest to
+       smallest.
+
+    Examples
+    --------
+    >>> nx.write_edgelist(nx.path_graph(4), "test.edgelist")
+    >>> nx.read_edgelist_components("test.edgelist", nodetype=int)
+    [[0, 1, 2, 3]]
+
+    See Also
+    --------
+    read_edgelist
+    union_find_components
+
+    Notes
+    -----
+    Edge data after the two node labels is ignored. As with
+    read_edgelist(), isolated nodes cannot be represented.
+    """
+    lines = (line.decode(encoding) for line in path)
+    return union_find_components(_parse_edges(lines, comments, delimiter,
+                                              nodetype))
+
+def _parse_edges(lines, comments, delimiter, nodetype):
+    # generate the node pairs of an edge list as parse_edgelist() reads them
+    for line in lines:
+        p = line.find(comments)
+        if p >= 0:
+            line = line[:p]
+        s = line.strip().split(delimiter)
+        if len(s) < 2:
+            continue
+        u, v = s[0], s[1]
+        if nodetype is not None:
+            try:
+                u = nodetype(u)
+                v = nodetype(v)
+            except:
+                raise TypeError("Failed to convert nodes %s,%s to type %s."
+                                % (u, v, nodetype))
+        yield u, v
+
+# fixture for nose tests
+def teardown_module(module):
+    import os
+    os.unlink('test.edgelist')
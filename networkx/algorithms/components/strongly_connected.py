@@ -20,6 +20,7 @@ __all__ = ['number_strongly_connected_components',
            'is_strongly_connected',
            'strongly_connected_components_recursive',
            'kosaraju_strongly_connected_components',
+           'strongly_connected_component_labels',
            'condensation']
 
 def strongly_connected_components(G):
@@ -47,7 +48,8 @@ def strongly_connected_components(G):
     Notes
     -----
     Uses Tarjan's algorithm with Nuutila's modifications.
-    Nonrecursive version of algorithm.
+    Nonrecursive version of algorithm, run on the adjacency as lists of
+    integer node indices.
 
     References
     ----------
@@ -61,50 +63,158 @@ def strongly_connected_components(G):
     if not G.is_directed():
         raise nx.NetworkXError("""Not allowed for undirected graph G. 
               Use connected_components() """)
-    preorder={}
-    lowlink={}
-    scc_found={}
-    scc_queue = []
+    nodelist,indptr,indices=_csr_lists(G)
+    scc_list=[[nodelist[v] for v in scc] for scc in _scc(indptr,indices)]
+    scc_list.sort(key=len,reverse=True)
+    return scc_list
+
+
+def _csr_lists(G):
+    """Return the nodes of G and its adjacency as compressed sparse rows
+    in Python lists of node indices, in the order of G[v]."""
+    if isinstance(G,nx.CSRDiGraph):
+        nodelist,indptr,indices,weights=nx.csr_arrays(G)
+        return nodelist,indptr.tolist(),indices.tolist()
+    nodelist=list(G)
+    index=dict((v,i) for i,v in enumerate(nodelist))
+    indptr=[0]
+    indices=[]
+    for v in nodelist:
+        indices.extend([index[w] for w in G[v]])
+        indptr.append(len(indices))
+    return nodelist,indptr,indices
+
+
+def _scc(indptr,indices):
+    """Return the strongly connected components of the graph with CSR
+    adjacency indptr, indices as lists of node indices, in the order
+    they are completed.
+
+    The depth-first search is that of strongly_connected_components():
+    nodes are started in order and each node descends into its first
+    unvisited neighbor. It keeps an explicit stack with the position of
+    the next neighbor of each node, so every edge is scanned once and
+    there is no recursion.
+    """
+    n=len(indptr)-1
+    preorder=[0]*n      # 0 for unvisited nodes
+    lowlink=[0]*n
+    found=[False]*n
+    nxt=indptr[:-1]     # next neighbor to scan of each node
+    scc_queue=[]
     scc_list=[]
     i=0     # Preorder counter
-    for source in G:
-        if source not in scc_found:
-            queue=[source]
-            while queue:
-                v=queue[-1]
-                if v not in preorder:
-                    i=i+1
-                    preorder[v]=i
-                done=1
-                v_nbrs=G[v]
-                for w in v_nbrs:
-                    if w not in preorder:
-                        queue.append(w)
-                        done=0
-                        break
-                if done==1:
-                    lowlink[v]=preorder[v]
-                    for w in v_nbrs:
-                        if w not in scc_found:
-                            if preorder[w]>preorder[v]:
-                                lowlink[v]=min([lowlink[v],lowlink[w]])
-                            else:
-                                lowlink[v]=min([lowlink[v],preorder[w]])
-                    queue.pop()
-                    if lowlink[v]==preorder[v]:
-                        scc_found[v]=True
-                        scc=[v]
-                        while scc_queue and preorder[scc_queue[-1]]>preorder[v]:
-                            k=scc_queue.pop()
-                            scc_found[k]=True
-                            scc.append(k)
-                        scc_list.append(scc)
-                    else:
-                        scc_queue.append(v)
-    scc_list.sort(key=len,reverse=True)
+    for source in range(n):
+        if preorder[source]:
+            continue
+        i=i+1
+        preorder[source]=lowlink[source]=i
+        queue=[source]
+        while queue:
+            v=queue[-1]
+            low=lowlink[v]
+            a=nxt[v]
+            end=indptr[v+1]
+            while a<end:
+                w=indices[a]
+                a+=1
+                pw=preorder[w]
+                if pw==0:
+                    break
+                if pw<low and not found[w]:
+                    low=pw
+            else:
+                w=-1
+            lowlink[v]=low
+            if w>=0: # descend into the unvisited neighbor w
+                nxt[v]=a
+                i=i+1
+                preorder[w]=lowlink[w]=i
+                queue.append(w)
+                continue
+            queue.pop()
+            pv=preorder[v]
+            if low==pv:
+                found[v]=True
+                scc=[v]
+                while scc_queue and preorder[scc_queue[-1]]>pv:
+                    k=scc_queue.pop()
+                    found[k]=True
+                    scc.append(k)
+                scc_list.append(scc)
+            else:
+                scc_queue.append(v)
+                u=queue[-1] # v is not a root, so it has a parent
+                if low<lowlink[u]:
+                    lowlink[u]=low
     return scc_list
 
 
+def _scc_labels(G):
+    """Return the nodes, CSR lists, components sorted as returned by
+    strongly_connected_components() and the label of each node index."""
+    nodelist,indptr,indices=_csr_lists(G)
+    scc_list=_scc(indptr,indices)
+    scc_list.sort(key=len,reverse=True)
+    labels=[0]*len(nodelist)
+    for c,scc in enumerate(scc_list):
+        for v in scc:
+            labels[v]=c
+    return nodelist,indptr,indices,scc_list,labels
+
+
+def strongly_connected_component_labels(G, nodelist=None):
+    """Return the strongly connected component of each node as an array.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A directed graph.
+
+    nodelist : list, optional
+       The entries are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    Returns
+    -------
+    labels : NumPy array
+       Integer array with labels[i] the index of the component of
+       nodelist[i] in the list strongly_connected_components(G).
+
+    Raises
+    ------
+    NetworkXError: If G is undirected.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 0), (1, 2)])
+    >>> print(nx.strongly_connected_component_labels(G))
+    [0 0 1]
+
+    See Also
+    --------
+    strongly_connected_components
+    condensation
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("strongly_connected_component_labels() requires "
+                          "NumPy: http://scipy.org/")
+    if not G.is_directed():
+        raise nx.NetworkXError("""Not allowed for undirected graph G. 
+              Use connected_components() """)
+    nodes,indptr,indices,scc_list,labels=_scc_labels(G)
+    labels=np.array(labels,dtype=int)
+    if nodelist is not None:
+        index=dict((v,i) for i,v in enumerate(nodes))
+        try:
+            labels=labels[[index[v] for v in nodelist]]
+        except KeyError as e:
+            raise nx.NetworkXError("Node %s not in graph." % (e.args[0],))
+    return labels
+
+
 def kosaraju_strongly_connected_components(G,source=None):
     """Return nodes in strongly connected components of graph.
 
@@ -341,19 +451,39 @@ def condensation(G, scc=None):
     -----
     After contracting all strongly connected components to a single node,
     the resulting graph is a directed acyclic graph.
+
+    The edges are collected on integer arrays of the nodes and added to
+    the condensation at once.
     """
     if not G.is_directed():
         raise nx.NetworkXError("""Not allowed for undirected graph G.
               See is_connected() for connectivity test.""")
     if scc is None:
-        scc = nx.strongly_connected_components(G)
-    mapping = {}
+        # scc holds node indices rather than labels here, which does not
+        # matter since only len(scc) is used below
+        nodelist,indptr,indices,scc,labels=_scc_labels(G)
+    else:
+        nodelist,indptr,indices=_csr_lists(G)
+        mapping = {}
+        for i,component in enumerate(scc):
+            for n in component:
+                mapping[n] = i
+        labels=[mapping[n] for n in nodelist]
     C = nx.DiGraph()
-    for i,component in enumerate(scc):
-        for n in component:
-            mapping[n] = i
     C.add_nodes_from(range(len(scc)))
-    for u,v in G.edges():
-        if mapping[u] != mapping[v]:
-            C.add_edge(mapping[u],mapping[v])
+    C.add_edges_from(_condensation_edges(indptr,indices,labels))
     return C
+
+def _condensation_edges(indptr,indices,labels):
+    # the distinct pairs of labels of edges between components, in the
+    # order of the edges
+    edges=[]
+    seen=set()
+    for v in range(len(indptr)-1):
+        cv=labels[v]
+        for a in range(indptr[v],indptr[v+1]):
+            cw=labels[indices[a]]
+            if cv!=cw and (cv,cw) not in seen:
+                seen.add((cv,cw))
+                edges.append((cv,cw))
+    return edges
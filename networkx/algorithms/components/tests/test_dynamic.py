@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+import random
+from nose.tools import *
+import networkx as nx
+
+class TestDynamicComponents:
+
+    def check(self, D):
+        G=D.G
+        if G.is_directed():
+            expected=nx.weakly_connected_components(G)
+        else:
+            expected=nx.connected_components(G)
+        components=D.connected_components()
+        assert_equal(sorted(sorted(c) for c in components),
+                     sorted(sorted(c) for c in expected))
+        assert_equal(D.number_connected_components(),len(expected))
+        for c in expected:
+            assert_equal(sorted(D.node_connected_component(c[0])),sorted(c))
+
+    def check_random_updates(self, G, seed):
+        random.seed(seed)
+        D=nx.DynamicComponents(G)
+        self.check(D)
+        for i in range(300):
+            r=random.random()
+            if r<0.45:
+                D.add_edge(random.randrange(60),random.randrange(60))
+            elif r<0.9 and G.number_of_edges()>0:
+                D.remove_edge(*random.choice(G.edges()))
+            elif r<0.95 and len(G)>0:
+                D.remove_node(random.choice(G.nodes()))
+            else:
+                D.add_node(random.randrange(70))
+            self.check(D)
+
+    def test_graph(self):
+        self.check_random_updates(nx.gnm_random_graph(40,30,seed=1),1)
+
+    def test_digraph(self):
+        self.check_random_updates(nx.gnm_random_graph(40,30,seed=2,
+                                                      directed=True),2)
+
+    def test_multigraph(self):
+        self.check_random_updates(nx.MultiGraph(nx.path_graph(20)),3)
+        D=nx.DynamicComponents(nx.MultiGraph([(0,1),(0,1)]))
+        D.remove_edge(0,1)
+        assert_true(D.connected(0,1))
+        D.remove_edge(0,1)
+        assert_false(D.connected(0,1))
+
+    def test_reverse_edge(self):
+        D=nx.DynamicComponents(nx.DiGraph([(0,1),(1,0)]))
+        D.remove_edge(0,1)
+        assert_equal(D.number_connected_components(),1)
+        D.remove_edge(1,0)
+        assert_equal(D.number_connected_components(),2)
+
+    def test_remove_node(self):
+        # the neighbors of a removed node end in several components
+        D=nx.DynamicComponents(nx.star_graph(4))
+        D.add_edge(1,2)
+        D.remove_node(0)
+        self.check(D)
+        assert_equal(D.number_connected_components(),3)
+
+    def test_bunch_methods(self):
+        D=nx.DynamicComponents(nx.Graph())
+        D.add_nodes_from([0,(1,{'color':'red'}),2,3])
+        assert_equal(D.G.node[1],{'color':'red'})
+        D.add_edges_from([(0,1,{'weight':2}),(2,3),(3,4)],color='blue')
+        assert_equal(D.G[0][1],{'weight':2,'color':'blue'})
+        self.check(D)
+        D.remove_edges_from([(0,1),(5,6),(3,4)])
+        self.check(D)
+        D.remove_nodes_from([2,7])
+        self.check(D)
+        assert_equal(D.number_connected_components(),4)
+
+    def test_remove_edges_from_component(self):
+        D=nx.DynamicComponents(nx.path_graph(4))
+        D.remove_edges_from([(1,2),(0,1)])
+        self.check(D)
+        assert_false(D.connected(0,3))
+        G=nx.gnm_random_graph(30,60,seed=5)
+        D=nx.DynamicComponents(G)
+        random.seed(5)
+        for i in range(6):
+            D.remove_edges_from(random.sample(G.edges(),8))
+            self.check(D)
+
+    def test_errors(self):
+        D=nx.DynamicComponents(nx.path_graph(3))
+        assert_raises(nx.NetworkXError,D.remove_node,5)
+        assert_raises(nx.NetworkXError,D.remove_edge,0,2)
+        assert_raises(nx.NetworkXError,D.node_connected_component,5)
+        assert_raises(nx.NetworkXError,D.connected,0,5)
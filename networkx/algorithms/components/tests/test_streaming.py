@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+import os
+import tempfile
+from nose.tools import *
+import networkx as nx
+
+class TestUnionFindComponents:
+
+    def setUp(self):
+        self.G=nx.gnm_random_graph(100,60,seed=4)
+
+    def check(self, components, expected):
+        assert_equal(sorted(sorted(c) for c in components),
+                     sorted(sorted(c) for c in expected))
+        sizes=[len(c) for c in components]
+        assert_equal(sizes,sorted(sizes,reverse=True))
+
+    def test_graph(self):
+        G=self.G
+        self.check(nx.union_find_components(G),nx.connected_components(G))
+        self.check(nx.union_find_components(G.edges_iter(),nodes=G),
+                   nx.connected_components(G))
+        D=nx.DiGraph(G.edges())
+        self.check(nx.union_find_components(D),
+                   nx.weakly_connected_components(D))
+
+    def test_edges(self):
+        edges=iter([(1,2,{'weight':3}),('a','b'),(2,3),(3,1),(4,4)])
+        self.check(nx.union_find_components(edges,nodes=[5,1]),
+                   [[1,2,3],['a','b'],[4],[5]])
+        assert_equal(nx.union_find_components([]),[])
+
+    def test_edgelist_file(self):
+        G=self.G
+        fd,fname=tempfile.mkstemp()
+        os.close(fd)
+        try:
+            nx.write_edgelist(G,fname)
+            self.check(nx.read_edgelist_components(fname,nodetype=int),
+                       nx.connected_components(G.subgraph(
+                           [v for v in G if G.degree(v)>0])))
+            with open(fname,'wb') as fh:
+                fh.write(b'# comment\na b 1.0\nb c\n\nd e # edge\nx\n')
+            self.check(nx.read_edgelist_components(fname),
+                       [['a','b','c'],['d','e']])
+            assert_raises(TypeError,nx.read_edgelist_components,fname,
+                          nodetype=int)
+        finally:
+            os.unlink(fname)
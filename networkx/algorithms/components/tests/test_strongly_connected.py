@@ -2,6 +2,7 @@
 from nose.tools import *
 import networkx as nx
 from networkx import NetworkXError 
+from nose import SkipTest
 
 class TestStronglyConnected:
 
@@ -136,3 +137,54 @@ class TestStronglyConnected:
         assert_raises(NetworkXError,nx.strongly_connected_component_subgraphs,G)
         assert_raises(NetworkXError,nx.is_strongly_connected,G)
         assert_raises(NetworkXError,nx.condensation,G)
+
+    def test_long_cycle(self):
+        # no recursion limit on long paths
+        G=nx.DiGraph()
+        G.add_path(range(10000))
+        assert_equal(len(nx.strongly_connected_components(G)),10000)
+        G.add_edge(9999,0)
+        assert_equal(nx.strongly_connected_components(G),[list(range(10000))])
+
+    def test_csr_graph(self):
+        for G,C in self.gc:
+            scc=nx.strongly_connected_components(nx.CSRDiGraph(G))
+            assert_equal(sorted([sorted(g) for g in scc]),sorted(C))
+
+    def test_condensation_edges(self):
+        for G,C in self.gc:
+            scc=nx.strongly_connected_components(G)
+            cG=nx.condensation(G)
+            edges=set((scc.index([c for c in scc if u in c][0]),
+                       scc.index([c for c in scc if v in c][0]))
+                      for u,v in G.edges())
+            assert_equal(sorted(cG.edges()),
+                         sorted((u,v) for u,v in edges if u!=v))
+
+
+class TestStronglyConnectedLabels:
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_labels(self):
+        G=nx.gnp_random_graph(50,0.04,seed=3,directed=True)
+        scc=nx.strongly_connected_components(G)
+        labels=nx.strongly_connected_component_labels(G)
+        assert_equal(labels.tolist(),
+                     [[v in c for c in scc].index(True) for v in G])
+        nodelist=list(reversed(G.nodes()))
+        labels=nx.strongly_connected_component_labels(G,nodelist)
+        assert_equal(labels.tolist(),
+                     [[v in c for c in scc].index(True) for v in nodelist])
+
+    def test_errors(self):
+        assert_raises(NetworkXError,nx.strongly_connected_component_labels,
+                      nx.Graph())
+        assert_raises(NetworkXError,nx.strongly_connected_component_labels,
+                      nx.DiGraph([(0,1)]),[0,2])
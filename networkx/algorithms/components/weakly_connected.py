@@ -25,12 +25,12 @@ def weakly_connected_components(G):
     if not G.is_directed():
         raise nx.NetworkXError("""Not allowed for undirected graph G. 
               Use connected_components() """)
-    seen={}
+    seen=set()
     components=[]
     for v in G:
         if v not in seen:
-            c=_single_source_shortest_unipath_length(G,v)
-            components.append(list(c.keys()))
+            c=_plain_bfs(G,v)
+            components.append(c)
             seen.update(c)
     components.sort(key=len,reverse=True)
     return components
@@ -84,43 +84,20 @@ def is_weakly_connected(G):
 
     return len(weakly_connected_components(G)[0])==len(G)
 
-def _single_source_shortest_unipath_length(G,source,cutoff=None):
-    """Compute the shortest path lengths from source to all reachable nodes.
-
-    The direction of the edge between nodes is ignored.
-    
-    For directed graphs only.
-
-    Parameters
-    ----------
-    G : NetworkX graph
-
-    source : node
-       Starting node for path
-
-    cutoff : integer, optional
-        Depth to stop the search. Only paths of length <= cutoff are returned.
-
-    Returns
-    -------
-    lengths : dictionary
-        Dictionary of shortest path lengths keyed by target.
-    """
-    # namespace speedups
-    Gsucc = G.succ
-    Gpred = G.pred
-
-    seen={}                  # level (number of hops) when seen in BFS
-    level=0                  # the current level
-    nextlevel = set([source]) # set of nodes to check at next level
-    while nextlevel:
-        thislevel=nextlevel  # advance to next level
-        nextlevel = set()         # and start a new list (fringe)
-        for v in thislevel:
-            if v not in seen:
-                seen[v]=level # set the level of vertex v
-                nextlevel.update(Gsucc[v]) # add successors of v
-                nextlevel.update(Gpred[v]) # add predecessors of v
-        if (cutoff is not None and cutoff <= level):  break
-        level=level+1
-    return seen  # return all path lengths as dictionary
+def _plain_bfs(G, source):
+    """Return the list of nodes reachable from source in breadth-first
+    order, ignoring the direction of edges."""
+    Gsucc=G.succ
+    Gpred=G.pred
+    seen=set([source])
+    nodes=[source]
+    for v in nodes: # nodes grows while it is iterated
+        for w in Gsucc[v]:
+            if w not in seen:
+                seen.add(w)
+                nodes.append(w)
+        for w in Gpred[v]:
+            if w not in seen:
+                seen.add(w)
+                nodes.append(w)
+    return nodes
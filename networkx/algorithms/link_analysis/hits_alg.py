@@ -199,7 +199,7 @@ def hits_numpy(G,normalized=True):
     authorities=dict(zip(G.nodes(),map(float,a)))
     return hubs,authorities
 
-def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
+def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True,nstart=None):
     """Return HITS hubs and authorities values for nodes.
 
     The HITS algorithm computes two numbers for a node.
@@ -217,12 +217,12 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
     tol : float, optional
       Error tolerance used to check convergence in power method iteration.
 
-    nstart : dictionary, optional
-      Starting value of each node for power method iteration.
-
     normalized : bool (default=True)
        Normalize results by the sum of all of the values.
 
+    nstart : dictionary, optional
+      Starting value of each node for power method iteration.
+
     Returns
     -------
     (hubs,authorities) : two-tuple of dictionaries
@@ -236,7 +236,9 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
 
     Notes
     -----
-    This implementation uses SciPy sparse matrices.
+    This implementation uses SciPy sparse matrices, see
+    PowerIterationEngine. For CSRGraph and CSRDiGraph the matrix is
+    built only once per graph.
 
     The eigenvector calculation is done by the power iteration method
     and has no guarantee of convergence.  The iteration will stop
@@ -264,36 +266,9 @@ def hits_scipy(G,max_iter=100,tol=1.0e-6,normalized=True):
     except ImportError:
         raise ImportError(\
             "hits_scipy() requires SciPy: http://scipy.org/")
-    if len(G) == 0:
-        return {},{}
-    M=nx.to_scipy_sparse_matrix(G,nodelist=G.nodes())
-    (n,m)=M.shape # should be square
-    A=M.T*M # authority matrix
-    x=scipy.ones((n,1))/n  # initial guess
-    # power iteration on authority matrix
-    i=0
-    while True:
-        xlast=x
-        x=A*x
-        x=x/x.max()
-        # check convergence, l1 norm
-        err=scipy.absolute(x-xlast).sum()
-        if err < tol:
-            break
-        if i>max_iter:
-            raise NetworkXError(\
-            "HITS: power iteration failed to converge in %d iterations."%(i+1))
-        i+=1
-
-    a=np.asarray(x).flatten()
-    # h=M*a
-    h=np.asarray(M*a).flatten()
-    if normalized:
-        h = h/h.sum()
-        a = a/a.sum()
-    hubs=dict(zip(G.nodes(),map(float,h)))
-    authorities=dict(zip(G.nodes(),map(float,a)))
-    return hubs,authorities
+    from networkx.algorithms.link_analysis.power_iteration import _get_engine
+    return _get_engine(G).hits(max_iter=max_iter, tol=tol, nstart=nstart,
+                               normalized=normalized)
 
 # fixture for nose tests
 def setup_module(module):
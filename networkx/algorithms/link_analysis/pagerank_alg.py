@@ -288,7 +288,7 @@ def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight'):
 
 
 def pagerank_scipy(G, alpha=0.85, personalization=None,
-                   max_iter=100, tol=1.0e-6, weight='weight'):
+                   max_iter=100, tol=1.0e-6, weight='weight', nstart=None):
     """Return the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -316,6 +316,10 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     weight : key, optional
       Edge data key to use as weight.  If None weights are set to 1.
 
+    nstart : dictionary, optional
+      Starting value of PageRank iteration for each node, e.g. the
+      PageRank of a previous call.
+
     Returns
     -------
     pagerank : dictionary
@@ -329,11 +333,12 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     Notes
     -----
     The eigenvector calculation uses power iteration with a SciPy
-    sparse matrix representation.
+    sparse matrix representation, see PowerIterationEngine. For
+    CSRGraph and CSRDiGraph the matrix is built only once per graph.
 
     See Also
     --------
-    pagerank, pagerank_numpy, google_matrix
+    pagerank, pagerank_numpy, google_matrix, PowerIterationEngine
 
     References
     ----------
@@ -348,42 +353,11 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
         import scipy.sparse
     except ImportError:
         raise ImportError("pagerank_scipy() requires SciPy: http://scipy.org/")
-    if len(G) == 0:
-        return {}
-    # choose ordering in matrix
-    if personalization is None: # use G.nodes() ordering
-        nodelist=G.nodes()
-    else:  # use personalization "vector" ordering
-        nodelist=personalization.keys()
-    M=nx.to_scipy_sparse_matrix(G,nodelist=nodelist,weight=weight,dtype='f')
-    (n,m)=M.shape # should be square
-    S=scipy.array(M.sum(axis=1)).flatten()
-#    for i, j, v in zip( *scipy.sparse.find(M) ):
-#        M[i,j] = v / S[i]
-    S[S>0] = 1.0 / S[S>0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
-    x=scipy.ones((n))/n  # initial guess
-    dangle=scipy.array(scipy.where(M.sum(axis=1)==0,1.0/n,0)).flatten()
-    # add "teleportation"/personalization
-    if personalization is not None:
-        v=scipy.array(list(personalization.values()),dtype=float)
-        v=v/v.sum()
-    else:
-        v=x
-    i=0
-    while i <= max_iter:
-        # power iteration: make up to max_iter iterations
-        xlast=x
-        x=alpha*(x*M+scipy.dot(dangle,xlast))+(1-alpha)*v
-        x=x/x.sum()
-        # check convergence, l1 norm
-        err=scipy.absolute(x-xlast).sum()
-        if err < n*tol:
-            return dict(zip(nodelist,map(float,x)))
-        i+=1
-    raise NetworkXError('pagerank_scipy: power iteration failed to converge'
-                        'in %d iterations.'%(i+1))
+    from networkx.algorithms.link_analysis.power_iteration import _get_engine
+    return _get_engine(G, weight).pagerank(alpha=alpha,
+                                           personalization=personalization,
+                                           max_iter=max_iter, tol=tol,
+                                           nstart=nstart)
 
 
 # fixture for nose tests
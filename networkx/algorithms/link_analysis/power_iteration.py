@@ -0,0 +1,411 @@
+"""Sparse power iteration for PageRank, HITS, Katz and eigenvector
+centrality. """
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import weakref
+import networkx as nx
+from networkx.exception import NetworkXError
+__author__ = """Aric Hagberg (hagberg@lanl.gov)"""
+__all__ = ['PowerIterationEngine']
+
+class PowerIterationEngine(object):
+    """Solve PageRank, HITS, Katz and eigenvector centrality of a graph
+    by power iteration on a cached SciPy sparse matrix.
+
+    The adjacency matrix and the operators derived from it, e.g. the
+    row-normalized transition matrix of PageRank, are built once when
+    first needed and reused by all later calls. Every method accepts a
+    starting vector, so a previous solution can be used as a warm start
+    after a small change of the parameters or the graph.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. The engine does not see later changes of G.
+
+    weight : key, optional (default='weight')
+      Edge data key to use as weight. Edges without it have weight 1.
+      If None all weights are 1.
+
+    nodelist : list, optional
+      The order of the nodes in the matrices and in returned arrays.
+      If None the order of G.nodes() is used.
+
+    Attributes
+    ----------
+    nodelist : list
+      The node of every row of the matrices.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> engine = nx.PowerIterationEngine(G)
+    >>> pr = engine.pagerank(alpha=0.9)
+    >>> pr = engine.pagerank(alpha=0.85, nstart=pr) # warm start
+    >>> ppr = engine.personalized_pagerank([0, 3]) # one column per node
+
+    Notes
+    -----
+    pagerank_scipy() and hits_scipy() use this engine. For the immutable
+    CSRGraph and CSRDiGraph they keep one engine per graph, so repeated
+    calls do not rebuild the matrix.
+
+    See Also
+    --------
+    pagerank_scipy
+    hits_scipy
+    katz_centrality
+    eigenvector_centrality
+    """
+    def __init__(self, G, weight='weight', nodelist=None):
+        try:
+            import scipy.sparse
+        except ImportError:
+            raise ImportError(\
+                "PowerIterationEngine requires SciPy: http://scipy.org/")
+        if G.is_multigraph():
+            # parallel edges are summed
+            if nodelist is None:
+                nodelist = G.nodes()
+            A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist,
+                                          weight=weight, dtype=float,
+                                          format='csr')
+        else:
+            nodelist, indptr, indices, weights = nx.csr_arrays(G, weight,
+                                                               nodelist)
+            n = len(nodelist)
+            if weights is None:
+                weights = scipy.ones(len(indices))
+            A = scipy.sparse.csr_matrix((weights, indices, indptr),
+                                        shape=(n, n))
+        self.nodelist = list(nodelist)
+        self._A = A
+        self._cache = {}
+
+    def _operator(self, name):
+        # the cached matrices derived from the adjacency matrix A
+        import scipy
+        import scipy.sparse
+        if name not in self._cache:
+            A = self._A
+            if name == 'AT':
+                op = A.T.tocsr()
+            elif name == 'PT': # transpose of the transition matrix
+                S = scipy.array(A.sum(axis=1)).flatten()
+                dangling = S == 0
+                S[~dangling] = 1.0/S[~dangling]
+                Q = scipy.sparse.spdiags(S, 0, *A.shape, format='csr')
+                op = ((Q*A).T.tocsr(), dangling)
+            self._cache[name] = op
+        return self._cache[name]
+
+    def _vector(self, values, default):
+        # vector in nodelist order from a dictionary or array
+        import numpy as np
+        if values is None:
+            return np.array(default, dtype=float)
+        if isinstance(values, dict):
+            return np.array([values.get(n, 0) for n in self.nodelist],
+                            dtype=float)
+        return np.array(values, dtype=float)
+
+    def _dict(self, x):
+        return dict(zip(self.nodelist, map(float, x)))
+
+    def pagerank(self, alpha=0.85, personalization=None, max_iter=100,
+                 tol=1.0e-6, nstart=None):
+        """Return the PageRank of the nodes in the graph.
+
+        Parameters
+        ----------
+        alpha : float, optional
+          Damping parameter for PageRank, default=0.85
+
+        personalization: dict, optional
+          The "personalization vector", a dictionary keyed by node.
+          Nodes that are not keys have personalization 0.
+
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method
+          solver. The iteration stops if the l1 change is below n*tol.
+
+        nstart : dictionary or array, optional
+          Starting value of PageRank iteration, e.g. a previous result.
+
+        Returns
+        -------
+        pagerank : dictionary
+           Dictionary of nodes with PageRank as value
+        """
+        n = len(self.nodelist)
+        if n == 0:
+            return {}
+        if personalization is None:
+            v = None
+        else:
+            v = self._vector(personalization, None)[:, None]
+        x = None if nstart is None else self._vector(nstart, None)[:, None]
+        x = self._pagerank(alpha, v, max_iter, tol, x, 1)
+        return self._dict(x[:, 0])
+
+    def personalized_pagerank(self, personalization, alpha=0.85,
+                              max_iter=100, tol=1.0e-6, nstart=None):
+        """Return many personalized PageRank vectors at once.
+
+        All vectors are iterated together, so each iteration is a single
+        product of the sparse transition matrix with a dense matrix.
+
+        Parameters
+        ----------
+        personalization : list
+          Personalization vectors: nodes (all personalization on that
+          node) or dictionaries keyed by node.
+
+        alpha : float, optional
+          Damping parameter for PageRank, default=0.85
+
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence of every vector.
+
+        nstart : array, optional
+          Starting values with one column per personalization vector,
+          e.g. a previous result.
+
+        Returns
+        -------
+        pagerank : NumPy array
+           Array of shape (n, len(personalization)). Column j is the
+           PageRank for personalization[j]; row i belongs to node
+           nodelist[i].
+        """
+        import numpy as np
+        n = len(self.nodelist)
+        index = dict((node, i) for i, node in enumerate(self.nodelist))
+        V = np.zeros((n, len(personalization)))
+        for j, p in enumerate(personalization):
+            if isinstance(p, dict):
+                V[:, j] = self._vector(p, None)
+            else:
+                try:
+                    V[index[p], j] = 1.0
+                except KeyError:
+                    raise NetworkXError("The node %s is not in the graph."
+                                        % (p,))
+        x = None if nstart is None else np.array(nstart, dtype=float)
+        return self._pagerank(alpha, V, max_iter, tol, x, len(personalization))
+
+    def _pagerank(self, alpha, V, max_iter, tol, x, k):
+        # power iteration on the columns of the n x k array x
+        import numpy as np
+        n = len(self.nodelist)
+        PT, dangling = self._operator('PT')
+        if V is not None:
+            sums = V.sum(axis=0)
+            if (sums <= 0).any():
+                raise NetworkXError("Personalization vectors must have "
+                                    "a positive sum.")
+            V = V/sums
+        if x is None:
+            x = np.ones((n, k))/n
+        x = x/x.sum(axis=0)
+        for i in range(max_iter + 1):
+            xlast = x
+            danglesum = xlast[dangling].sum(axis=0)/n
+            x = alpha*(PT.dot(xlast) + danglesum)
+            x += (1 - alpha)*(V if V is not None else 1.0/n)
+            x = x/x.sum(axis=0)
+            # check convergence, l1 norm
+            err = np.absolute(x - xlast).sum(axis=0)
+            if (err < n*tol).all():
+                return x
+        raise NetworkXError('pagerank: power iteration failed to converge '
+                            'in %d iterations.' % (i + 1))
+
+    def hits(self, max_iter=100, tol=1.0e-8, nstart=None, normalized=True):
+        """Return HITS hubs and authorities values for nodes.
+
+        Parameters
+        ----------
+        max_iter : integer, optional
+          Maximum number of iterations in power method.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method
+          iteration.
+
+        nstart : dictionary or array, optional
+          Starting value of each node for the hubs iteration, e.g. the
+          hubs of a previous result.
+
+        normalized : bool (default=True)
+          Normalize results by the sum of all of the values.
+
+        Returns
+        -------
+        (hubs,authorities) : two-tuple of dictionaries
+           Two dictionaries keyed by node containing the hub and authority
+           values.
+        """
+        import numpy as np
+        n = len(self.nodelist)
+        if n == 0:
+            return {}, {}
+        A = self._A
+        AT = self._operator('AT')
+        h = self._vector(nstart, np.ones(n)/n)
+        h = h/h.sum()
+        for i in range(max_iter + 1):
+            hlast = h
+            a = AT.dot(hlast)
+            h = A.dot(a)
+            h = h/h.max()
+            a = a/a.max()
+            # check convergence, l1 norm
+            err = np.absolute(h - hlast).sum()
+            if err < tol:
+                break
+        else:
+            raise NetworkXError(\
+            "HITS: power iteration failed to converge in %d iterations."%(i+1))
+        if normalized:
+            h = h/h.sum()
+            a = a/a.sum()
+        return self._dict(h), self._dict(a)
+
+    def katz(self, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
+             nstart=None, normalized=True):
+        """Return the Katz centrality of the nodes, see katz_centrality().
+
+        Parameters
+        ----------
+        alpha : float
+          Attenuation factor
+
+        beta : scalar or dictionary, optional (default=1.0)
+          Weight attributed to the immediate neighborhood. If not a scalar
+          the dictionary must have an value for every node.
+
+        max_iter : integer, optional (default=1000)
+          Maximum number of iterations in power method.
+
+        tol : float, optional (default=1.0e-6)
+          Error tolerance used to check convergence in power method
+          iteration.
+
+        nstart : dictionary or array, optional
+          Starting value of Katz iteration for each node.
+
+        normalized : bool, optional (default=True)
+          If True normalize the resulting values.
+
+        Returns
+        -------
+        nodes : dictionary
+           Dictionary of nodes with Katz centrality as the value.
+        """
+        import numpy as np
+        n = len(self.nodelist)
+        if n == 0:
+            return {}
+        if isinstance(beta, dict):
+            if set(beta) != set(self.nodelist):
+                raise NetworkXError('beta dictionary '
+                                    'must have a value for every node')
+            b = self._vector(beta, None)
+        else:
+            try:
+                b = np.ones(n)*float(beta)
+            except (TypeError, ValueError):
+                raise NetworkXError('beta must be a number or a dictionary')
+        A = self._A
+        x = self._vector(nstart, np.zeros(n))
+        for i in range(max_iter):
+            xlast = x
+            x = alpha*A.dot(xlast) + b
+            # check convergence
+            err = np.absolute(x - xlast).sum()
+            if err < n*tol:
+                if normalized:
+                    norm = np.sqrt((x**2).sum())
+                    if norm > 0:
+                        x = x/norm
+                return self._dict(x)
+        raise NetworkXError('Power iteration failed to converge in '
+                            '%d iterations.' % (i + 1))
+
+    def eigenvector(self, max_iter=100, tol=1.0e-6, nstart=None):
+        """Return the eigenvector centrality of the nodes, see
+        eigenvector_centrality().
+
+        Parameters
+        ----------
+        max_iter : interger, optional
+          Maximum number of iterations in power method.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method
+          iteration.
+
+        nstart : dictionary or array, optional
+          Starting value of eigenvector iteration for each node.
+
+        Returns
+        -------
+        nodes : dictionary
+           Dictionary of nodes with eigenvector centrality as the value.
+        """
+        import numpy as np
+        n = len(self.nodelist)
+        if n == 0:
+            raise nx.NetworkXException("Empty graph.")
+        A = self._A
+        x = self._vector(nstart, np.ones(n)/n)
+        x = x/x.sum()
+        for i in range(max_iter):
+            xlast = x
+            x = A.dot(xlast)
+            norm = np.sqrt((x**2).sum())
+            if norm > 0:
+                x = x/norm
+            # check convergence
+            err = np.absolute(x - xlast).sum()
+            if err < n*tol:
+                return self._dict(x)
+        raise NetworkXError("eigenvector_centrality(): power iteration "
+                            "failed to converge in %d iterations." % (i + 1))
+
+
+# one engine per immutable graph, dropped with the graph
+_engines = weakref.WeakKeyDictionary()
+
+def _get_engine(G, weight='weight'):
+    # Return an engine for G. Engines of CSRGraph and CSRDiGraph, which
+    # cannot change, are cached per graph and weight.
+    if not isinstance(G, (nx.CSRGraph, nx.CSRDiGraph)):
+        return PowerIterationEngine(G, weight)
+    engines = _engines.setdefault(G, {})
+    if weight not in engines:
+        engines[weight] = PowerIterationEngine(G, weight)
+    return engines[weight]
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+    try:
+        import scipy
+    except:
+        raise SkipTest("SciPy not available")
@@ -70,6 +70,9 @@ class TestHITS:
             assert_almost_equal(h[n],G.h[n],places=4)
         for n in G:
             assert_almost_equal(a[n],G.a[n],places=4)
+        # normalized is the fourth positional argument
+        h,a=networkx.hits_scipy(G,100,1.e-08,False)
+        assert_almost_equal(max(h.values()),1.0,places=4)
 
 
     @attr('numpy')
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx
+
+class TestPowerIterationEngine(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def setUp(self):
+        G=networkx.DiGraph()
+        edges=[(1,2),(1,3),\
+           (3,1),(3,2),(3,5),\
+           (4,5),(4,6),\
+           (5,4),(5,6),\
+           (6,4)]
+        G.add_edges_from(edges)
+        self.G=G
+        self.pagerank=dict(zip(G,
+                               [0.03721197,0.05395735,0.04150565,
+                                0.37508082,0.20599833, 0.28624589]))
+
+    def test_pagerank(self):
+        engine=networkx.PowerIterationEngine(self.G)
+        p=engine.pagerank(alpha=0.9,tol=1.e-08)
+        for n in self.G:
+            assert_almost_equal(p[n],self.pagerank[n],places=4)
+        # warm start from the solution converges in one iteration
+        p=engine.pagerank(alpha=0.9,tol=1.e-08,nstart=p,max_iter=1)
+        for n in self.G:
+            assert_almost_equal(p[n],self.pagerank[n],places=4)
+        assert_raises(networkx.NetworkXError,engine.pagerank,max_iter=0)
+        assert_equal(networkx.PowerIterationEngine(networkx.Graph()).pagerank(),{})
+
+    def test_personalized_pagerank(self):
+        G=networkx.gnp_random_graph(30,0.1,seed=1,directed=True)
+        engine=networkx.PowerIterationEngine(G)
+        personalization=[0,5,dict((n,n+1.0) for n in G)]
+        X=engine.personalized_pagerank(personalization,tol=1e-10)
+        assert_equal(X.shape,(30,3))
+        for j,p in enumerate(personalization):
+            if not isinstance(p,dict):
+                p={p:1}
+            pr=networkx.pagerank(G,personalization=dict((n,p.get(n,0))
+                                                       for n in G),tol=1e-12)
+            for i,n in enumerate(engine.nodelist):
+                assert_almost_equal(X[i,j],pr[n])
+        X2=engine.personalized_pagerank(personalization,nstart=X,max_iter=1)
+        assert_true(np.allclose(X,X2))
+        assert_raises(networkx.NetworkXError,engine.personalized_pagerank,
+                      ['missing'])
+        assert_raises(networkx.NetworkXError,engine.personalized_pagerank,
+                      [{0:0}])
+
+    def test_hits(self):
+        G=self.G
+        engine=networkx.PowerIterationEngine(G)
+        h,a=engine.hits()
+        h_answer,a_answer=networkx.hits(G)
+        for n in G:
+            assert_almost_equal(h[n],h_answer[n],places=4)
+            assert_almost_equal(a[n],a_answer[n],places=4)
+        h,a=networkx.hits_scipy(G,nstart=h)
+        for n in G:
+            assert_almost_equal(h[n],h_answer[n],places=4)
+
+    def test_katz_eigenvector(self):
+        G=networkx.gnp_random_graph(30,0.2,seed=2)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%3+1
+        k=networkx.katz_centrality_scipy(G,alpha=0.02,tol=1e-10)
+        k_answer=networkx.katz_centrality(G,alpha=0.02,tol=1e-10)
+        e=networkx.eigenvector_centrality_scipy(G,max_iter=1000,tol=1e-10)
+        e_answer=networkx.eigenvector_centrality(G,max_iter=1000,tol=1e-10)
+        for n in G:
+            assert_almost_equal(k[n],k_answer[n])
+            assert_almost_equal(e[n],e_answer[n])
+        beta=dict((n,n%2+1.0) for n in G)
+        k=networkx.katz_centrality_scipy(G,alpha=0.02,beta=beta,
+                                         normalized=False)
+        k_answer=networkx.katz_centrality(G,alpha=0.02,beta=beta,
+                                          normalized=False)
+        for n in G:
+            assert_almost_equal(k[n],k_answer[n],places=4)
+        assert_raises(networkx.NetworkXError,networkx.katz_centrality_scipy,
+                      G,beta={0:1})
+        assert_raises(networkx.NetworkXException,
+                      networkx.eigenvector_centrality_scipy,networkx.Graph())
+
+    def test_csr_cache(self):
+        from networkx.algorithms.link_analysis.power_iteration import \
+            _get_engine
+        G=networkx.CSRDiGraph(self.G)
+        assert_true(_get_engine(G) is _get_engine(G))
+        assert_false(_get_engine(G) is _get_engine(G,None))
+        assert_false(_get_engine(self.G) is _get_engine(self.G))
+        p=networkx.pagerank_scipy(G,alpha=0.9,tol=1.e-08)
+        for n in G:
+            assert_almost_equal(p[n],self.pagerank[n],places=4)
+
+    def test_multigraph(self):
+        G=networkx.MultiDiGraph(self.G)
+        G.add_edge(1,2)
+        p=networkx.pagerank_scipy(G)
+        p_answer=networkx.pagerank_numpy(G)
+        for n in G:
+            assert_almost_equal(p[n],p_answer[n],places=4)
@@ -4,3 +4,5 @@ from networkx.algorithms.shortest_paths.weighted import *
 from networkx.algorithms.shortest_paths.astar import *
 from networkx.algorithms.shortest_paths.dense import *
 
+from networkx.algorithms.shortest_paths.all_pairs import *
+from networkx.algorithms.shortest_paths.landmarks import *
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""All-pairs shortest path lengths as NumPy arrays.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from collections import deque
+import networkx as nx
+from networkx.algorithms.shortest_paths.csr_dijkstra import CSRDijkstra
+__author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
+__all__ = ['distance_matrix',
+           'distance_rows']
+
+def distance_matrix(G, weight=None, nodelist=None, dtype=float,
+                    filename=None, processes=None, block_size=256):
+    """Return the matrix of shortest path lengths between all pairs of
+    nodes.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : None or string, optional (default=None)
+       If None, every edge has length 1 and breadth-first search is used.
+       Otherwise the edge attribute holding the edge length, edges without
+       it have length 1, and Dijkstra's algorithm is used.
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    dtype : NumPy data type, optional (default=float)
+       Floating point type of the matrix entries; float32 halves the
+       memory.
+
+    filename : string, optional
+       If given, the matrix is a NumPy memmap stored in this file instead
+       of an array in memory, for matrices larger than the memory.
+
+    processes : int, optional
+       If given, the single-source searches are run in a pool of this
+       many worker processes.
+
+    block_size : int, optional (default=256)
+       Number of rows computed by a worker at a time.
+
+    Returns
+    -------
+    distance : NumPy array or memmap
+        Matrix with distance[i,j] the shortest path length from
+        nodelist[i] to nodelist[j]. If there is no path the entry is inf.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> print(nx.distance_matrix(G))
+    [[0. 1. 2.]
+     [1. 0. 1.]
+     [2. 1. 0.]]
+
+    Notes
+    -----
+    Unlike all_pairs_shortest_path_length() and
+    all_pairs_dijkstra_path_length() no dictionaries are built, so the
+    memory is n^2 times the size of dtype. Workers writing to a memmap
+    write their rows to the file directly.
+
+    See Also
+    --------
+    distance_rows
+    all_pairs_shortest_path_length
+    all_pairs_dijkstra_path_length
+    floyd_warshall_numpy
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("distance_matrix() requires NumPy: http://scipy.org/")
+    dtype = _float_dtype(dtype)
+    nodelist, indptr, indices, weights = nx.csr_arrays(G, weight, nodelist)
+    n = len(nodelist)
+    if filename is None:
+        distance = np.empty((n, n), dtype=dtype)
+    else:
+        distance = np.memmap(filename, dtype=dtype, mode='w+',
+                             shape=(n, n))
+    if n == 0:
+        return distance
+    state = (indptr, indices, weights, dtype, filename)
+    blocks = [range(start, min(start + block_size, n))
+              for start in range(0, n, block_size)]
+    for start, block in _blocks(state, blocks, processes):
+        if block is not None: # else the worker wrote to filename
+            distance[start:start + len(block)] = block
+    if filename is not None:
+        distance.flush()
+    return distance
+
+
+def distance_rows(G, weight=None, nodelist=None, sources=None, dtype=float,
+                  processes=None, block_size=256):
+    """Generate the rows of the shortest path length matrix one by one.
+
+    Only the rows of a few blocks are held in memory at any time, so a
+    consumer can process all pairs without the n^2 matrix.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : None or string, optional (default=None)
+       If None, every edge has length 1 and breadth-first search is used.
+       Otherwise the edge attribute holding the edge length.
+
+    nodelist : list, optional
+       The entries of every row are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    sources : iterable, optional
+       The nodes whose rows are generated, in this order. If None, all
+       nodes in the order of nodelist.
+
+    dtype : NumPy data type, optional (default=float)
+       Floating point type of the row entries.
+
+    processes : int, optional
+       If given, the single-source searches are run in a pool of this
+       many worker processes. At most 2*processes blocks are computed
+       ahead of the consumer.
+
+    block_size : int, optional (default=256)
+       Number of rows computed by a worker at a time.
+
+    Returns
+    -------
+    rows : iterator
+       Iterator of (source, row) pairs where row[j] is the shortest path
+       length from source to nodelist[j], inf if there is no path.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> for source, row in nx.distance_rows(G, sources=[0]):
+    ...     print(row)
+    [0. 1. 2.]
+
+    See Also
+    --------
+    distance_matrix
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("distance_rows() requires NumPy: http://scipy.org/")
+    dtype = _float_dtype(dtype)
+    nodelist, indptr, indices, weights = nx.csr_arrays(G, weight, nodelist)
+    index = dict((v, i) for i, v in enumerate(nodelist))
+    if sources is None:
+        sources = nodelist
+    else:
+        sources = list(sources)
+    try:
+        rows = [index[s] for s in sources]
+    except KeyError as e:
+        raise nx.NetworkXError("Node %s not in graph." % (e.args[0],))
+    state = (indptr, indices, weights, dtype, None)
+    blocks = [rows[start:start + block_size]
+              for start in range(0, len(rows), block_size)]
+    for start, block in _blocks(state, blocks, processes):
+        for r in range(len(block)):
+            yield sources[start + r], block[r]
+
+
+def _blocks(state, blocks, processes):
+    # Generate (first row position, block) for the blocks of source
+    # indices in order, computed in this process or in a pool.
+    if processes is None:
+        state = _prepare(*state)
+        position = 0
+        for sources in blocks:
+            yield _compute_block(state, (position, sources))
+            position += len(sources)
+        return
+    from multiprocessing import Pool
+    def tasks():
+        position = 0
+        for sources in blocks:
+            yield position, sources
+            position += len(sources)
+    pool = Pool(processes, _init_worker, state)
+    try:
+        for result in _bounded_imap(pool, _run_worker, tasks(),
+                                    2 * processes):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+def _bounded_imap(pool, func, tasks, window):
+    # Like pool.imap(func, tasks), but at most window tasks are sent ahead
+    # of the consumer; imap would send all tasks at once and keep all
+    # results in the parent until they are consumed.
+    pending = deque()
+    for task in tasks:
+        if len(pending) >= window:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(func, (task,)))
+    while pending:
+        yield pending.popleft().get()
+
+def _float_dtype(dtype):
+    # missing paths are inf, so the entries must be floating point numbers
+    import numpy as np
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise nx.NetworkXError("dtype must be a floating point type, "
+                               "not %s." % dtype)
+    return dtype
+
+def _prepare(indptr, indices, weights, dtype, filename):
+    degree = indptr[1:] - indptr[:-1]
+    if weights is None:
+        dijkstra = None
+    else:
+        dijkstra = CSRDijkstra(indptr.tolist(), indices.tolist(),
+                               weights.tolist())
+    return (indptr, indices, degree, dijkstra, dtype, filename)
+
+# state of a worker process, set once by _init_worker so that the graph
+# is not sent again with every block
+_worker_state = None
+
+def _init_worker(*args):
+    global _worker_state
+    _worker_state = _prepare(*args)
+
+def _run_worker(task):
+    return _compute_block(_worker_state, task)
+
+def _compute_block(state, task):
+    # the rows of the sources in task as a block, written to the memmap
+    # file if there is one
+    import numpy as np
+    position, sources = task
+    indptr, indices, degree, dijkstra, dtype, filename = state
+    n = len(indptr) - 1
+    block = np.empty((len(sources), n), dtype=dtype)
+    block.fill(np.inf)
+    for r, s in enumerate(sources):
+        if dijkstra is None:
+            _bfs_row(indptr, indices, degree, s, block[r])
+        else:
+            order, distances, preds = dijkstra.search(s)
+            block[r, order] = distances
+    if filename is not None:
+        distance = np.memmap(filename, dtype=dtype, mode='r+', shape=(n, n))
+        distance[position:position + len(sources)] = block
+        distance.flush()
+        del distance
+        return position, None
+    return position, block
+
+def _bfs_row(indptr, indices, degree, s, row):
+    # breadth-first search from s, one whole level at a time
+    import numpy as np
+    row[s] = 0
+    frontier = np.array([s], dtype=indices.dtype)
+    d = 0
+    while len(frontier) > 0:
+        counts = degree[frontier]
+        total = counts.sum()
+        if total == 0:
+            break
+        offsets = np.cumsum(counts) - counts
+        arcs = np.repeat(indptr[frontier] - offsets, counts) + np.arange(total)
+        targets = indices[arcs]
+        frontier = np.unique(targets[np.isinf(row[targets])])
+        d += 1
+        row[frontier] = d
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
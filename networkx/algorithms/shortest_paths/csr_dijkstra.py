@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Dijkstra's algorithm on the arrays of CSRGraph and CSRDiGraph.
+
+The functions of weighted.py use these kernels when they are called
+with a CSR graph.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import math
+import threading
+import weakref
+import networkx as nx
+__author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
+__all__ = []
+
+# largest integer weight for which the bucket queue is used
+MAX_BUCKET_WEIGHT = 1000
+
+_INF = float('inf')
+
+class CSRDijkstra(object):
+    """Single-source shortest paths on CSR adjacency lists.
+
+    Distances and predecessors are kept in arrays over the node indices
+    that are allocated once per thread and reset after each search for
+    the nodes it reached. The adjacency is not changed by a search, so a
+    kernel can be shared by threads.
+
+    Parameters
+    ----------
+    indptr, indices, weights : sequences
+        CSR adjacency of the graph, see csr_arrays(). Weights must be
+        non-negative.
+
+    nodelist : list, optional
+        Node labels of the indices, used by lengths() and paths().
+
+    method : 'auto', 'heap' or 'bucket' (default='auto')
+        The priority queue. 'heap' is a binary heap indexed by node with
+        decrease-key, so it holds every node at most once. 'bucket' is a
+        circular bucket queue (Dial's algorithm) that needs integer
+        weights of at most MAX_BUCKET_WEIGHT and takes O(m + nC) time for
+        largest weight C. 'auto' uses the bucket queue if possible.
+    """
+    def __init__(self, indptr, indices, weights, nodelist=None,
+                 method='auto'):
+        self.indptr = list(indptr)
+        self.indices = list(indices)
+        self.weights = list(weights)
+        n = len(self.indptr) - 1
+        if nodelist is None:
+            nodelist = list(range(n))
+        self.nodelist = nodelist
+        self.index = dict((v, i) for i, v in enumerate(nodelist))
+        # the bucket queue selects buckets by integer distances, but returns
+        # the distances with the type of the weights
+        self._float = any(isinstance(w, float) for w in self.weights)
+        # inf and nan weights are left to the heap
+        integral = all(not (math.isinf(w) or math.isnan(w)) and w == int(w)
+                       for w in self.weights)
+        max_weight = max(self.weights) if self.weights else 0
+        if method == 'auto':
+            method = 'bucket' if (integral and
+                                  max_weight <= MAX_BUCKET_WEIGHT) else 'heap'
+        if method == 'bucket':
+            if not integral or max_weight > MAX_BUCKET_WEIGHT:
+                raise nx.NetworkXError("The bucket queue needs integer "
+                                       "weights up to %d." % MAX_BUCKET_WEIGHT)
+            self.weights = [int(w) for w in self.weights]
+            self._search = self._bucket_search
+            self._num_buckets = int(max_weight) + 1
+        elif method == 'heap':
+            self._search = self._heap_search
+        else:
+            raise nx.NetworkXError("Unknown method %s." % method)
+        self.method = method
+        self._local = threading.local()
+
+    def _state(self):
+        # the distance, predecessor and heap position arrays of this thread
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            n = len(self.indptr) - 1
+            state = self._local.state = ([_INF]*n, [-1]*n,
+                                         [-1]*n) # heap position, -2 settled
+        return state
+
+    def search(self, source, cutoff=None, target=None):
+        """Return the settled node indices in order of distance and their
+        distances and predecessors (-1 for the source)."""
+        if cutoff is None:
+            cutoff = _INF
+        dist, pred, pos = state = self._state()
+        order, reached = self._search(state, source, cutoff, target)
+        if self.method == 'bucket' and self._float:
+            # the source keeps distance 0 as with the heap
+            distances = [dist[order[0]]] + [float(dist[v]) for v in order[1:]]
+        else:
+            distances = [dist[v] for v in order]
+        preds = [pred[v] for v in order]
+        # reset the entries of all reached nodes, settled or not
+        for v in reached:
+            dist[v] = _INF
+            pred[v] = -1
+            pos[v] = -1
+        return order, distances, preds
+
+    def lengths(self, source, cutoff=None):
+        """Return a dictionary of shortest path lengths from the node
+        source, see single_source_dijkstra_path_length()."""
+        order, distances, preds = self.search(self.index[source], cutoff)
+        nodelist = self.nodelist
+        return dict(zip([nodelist[v] for v in order], distances))
+
+    def paths(self, source, cutoff=None, target=None):
+        """Return dictionaries of shortest path lengths and paths from the
+        node source, see single_source_dijkstra()."""
+        t = self.index.get(target, -1)
+        order, distances, preds = self.search(self.index[source], cutoff, t)
+        nodelist = self.nodelist
+        labels = [nodelist[v] for v in order]
+        paths = {source: [source]}
+        for v, p in zip(labels[1:], preds[1:]):
+            paths[v] = paths[nodelist[p]] + [v]
+        return dict(zip(labels, distances)), paths
+
+    def _heap_search(self, state, source, cutoff, target):
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        dist, pred, pos = state
+        heap = [source]
+        dist[source] = 0
+        pos[source] = 0
+        reached = [source]
+        order = []
+        while heap:
+            # pop the minimum and sift the last element down from the root
+            v = heap[0]
+            last = heap.pop()
+            if heap:
+                key = dist[last]
+                size = len(heap)
+                i = 0
+                child = 1
+                while child < size:
+                    right = child + 1
+                    if right < size and dist[heap[right]] < dist[heap[child]]:
+                        child = right
+                    c = heap[child]
+                    if dist[c] >= key:
+                        break
+                    heap[i] = c
+                    pos[c] = i
+                    i = child
+                    child = 2*i + 1
+                heap[i] = last
+                pos[last] = i
+            pos[v] = -2
+            order.append(v)
+            if v == target:
+                break
+            dv = dist[v]
+            for a in range(indptr[v], indptr[v+1]):
+                w = indices[a]
+                p = pos[w]
+                if p == -2:
+                    continue # already settled
+                vw_dist = dv + weights[a]
+                # an unreached node is reached even at infinite distance
+                if vw_dist > cutoff or (p != -1 and vw_dist >= dist[w]):
+                    continue
+                dist[w] = vw_dist
+                pred[w] = v
+                if p == -1: # insert at the end
+                    p = len(heap)
+                    heap.append(w)
+                    reached.append(w)
+                # decrease-key: sift w up from position p
+                while p > 0:
+                    parent = (p - 1) >> 1
+                    u = heap[parent]
+                    if dist[u] <= vw_dist:
+                        break
+                    heap[p] = u
+                    pos[u] = p
+                    p = parent
+                heap[p] = w
+                pos[w] = p
+        return order, reached
+
+    def _bucket_search(self, state, source, cutoff, target):
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        dist, pred, pos = state
+        num_buckets = self._num_buckets
+        # bucket d % num_buckets holds the nodes with tentative distance d;
+        # entries whose distance decreased since are skipped
+        buckets = [[] for i in range(num_buckets)]
+        buckets[0].append(source)
+        dist[source] = 0
+        pos[source] = 0
+        reached = [source]
+        order = []
+        pending = 1
+        d = 0
+        while pending:
+            bucket = buckets[d % num_buckets]
+            i = 0
+            while i < len(bucket): # zero weights append to this bucket
+                v = bucket[i]
+                i += 1
+                if pos[v] == -2 or dist[v] != d:
+                    continue
+                pos[v] = -2
+                order.append(v)
+                if v == target:
+                    return order, reached
+                for a in range(indptr[v], indptr[v+1]):
+                    w = indices[a]
+                    vw_dist = d + weights[a]
+                    if pos[w] == -2 or vw_dist > cutoff or vw_dist >= dist[w]:
+                        continue
+                    if pos[w] == -1:
+                        pos[w] = 0
+                        reached.append(w)
+                    dist[w] = vw_dist
+                    pred[w] = v
+                    buckets[vw_dist % num_buckets].append(w)
+                    pending += 1
+            pending -= len(bucket)
+            del bucket[:]
+            d += 1
+        return order, reached
+
+
+# kernels of CSRGraph and CSRDiGraph, which cannot change, per graph and
+# weight; None if the graph has negative weights. A kernel holds only the
+# adjacency and per-thread search arrays, so sharing it is thread safe.
+_kernels = weakref.WeakKeyDictionary()
+
+def csr_kernel(G, weight):
+    """Return the Dijkstra kernel of a CSR graph G for the edge attribute
+    weight, or None if G is not a CSR graph or has negative weights."""
+    if not isinstance(G, (nx.CSRGraph, nx.CSRDiGraph)):
+        return None
+    kernels = _kernels.setdefault(G, {})
+    if weight not in kernels:
+        kernels[weight] = None
+        try:
+            nodelist, indptr, indices, weights = nx.csr_arrays(G, weight)
+        except ImportError:
+            return None
+        if weights is None:
+            weights = [1]*len(indices)
+        else:
+            weights = weights.tolist()
+        if all(w >= 0 for w in weights):
+            kernels[weight] = CSRDijkstra(indptr.tolist(), indices.tolist(),
+                                          weights, nodelist=nodelist)
+    return kernels[weight]
@@ -7,11 +7,15 @@
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+import os
 import networkx as nx
+from networkx.algorithms.shortest_paths.all_pairs import _float_dtype
 __author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
 __all__ = ['floyd_warshall',
            'floyd_warshall_predecessor_and_distance',
-           'floyd_warshall_numpy']
+           'floyd_warshall_numpy',
+           'floyd_warshall_blocked',
+           'floyd_warshall_path']
 
 def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -56,6 +60,301 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
         A = np.minimum(A, A[i,:] + A[:,i])
     return A
 
+def floyd_warshall_blocked(G, nodelist=None, weight='weight', dtype=float,
+                           predecessors=False, filename=None,
+                           predecessor_filename=None, block_size=256,
+                           processes=None):
+    """Find all-pairs shortest path lengths using a blocked Floyd's
+    algorithm on NumPy arrays.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    weight: string, optional (default= 'weight')
+       Edge data key corresponding to the edge weight, edges without it
+       have weight 1. For multigraphs the smallest weight is used.
+
+    dtype : NumPy data type, optional (default=float)
+       Floating point type of the distances; float32 halves the memory.
+
+    predecessors : bool, optional (default=False)
+       If True, also return the matrix of predecessors.
+
+    filename : string, optional
+       If given, the distance matrix is a NumPy memmap stored in this
+       file, for matrices larger than the memory.
+
+    predecessor_filename : string, optional
+       If given, the predecessor matrix is a memmap stored in this file.
+
+    block_size : int, optional (default=256)
+       Size of the square tiles the matrix is processed in.
+
+    processes : int, optional
+       If given, the independent tiles of each step are updated by a pool
+       of this many worker processes. They share the matrices through
+       memmap files, temporary ones if no filenames are given.
+
+    Returns
+    -------
+    distance : NumPy array or memmap
+        Matrix with distance[i,j] the shortest path length from
+        nodelist[i] to nodelist[j]. If there is no path the entry is inf.
+
+    predecessor : NumPy array or memmap
+        Only if predecessors is True. Matrix of int32 with
+        predecessor[i,j] the index in nodelist of the node before
+        nodelist[j] on a shortest path from nodelist[i], -1 if there is
+        no path or i == j. See floyd_warshall_path().
+
+    Raises
+    ------
+    NetworkXUnbounded
+        If the graph has a negative cycle.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> distance, predecessor = nx.floyd_warshall_blocked(G,
+    ...                                    predecessors=True, block_size=2)
+    >>> print(distance[0])
+    [0. 1. 2. 3.]
+    >>> nx.floyd_warshall_path(predecessor, G.nodes(), 0, 3)
+    [0, 1, 2, 3]
+
+    Notes
+    -----
+    The matrix is divided into tiles of block_size x block_size. For
+    every diagonal tile k, the tile itself, then the other tiles in row
+    and column k, then all remaining tiles are updated with the paths
+    through the nodes of tile k [1]_. Each update only touches three
+    tiles, which stay in the cache, and the tiles within the last two
+    steps are independent of each other. The running time is O(n^3)
+    and memory, without memmaps, O(n^2).
+
+    References
+    ----------
+    .. [1] Gayathri Venkataraman, Sartaj Sahni and Srabani Mukhopadhyaya:
+       A Blocked All-Pairs Shortest-Paths Algorithm.
+       Journal of Experimental Algorithmics 8, 2003.
+
+    See Also
+    --------
+    floyd_warshall_numpy
+    floyd_warshall_path
+    distance_matrix
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+          "floyd_warshall_blocked() requires NumPy: http://scipy.org/")
+    dtype = _float_dtype(dtype)
+    nodelist, indptr, indices, weights = nx.csr_arrays(G, weight, nodelist)
+    n = len(nodelist)
+    if weights is None:
+        weights = np.ones(len(indices))
+    tempdir = None
+    if processes is not None and (filename is None or
+                                  (predecessors and
+                                   predecessor_filename is None)):
+        import tempfile
+        tempdir = tempfile.mkdtemp()
+    try:
+        if filename is None and tempdir is not None:
+            distance = _matrix(os.path.join(tempdir, 'distance'), n, dtype)
+        else:
+            distance = _matrix(filename, n, dtype)
+        predecessor = None
+        if predecessors:
+            if predecessor_filename is None and tempdir is not None:
+                predecessor = _matrix(os.path.join(tempdir, 'predecessor'),
+                                      n, np.int32)
+            else:
+                predecessor = _matrix(predecessor_filename, n, np.int32)
+        # initialize a strip of rows at a time
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            rows = np.repeat(np.arange(stop - start),
+                             indptr[start+1:stop+1] - indptr[start:stop])
+            cols = indices[indptr[start]:indptr[stop]]
+            strip = np.empty((stop - start, n), dtype=dtype)
+            strip.fill(np.inf)
+            strip[rows, cols] = weights[indptr[start]:indptr[stop]]
+            diagonal = np.arange(stop - start)
+            strip[diagonal, diagonal + start] = np.minimum(
+                strip[diagonal, diagonal + start], 0)
+            distance[start:stop] = strip
+            if predecessors:
+                strip = np.empty((stop - start, n), dtype=np.int32)
+                strip.fill(-1)
+                strip[rows, cols] = rows + start
+                strip[diagonal, diagonal + start] = -1
+                predecessor[start:stop] = strip
+        if processes is None:
+            pool = None
+        else:
+            from multiprocessing import Pool
+            _flush(distance, predecessor)
+            pool = Pool(processes, _init_worker,
+                        (distance.filename, _filename(predecessor),
+                         n, dtype, block_size))
+        try:
+            _blocked_floyd_warshall(distance, predecessor, n, block_size,
+                                    pool)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        if (np.diagonal(distance) < 0).any():
+            raise nx.NetworkXUnbounded("Negative cost cycle detected.")
+        if tempdir is not None:
+            if filename is None:
+                distance = np.array(distance)
+            if predecessors and predecessor_filename is None:
+                predecessor = np.array(predecessor)
+        _flush(distance, predecessor)
+    finally:
+        if tempdir is not None:
+            import shutil
+            shutil.rmtree(tempdir, ignore_errors=True)
+    if predecessors:
+        return distance, predecessor
+    return distance
+
+
+def floyd_warshall_path(predecessor, nodelist, source, target):
+    """Return a shortest path from source to target using the
+    predecessor matrix of floyd_warshall_blocked().
+
+    Parameters
+    ----------
+    predecessor : NumPy array
+       Predecessor matrix returned by floyd_warshall_blocked().
+
+    nodelist : list
+       The nodes in the order of the rows and columns of predecessor.
+
+    source, target : nodes
+       Start and end of the path.
+
+    Returns
+    -------
+    path : list
+       The nodes of a shortest path from source to target.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If there is no path from source to target.
+    """
+    index = dict((v, i) for i, v in enumerate(nodelist))
+    s, t = index[source], index[target]
+    path = [t]
+    while path[-1] != s:
+        u = int(predecessor[s, path[-1]])
+        if u < 0:
+            raise nx.NetworkXNoPath("node %s not reachable from %s" %
+                                    (target, source))
+        path.append(u)
+    return [nodelist[v] for v in reversed(path)]
+
+
+def _matrix(filename, n, dtype):
+    import numpy as np
+    if filename is None:
+        return np.empty((n, n), dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode='w+', shape=(n, n))
+
+def _filename(matrix):
+    return getattr(matrix, 'filename', None)
+
+def _flush(*matrices):
+    for matrix in matrices:
+        if hasattr(matrix, 'flush'):
+            matrix.flush()
+
+def _blocked_floyd_warshall(distance, predecessor, n, block_size, pool):
+    # the three steps of the blocked algorithm for every diagonal tile k;
+    # a task (i,j,k) updates tile (i,j) with the paths through tile k
+    num = (n + block_size - 1) // block_size
+    state = (distance, predecessor, block_size)
+    for k in range(num):
+        _update_tile(state, (k, k, k))
+        tasks = [(k, j, k) for j in range(num) if j != k]
+        tasks.extend((i, k, k) for i in range(num) if i != k)
+        _run_tasks(state, tasks, pool)
+        tasks = [(i, j, k) for i in range(num) if i != k
+                 for j in range(num) if j != k]
+        _run_tasks(state, tasks, pool)
+
+def _run_tasks(state, tasks, pool):
+    if pool is None:
+        for task in tasks:
+            _update_tile(state, task)
+    else:
+        _flush(state[0], state[1])
+        pool.map(_run_worker, tasks)
+
+def _update_tile(state, task):
+    # update tile (i,j) with the paths through the nodes of tile k, in
+    # memory and written back; tiles in row or column k are updated from
+    # themselves
+    import numpy as np
+    distance, predecessor, block_size = state
+    i, j, k = task
+    I = slice(i*block_size, (i+1)*block_size)
+    J = slice(j*block_size, (j+1)*block_size)
+    K = slice(k*block_size, (k+1)*block_size)
+    dik = np.array(distance[I, K])
+    dkj = np.array(distance[K, J])
+    if i != k and j != k and not (np.isfinite(dik).any() and
+                                  np.isfinite(dkj).any()):
+        return # no paths through tile k, as is common in sparse graphs
+    dij = np.array(distance[I, J])
+    if j == k:
+        dik = dij
+    if i == k:
+        dkj = dij
+    if predecessor is not None:
+        pij = np.array(predecessor[I, J])
+        pkj = pij if i == k else np.array(predecessor[K, J])
+    through = np.empty_like(dij)
+    if predecessor is not None:
+        shorter = np.empty(dij.shape, dtype=bool)
+    for kk in range(dik.shape[1]):
+        np.add(dik[:, kk, None], dkj[kk], out=through)
+        if predecessor is not None:
+            np.less(through, dij, out=shorter)
+            np.copyto(pij, pkj[kk], where=shorter)
+        np.minimum(dij, through, out=dij)
+    distance[I, J] = dij
+    if predecessor is not None:
+        predecessor[I, J] = pij
+
+# memmaps of a worker process, opened once by _init_worker
+_worker_state = None
+
+def _init_worker(filename, predecessor_filename, n, dtype, block_size):
+    global _worker_state
+    import numpy as np
+    distance = np.memmap(filename, dtype=dtype, mode='r+', shape=(n, n))
+    predecessor = None
+    if predecessor_filename is not None:
+        predecessor = np.memmap(predecessor_filename, dtype=np.int32,
+                                mode='r+', shape=(n, n))
+    _worker_state = (distance, predecessor, block_size)
+
+def _run_worker(task):
+    _update_tile(_worker_state, task)
+    _flush(_worker_state[0], _worker_state[1])
+
+
 def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
 
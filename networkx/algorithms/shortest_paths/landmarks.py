@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Point-to-point shortest path queries with a precomputed landmark index.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from heapq import heappush, heappop
+import os
+import random
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+import networkx as nx
+from networkx.algorithms.shortest_paths.csr_dijkstra import CSRDijkstra
+__author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
+__all__ = ['LandmarkIndex']
+
+# names of the arrays stored by LandmarkIndex.save()
+_ARRAYS = ('indptr', 'indices', 'weights', 'rindptr', 'rindices',
+           'rweights', 'landmarks', 'from_landmarks', 'to_landmarks')
+
+class LandmarkIndex(object):
+    """Index for repeated shortest path queries between pairs of nodes.
+
+    The index stores the graph as compressed sparse rows together with the
+    shortest path lengths from and to a small set of landmark nodes. By
+    the triangle inequality these give lower bounds on the distance
+    between any two nodes, which guide an A* search towards the target
+    (the ALT algorithm [1]_), so a query settles only a fraction of the
+    nodes Dijkstra's algorithm would.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       Graph or DiGraph, multigraphs use the smallest weight of parallel
+       edges. Later changes of G are not reflected in the index.
+
+    weight : None or string, optional (default='weight')
+       Edge data key of the edge length, edges without it have length 1.
+       If None, every edge has length 1. Lengths must not be negative.
+
+    landmarks : int, optional (default=16)
+       Number of landmarks. More landmarks give tighter bounds at the cost
+       of 8n bytes each (16n for directed graphs).
+
+    seed : hashable, optional (default=None)
+       Seed of the random choice of the first landmark.
+
+    active : int, optional (default=4)
+       Number of landmarks with the best bounds used by a query.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> index = nx.LandmarkIndex(G, landmarks=4, seed=1)
+    >>> index.distance((0, 0), (9, 9))
+    18.0
+    >>> len(index.path((0, 0), (9, 9)))
+    19
+
+    The index can be saved to a directory and loaded with its arrays
+    mapped into memory:
+
+    >>> import tempfile
+    >>> path = tempfile.mkdtemp()
+    >>> index.save(path)
+    >>> index = nx.LandmarkIndex.load(path)
+    >>> index.distance((0, 0), (9, 9))
+    18.0
+
+    Notes
+    -----
+    Landmarks are chosen one by one as the node farthest from those
+    already chosen, which places them at the periphery of the graph and
+    in every connected component. Building the index takes one run of
+    Dijkstra's algorithm per landmark, two for directed graphs.
+
+    The files written by save() are NumPy .npy arrays and a pickle of
+    the node labels. The landmark distances are read from the files on
+    demand, the adjacency is read into memory on the first query.
+
+    References
+    ----------
+    .. [1] Andrew V. Goldberg and Chris Harrelson:
+       Computing the Shortest Path: A* Search Meets Graph Theory.
+       Proceedings of SODA 2005, 156-165.
+
+    See Also
+    --------
+    dijkstra_path_length
+    bidirectional_dijkstra
+    astar_path
+    """
+    def __init__(self, G, weight='weight', landmarks=16, seed=None,
+                 active=4):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "LandmarkIndex requires NumPy: http://scipy.org/")
+        nodelist, indptr, indices, weights = nx.csr_arrays(G, weight)
+        n = len(nodelist)
+        if weights is None:
+            weights = np.ones(len(indices))
+        if (weights < 0).any():
+            raise nx.NetworkXError("LandmarkIndex does not support negative "
+                                   "edge weights.")
+        self.directed = G.is_directed()
+        self.weight = weight
+        self.active = active
+        arrays = {'indptr': indptr, 'indices': indices, 'weights': weights}
+        if self.directed: # the adjacency of the reverse graph
+            counts = indptr[1:] - indptr[:-1]
+            tails = np.repeat(np.arange(n, dtype=indices.dtype), counts)
+            order = np.argsort(indices, kind='mergesort')
+            arrays['rindptr'] = np.concatenate(
+                ([0], np.cumsum(np.bincount(indices, minlength=n))))
+            arrays['rindices'] = tails[order]
+            arrays['rweights'] = weights[order]
+        forward = CSRDijkstra(indptr, indices, weights)
+        if self.directed:
+            backward = CSRDijkstra(arrays['rindptr'], arrays['rindices'],
+                                   arrays['rweights'])
+        chosen = []
+        num = min(landmarks, n)
+        from_landmarks = np.empty((num, n))
+        if self.directed:
+            to_landmarks = np.empty((num, n))
+        else: # d(v,l) = d(l,v)
+            to_landmarks = from_landmarks
+        closest = np.empty(n)
+        closest.fill(np.inf)
+        random.seed(seed)
+        u = random.randrange(n) if n > 0 else None
+        for l in range(num):
+            chosen.append(u)
+            row = from_landmarks[l]
+            row.fill(np.inf)
+            order, distances, preds = forward.search(u)
+            row[order] = distances
+            if self.directed:
+                row = to_landmarks[l]
+                row.fill(np.inf)
+                order, distances, preds = backward.search(u)
+                row[order] = distances
+            # the next landmark is the node farthest from all landmarks,
+            # unreachable nodes first
+            distance = np.minimum(from_landmarks[l], to_landmarks[l])
+            closest = np.minimum(closest, distance)
+            closest[chosen] = -1
+            u = int(closest.argmax())
+        arrays['landmarks'] = np.array(chosen, dtype=int)
+        arrays['from_landmarks'] = from_landmarks
+        if self.directed:
+            arrays['to_landmarks'] = to_landmarks
+        self._setup(nodelist, arrays)
+
+    def _setup(self, nodelist, arrays):
+        if 'to_landmarks' not in arrays:
+            arrays['to_landmarks'] = arrays['from_landmarks']
+        self.nodelist = nodelist
+        self._index = dict((v, i) for i, v in enumerate(nodelist))
+        self._arrays = arrays
+        self._lists = None
+
+    @property
+    def landmarks(self):
+        """The landmark nodes."""
+        return [self.nodelist[u] for u in self._arrays['landmarks']]
+
+    def save(self, path):
+        """Write the index to the directory path, which is created if
+        it does not exist."""
+        import numpy as np
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for name, array in self._arrays.items():
+            if name == 'to_landmarks' and not self.directed:
+                continue
+            np.save(os.path.join(path, name + '.npy'), array)
+        meta = {'nodelist': self.nodelist, 'weight': self.weight,
+                'directed': self.directed, 'active': self.active}
+        with open(os.path.join(path, 'index.pickle'), 'wb') as f:
+            pickle.dump(meta, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Read an index written by save() from the directory path.
+
+        If mmap is True the arrays are memory mapped read-only instead of
+        read into memory.
+        """
+        import numpy as np
+        with open(os.path.join(path, 'index.pickle'), 'rb') as f:
+            meta = pickle.load(f)
+        arrays = {}
+        for name in _ARRAYS:
+            filename = os.path.join(path, name + '.npy')
+            if os.path.exists(filename):
+                arrays[name] = np.load(filename,
+                                       mmap_mode='r' if mmap else None)
+        index = cls.__new__(cls)
+        index.weight = meta['weight']
+        index.directed = meta['directed']
+        index.active = meta['active']
+        index._setup(meta['nodelist'], arrays)
+        return index
+
+    def distance(self, source, target):
+        """Return the shortest path length from source to target.
+
+        Raises NetworkXNoPath if there is no path.
+        """
+        return self._search(source, target)[0]
+
+    def path(self, source, target):
+        """Return a shortest path from source to target as a list of
+        nodes.
+
+        Raises NetworkXNoPath if there is no path.
+        """
+        length, pred, t = self._search(source, target)
+        nodelist = self.nodelist
+        path = [t]
+        while pred[path[-1]] != -1:
+            path.append(pred[path[-1]])
+        return [nodelist[v] for v in reversed(path)]
+
+    def _search(self, source, target):
+        # A* search from source to target; returns the length, the
+        # predecessors of the search tree and the index of target
+        try:
+            s = self._index[source]
+            t = self._index[target]
+        except KeyError as e:
+            raise nx.NetworkXError("Node %s not in graph." % (e.args[0],))
+        if self._lists is None: # scalar access is faster on lists
+            a = self._arrays
+            self._lists = (a['indptr'].tolist(), a['indices'].tolist(),
+                           a['weights'].tolist())
+        import numpy as np
+        with np.errstate(invalid='ignore'): # inf - inf in the bounds is nan
+            result = self._astar(s, t)
+        if result is None:
+            raise nx.NetworkXNoPath("node %s not reachable from %s" %
+                                    (target, source))
+        return result
+
+    def _astar(self, s, t):
+        indptr, indices, weights = self._lists
+        bound = self._lower_bound(s, t)
+        dist = {s: 0}
+        pred = {s: -1}
+        estimate = {}
+        settled = set()
+        fringe = [(bound(s), s)]
+        while fringe:
+            f, v = heappop(fringe)
+            if v in settled:
+                continue
+            if v == t:
+                return dist[t], pred, t
+            settled.add(v)
+            dv = dist[v]
+            for a in range(indptr[v], indptr[v+1]):
+                w = indices[a]
+                vw_dist = dv + weights[a]
+                if w in settled or vw_dist >= dist.get(w, vw_dist + 1):
+                    continue
+                dist[w] = vw_dist
+                pred[w] = v
+                h = estimate.get(w)
+                if h is None:
+                    h = estimate[w] = bound(w)
+                if h < float('inf'):
+                    heappush(fringe, (vw_dist + h, w))
+        return None
+
+    def _lower_bound(self, s, t):
+        # function v -> lower bound on the distance from v to t, using the
+        # active landmarks with the best bounds for the distance s to t
+        a = self._arrays
+        rows = []
+        for l in range(len(a['landmarks'])):
+            from_l, to_l = a['from_landmarks'][l], a['to_landmarks'][l]
+            rows.append((from_l, to_l, float(from_l[t]), float(to_l[t])))
+        def bound(v, rows=rows):
+            # by d(l,v) + d(v,t) >= d(l,t) and d(v,t) + d(t,l) >= d(v,l);
+            # the comparisons are false for nan if both distances are inf
+            h = 0.0
+            for from_l, to_l, ft, tt in rows:
+                b = ft - from_l[v]
+                if b > h:
+                    h = b
+                b = to_l[v] - tt
+                if b > h:
+                    h = b
+            return float(h)
+        if len(rows) > self.active:
+            rows.sort(key=lambda r: -bound(s, [r]))
+            del rows[self.active:]
+        return bound
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+import os
+import tempfile
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+
+class TestDistanceMatrix:
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G=nx.gnp_random_graph(40,0.06,seed=3,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%5+0.5
+        self.G=G
+
+    def check(self, D, G, weight, nodelist=None):
+        if nodelist is None:
+            nodelist=G.nodes()
+        if weight is None:
+            answer=nx.all_pairs_shortest_path_length(G)
+        else:
+            answer=nx.all_pairs_dijkstra_path_length(G,weight=weight)
+        assert_equal(D.shape,(len(nodelist),len(nodelist)))
+        for i,u in enumerate(nodelist):
+            for j,v in enumerate(nodelist):
+                assert_equal(D[i,j],answer[u].get(v,np.inf))
+
+    def test_unweighted(self):
+        self.check(nx.distance_matrix(self.G),self.G,None)
+        G=nx.CSRGraph(nx.karate_club_graph())
+        self.check(nx.distance_matrix(G),G,None)
+
+    def test_weighted(self):
+        D=nx.distance_matrix(self.G,weight='weight',block_size=7)
+        self.check(D,self.G,'weight')
+
+    def test_nodelist(self):
+        nodelist=list(reversed(self.G.nodes()))
+        D=nx.distance_matrix(self.G,nodelist=nodelist,dtype=np.float32)
+        assert_equal(D.dtype,np.float32)
+        self.check(D,self.G,None,nodelist)
+
+    def test_processes(self):
+        D=nx.distance_matrix(self.G,weight='weight',processes=2,
+                             block_size=5)
+        self.check(D,self.G,'weight')
+
+    def test_memmap(self):
+        fd,fname=tempfile.mkstemp()
+        os.close(fd)
+        try:
+            for processes in [None,2]:
+                D=nx.distance_matrix(self.G,filename=fname,
+                                     processes=processes,block_size=9)
+                self.check(D,self.G,None)
+                del D
+                D=np.memmap(fname,dtype=float,mode='r',shape=(40,40))
+                self.check(D,self.G,None)
+                del D
+        finally:
+            os.unlink(fname)
+
+    def test_rows(self):
+        D=nx.distance_matrix(self.G,weight='weight')
+        nodelist=self.G.nodes()
+        for processes in [None,2]:
+            rows=list(nx.distance_rows(self.G,weight='weight',
+                                       processes=processes,block_size=3))
+            assert_equal([s for s,row in rows],nodelist)
+            for i,(s,row) in enumerate(rows):
+                assert_true((row==D[i]).all())
+        rows=list(nx.distance_rows(self.G,sources=[5,2]))
+        assert_equal([s for s,row in rows],[5,2])
+        assert_raises(nx.NetworkXError,list,nx.distance_rows(self.G,
+                                                             sources=[-1]))
+
+    def test_bounded_imap(self):
+        # the tasks sent ahead of the consumer are bounded by the window
+        from networkx.algorithms.shortest_paths.all_pairs import _bounded_imap
+        sent=[]
+        class Result(object):
+            def __init__(self, value):
+                self.value=value
+            def get(self):
+                return self.value
+        class Pool(object):
+            def apply_async(self, func, args):
+                sent.append(args[0])
+                return Result(func(*args))
+        results=_bounded_imap(Pool(),lambda x:x*x,iter(range(20)),4)
+        for i,result in enumerate(results):
+            assert_equal(result,i*i)
+            assert_true(len(sent)-i<=4)
+        assert_equal(sent,list(range(20)))
+
+    def test_empty(self):
+        assert_equal(nx.distance_matrix(nx.Graph()).shape,(0,0))
+        assert_equal(list(nx.distance_rows(nx.Graph())),[])
+
+    def test_dtype(self):
+        D=nx.distance_matrix(self.G,dtype=np.float32)
+        assert_equal(D.dtype,np.float32)
+        assert_raises(nx.NetworkXError,nx.distance_matrix,self.G,dtype=int)
+        assert_raises(nx.NetworkXError,list,nx.distance_rows(self.G,
+                                                             dtype=np.int32))
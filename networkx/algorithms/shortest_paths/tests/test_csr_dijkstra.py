@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+from networkx.algorithms.shortest_paths.csr_dijkstra import CSRDijkstra, csr_kernel
+
+class TestCSRDijkstra:
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G=nx.gnp_random_graph(60,0.08,seed=5,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%7
+            G[u][v]['cost']=i%4+0.25
+        self.G=G
+
+    def kernel(self, G, weight, method):
+        nodelist,indptr,indices,weights=nx.csr_arrays(G,weight)
+        return CSRDijkstra(indptr,indices,weights,nodelist,method=method)
+
+    def check_path(self, G, path, length, weight):
+        assert_equal(sum(G[u][v].get(weight,1)
+                         for u,v in zip(path[:-1],path[1:])),length)
+
+    def test_methods(self):
+        for weight in ('weight','cost'):
+            methods=['heap']
+            if weight=='weight':
+                methods.append('bucket')
+            answer=nx.single_source_dijkstra_path_length(self.G,0,
+                                                         weight=weight)
+            for method in methods:
+                k=self.kernel(self.G,weight,method)
+                assert_equal(k.method,method)
+                for cutoff in (None,3):
+                    expected=dict((v,d) for v,d in answer.items()
+                                  if cutoff is None or d<=cutoff)
+                    assert_equal(k.lengths(0,cutoff),expected)
+                length,path=k.paths(0)
+                assert_equal(length,answer)
+                for v in path:
+                    assert_equal(path[v][0],0)
+                    assert_equal(path[v][-1],v)
+                    self.check_path(self.G,path[v],length[v],weight)
+
+    def test_auto(self):
+        assert_equal(self.kernel(self.G,'weight','auto').method,'bucket')
+        assert_equal(self.kernel(self.G,'cost','auto').method,'heap')
+        assert_raises(nx.NetworkXError,self.kernel,self.G,'cost','bucket')
+        assert_raises(nx.NetworkXError,self.kernel,self.G,'cost','fibonacci')
+
+    def test_repeated_searches(self):
+        # the arrays are reset between searches
+        k=self.kernel(self.G,'cost','heap')
+        for s in self.G:
+            assert_equal(k.lengths(s),
+                         nx.single_source_dijkstra_path_length(self.G,s,
+                                                               weight='cost'))
+
+    def test_zero_weights(self):
+        G=nx.DiGraph([(0,1,{'weight':0}),(1,2,{'weight':0}),
+                      (0,2,{'weight':1}),(2,3,{'weight':2})])
+        for method in ('heap','bucket'):
+            k=self.kernel(G,'weight',method)
+            assert_equal(k.lengths(0),{0:0,1:0,2:0,3:2})
+
+    def test_infinite_weights(self):
+        # inf and nan weights use the heap instead of failing
+        G=nx.Graph([(0,1,{'weight':float('inf')}),(1,2,{'weight':1})])
+        assert_equal(self.kernel(G,'weight','auto').method,'heap')
+        assert_raises(nx.NetworkXError,self.kernel,G,'weight','bucket')
+        C=nx.CSRGraph(G)
+        assert_equal(nx.single_source_dijkstra_path_length(C,0),
+                     nx.single_source_dijkstra_path_length(G,0))
+        G=nx.Graph([(0,1,{'weight':float('nan')}),(0,2,{'weight':1}),
+                    (2,3,{'weight':2})])
+        assert_equal(self.kernel(G,'weight','auto').method,'heap')
+        length=nx.single_source_dijkstra_path_length(nx.CSRGraph(G),0)
+        assert_equal(sorted(length),[0,1,2,3])
+        assert_equal((length[2],length[3]),(1,3))
+
+    def test_distance_types(self):
+        # the bucket queue returns distances with the type of the weights
+        k=CSRDijkstra([0,1,3,4],[1,0,2,1],[2,2,3,3],method='bucket')
+        length=k.lengths(0)
+        assert_equal(length,{0:0,1:2,2:5})
+        assert_true(all(isinstance(d,int) for d in length.values()))
+        G=nx.Graph([(0,1,{'weight':2.0}),(1,2,{'weight':1.0})])
+        C=nx.CSRGraph(G)
+        assert_equal(csr_kernel(C,'weight').method,'bucket')
+        length=nx.single_source_dijkstra_path_length(C,0)
+        answer=nx.single_source_dijkstra_path_length(G,0)
+        assert_equal(length,answer)
+        assert_equal([type(length[v]) for v in G],[type(answer[v]) for v in G])
+
+    def test_dispatch(self):
+        C=nx.CSRDiGraph(self.G)
+        for weight in ('weight','cost',None):
+            assert_equal(nx.single_source_dijkstra_path_length(C,0,
+                                                               weight=weight),
+                         nx.single_source_dijkstra_path_length(self.G,0,
+                                                               weight=weight))
+        length,path=nx.single_source_dijkstra(C,0,cutoff=2,weight='cost')
+        assert_equal(length,nx.single_source_dijkstra_path_length(
+                self.G,0,cutoff=2,weight='cost'))
+        for v in path:
+            self.check_path(self.G,path[v],length[v],'cost')
+        target=max(length,key=length.get)
+        assert_equal(nx.dijkstra_path_length(C,0,target,weight='cost'),
+                     length[target])
+        self.check_path(self.G,nx.dijkstra_path(C,0,target,weight='cost'),
+                        length[target],'cost')
+        assert_raises(KeyError,nx.single_source_dijkstra_path_length,C,-1)
+
+    def test_undirected(self):
+        G=nx.Graph(self.G)
+        C=nx.CSRGraph(G)
+        for s in (0,10,20):
+            assert_equal(nx.single_source_dijkstra_path_length(C,s),
+                         nx.single_source_dijkstra_path_length(G,s))
+
+    def test_negative_weights(self):
+        # graphs with negative weights use the dictionary implementation
+        G=nx.DiGraph([(0,1,{'weight':2}),(0,2,{'weight':3}),
+                      (2,1,{'weight':-2})])
+        C=nx.CSRDiGraph(G)
+        assert_raises(ValueError,nx.single_source_dijkstra_path_length,C,0)
+
+    def test_threads(self):
+        # the cached kernel of a graph is shared by concurrent calls
+        import threading
+        C=nx.CSRDiGraph(self.G)
+        expected=dict((s,nx.single_source_dijkstra_path_length(self.G,s))
+                      for s in self.G)
+        errors=[]
+        def run(sources):
+            for s in sources:
+                if nx.single_source_dijkstra_path_length(C,s)!=expected[s]:
+                    errors.append(s)
+        threads=[threading.Thread(target=run,args=(list(self.G)*3,))
+                 for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert_equal(errors,[])
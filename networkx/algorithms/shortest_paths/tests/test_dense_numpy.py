@@ -51,3 +51,105 @@ class TestFloydNumpy(object):
         pred,dist = nx.floyd_warshall_predecessor_and_distance(G)
         D = nx.utils.dict_to_numpy_array(dist)
         assert_equal(nx.floyd_warshall_numpy(G),D)
+
+
+class TestFloydBlocked(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        global assert_equal
+        global assert_almost_equal
+        try:
+            import numpy
+            from numpy.testing import assert_equal,assert_almost_equal
+        except ImportError:
+             raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G=nx.gnp_random_graph(30,0.1,seed=4,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=(i%7)-1.5 if i%11==0 else i%7+0.5
+        self.G=G
+
+    def check_paths(self, G, D, P, nodelist):
+        for i,u in enumerate(nodelist):
+            for j,v in enumerate(nodelist):
+                if numpy.isinf(D[i,j]):
+                    assert_raises(nx.NetworkXNoPath,nx.floyd_warshall_path,
+                                  P,nodelist,u,v)
+                    continue
+                path=nx.floyd_warshall_path(P,nodelist,u,v)
+                assert_equal(path[0],u)
+                assert_equal(path[-1],v)
+                length=sum(G[a][b].get('weight',1)
+                           for a,b in zip(path[:-1],path[1:]))
+                assert_almost_equal(length,D[i,j])
+
+    def test_blocked(self):
+        # a few negative weights, but no negative cycle
+        pred,dist=nx.floyd_warshall_predecessor_and_distance(self.G)
+        nodelist=self.G.nodes()
+        for block_size in (1,4,7,30,64):
+            D=nx.floyd_warshall_blocked(self.G,block_size=block_size)
+            assert_almost_equal(D,nx.utils.dict_to_numpy_array(dist,
+                                    mapping=dict((v,i) for i,v in
+                                                 enumerate(nodelist))))
+            D,P=nx.floyd_warshall_blocked(self.G,predecessors=True,
+                                          block_size=block_size)
+            self.check_paths(self.G,D,P,nodelist)
+
+    def test_undirected_nodelist(self):
+        G=nx.Graph(self.G)
+        for u,v in G.edges():
+            G[u][v]['weight']=abs(G[u][v]['weight'])
+        G.add_edge(100,101)
+        nodelist=list(reversed(G.nodes()))
+        D,P=nx.floyd_warshall_blocked(G,nodelist=nodelist,
+                                      predecessors=True,block_size=8)
+        A=nx.floyd_warshall_numpy(G,nodelist=nodelist)
+        assert_almost_equal(D,numpy.asarray(A))
+        self.check_paths(G,D,P,nodelist)
+
+    def test_memmap_processes(self):
+        import os
+        import shutil
+        import tempfile
+        D,P=nx.floyd_warshall_blocked(self.G,predecessors=True,block_size=8)
+        path=tempfile.mkdtemp()
+        try:
+            filename=os.path.join(path,'distance')
+            pfilename=os.path.join(path,'predecessor')
+            for processes in (None,2):
+                D2,P2=nx.floyd_warshall_blocked(self.G,predecessors=True,
+                                                filename=filename,
+                                                predecessor_filename=pfilename,
+                                                block_size=8,
+                                                processes=processes)
+                assert_true(isinstance(D2,numpy.memmap))
+                assert_equal(D2,D)
+                assert_equal(P2,P)
+            D3=numpy.memmap(filename,dtype=float,mode='r',shape=D.shape)
+            assert_equal(D3,D)
+            del D2,P2,D3
+        finally:
+            shutil.rmtree(path)
+        D4,P4=nx.floyd_warshall_blocked(self.G,predecessors=True,
+                                        block_size=8,processes=2)
+        assert_false(isinstance(D4,numpy.memmap))
+        assert_equal(D4,D)
+        assert_equal(P4,P)
+
+    def test_negative_cycle(self):
+        G=nx.DiGraph()
+        G.add_weighted_edges_from([(0,1,1),(1,2,-3),(2,0,1),(2,3,1)])
+        assert_raises(nx.NetworkXUnbounded,nx.floyd_warshall_blocked,G)
+
+    def test_multigraph_float32(self):
+        G=nx.MultiGraph([(0,1,{'weight':5}),(0,1,{'weight':2}),(1,2)])
+        D=nx.floyd_warshall_blocked(G,dtype=numpy.float32)
+        assert_equal(D.dtype,numpy.float32)
+        assert_equal(D[0,2],3)
+        assert_equal(nx.floyd_warshall_blocked(nx.Graph()).shape,(0,0))
+        assert_raises(nx.NetworkXError,nx.floyd_warshall_blocked,G,
+                      dtype=numpy.int32)
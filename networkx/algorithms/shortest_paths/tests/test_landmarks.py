@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+import shutil
+import tempfile
+from nose.tools import *
+from nose import SkipTest
+import networkx as nx
+
+class TestLandmarkIndex:
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G=nx.gnp_random_graph(50,0.06,seed=7,directed=True)
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%5+0.5
+        self.G=G
+
+    def check(self, index, G, weight='weight'):
+        lengths=nx.all_pairs_dijkstra_path_length(G,weight=weight)
+        for u in G:
+            for v in G:
+                if v in lengths[u]:
+                    assert_almost_equal(index.distance(u,v),lengths[u][v])
+                    path=index.path(u,v)
+                    assert_equal(path[0],u)
+                    assert_equal(path[-1],v)
+                    length=sum(G[a][b].get(weight,1) if weight else 1
+                               for a,b in zip(path[:-1],path[1:]))
+                    assert_almost_equal(length,lengths[u][v])
+                else:
+                    assert_raises(nx.NetworkXNoPath,index.distance,u,v)
+
+    def test_directed(self):
+        index=nx.LandmarkIndex(self.G,landmarks=4,seed=1)
+        assert_equal(len(index.landmarks),4)
+        self.check(index,self.G)
+
+    def test_undirected(self):
+        G=nx.Graph(self.G)
+        G.add_path([100,101,102])
+        index=nx.LandmarkIndex(G,landmarks=3,seed=2,active=2)
+        self.check(index,G)
+        index=nx.LandmarkIndex(G,weight=None,landmarks=3,seed=2)
+        self.check(index,G,weight=None)
+
+    def test_landmarks(self):
+        # a landmark is placed in every component
+        G=nx.disjoint_union(nx.path_graph(5),nx.path_graph(3))
+        index=nx.LandmarkIndex(G,landmarks=2,seed=0)
+        assert_equal(len(set(index.landmarks) & set(range(5))),1)
+        index=nx.LandmarkIndex(G,landmarks=20)
+        assert_equal(sorted(index.landmarks),list(range(8)))
+        index=nx.LandmarkIndex(G,landmarks=0)
+        assert_equal(index.distance(0,4),4)
+
+    def test_save_load(self):
+        index=nx.LandmarkIndex(self.G,landmarks=4,seed=1)
+        path=tempfile.mkdtemp()
+        try:
+            index.save(path)
+            for mmap in (True,False):
+                loaded=nx.LandmarkIndex.load(path,mmap=mmap)
+                assert_equal(loaded.landmarks,index.landmarks)
+                assert_equal(loaded.directed,True)
+                self.check(loaded,self.G)
+        finally:
+            shutil.rmtree(path)
+
+    def test_multigraph(self):
+        G=nx.MultiGraph([(0,1,{'weight':3}),(0,1,{'weight':1}),
+                         (1,2,{'weight':2})])
+        index=nx.LandmarkIndex(G,landmarks=1)
+        assert_equal(index.distance(0,2),3)
+        assert_equal(index.path(2,0),[2,1,0])
+
+    def test_errors(self):
+        index=nx.LandmarkIndex(self.G,landmarks=2)
+        assert_raises(nx.NetworkXError,index.distance,0,-1)
+        G=nx.DiGraph([(0,1,{'weight':-1})])
+        assert_raises(nx.NetworkXError,nx.LandmarkIndex,G)
@@ -26,6 +26,7 @@ __all__ = ['dijkstra_path',
 import heapq
 import networkx as nx
 from networkx.utils import generate_unique_node
+from networkx.algorithms.shortest_paths.csr_dijkstra import csr_kernel
 
 def dijkstra_path(G, source, target, weight='weight'):
     """Returns the shortest path from source to target in a weighted graph G.
@@ -210,6 +211,9 @@ def single_source_dijkstra_path_length(G, source, cutoff= None,
     single_source_dijkstra()
 
     """
+    kernel = csr_kernel(G, weight)
+    if kernel is not None:
+        return kernel.lengths(source, cutoff)
     dist = {}  # dictionary of final distances
     seen = {source:0}
     fringe=[] # use heapq with (distance,label) tuples
@@ -294,6 +298,10 @@ def single_source_dijkstra(G,source,target=None,cutoff=None,weight='weight'):
     are negative or are floating point numbers
     (overflows and roundoff errors can cause problems).
 
+    For a CSRGraph or CSRDiGraph without negative weights the search runs
+    on the arrays of the graph with an indexed binary heap, or with a
+    bucket queue if all weights are small integers.
+
     See Also
     --------
     single_source_dijkstra_path()
@@ -301,6 +309,9 @@ def single_source_dijkstra(G,source,target=None,cutoff=None,weight='weight'):
     """
     if source==target:
         return ({source:0}, {source:[source]})
+    kernel = csr_kernel(G, weight)
+    if kernel is not None:
+        return kernel.paths(source, cutoff, target)
     dist = {}  # dictionary of final distances
     paths = {source:[source]}  # dictionary of paths
     seen = {source:0}
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from itertools import combinations
 import networkx as nx
 
 class TestTriangles:
@@ -193,3 +194,44 @@ def test_average_clustering():
     assert_equal(nx.average_clustering(G),(1+1+1/3.0)/4.0)
     assert_equal(nx.average_clustering(G,count_zeros=True),(1+1+1/3.0)/4.0)
     assert_equal(nx.average_clustering(G,count_zeros=False),(1+1+1/3.0)/3.0)
+
+class TestDegreeOrderedTriangles:
+    # counting all nodes at once must agree with counting node by node
+
+    def setUp(self):
+        G=nx.gnp_random_graph(60,0.15,seed=3)
+        G.add_edges_from([(0,0),(5,5)])
+        for i,(u,v) in enumerate(G.edges()):
+            G[u][v]['weight']=i%5+1
+        self.G=G
+
+    def test_triangles(self):
+        G=self.G
+        expected=nx.triangles(G,G.nodes())
+        assert_equal(nx.triangles(G),expected)
+        assert_equal(nx.triangles(G,processes=2),expected)
+        assert_equal(sum(expected.values())//3,
+                     sum(1 for u,v,w in combinations(G,3)
+                         if G.has_edge(u,v) and G.has_edge(v,w)
+                         and G.has_edge(u,w) and len(set([u,v,w]))==3))
+
+    def test_clustering(self):
+        G=self.G
+        for weight in (None,'weight'):
+            expected=nx.clustering(G,G.nodes(),weight=weight)
+            for processes in (None,2):
+                c=nx.clustering(G,weight=weight,processes=processes)
+                assert_equal(set(c),set(expected))
+                for v in c:
+                    assert_almost_equal(c[v],expected[v])
+            assert_almost_equal(nx.average_clustering(G,weight=weight),
+                                nx.average_clustering(G,G.nodes(),
+                                                      weight=weight))
+
+    def test_transitivity(self):
+        G=self.G
+        triangles=sum(nx.triangles(G,G.nodes()).values())
+        triads=sum(d*(d-1) for d in (len(set(G[v])-set([v])) for v in G))
+        assert_almost_equal(nx.transitivity(G),triangles/(triads/2.0))
+        assert_almost_equal(nx.transitivity(G,processes=2),
+                            nx.transitivity(G))
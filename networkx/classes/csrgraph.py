@@ -0,0 +1,729 @@
+"""Immutable graphs stored in compressed sparse row (CSR) arrays.
+
+CSRGraph and CSRDiGraph hold the adjacency structure in flat typed arrays
+(row offsets, int32 neighbor indices and one float column per numeric edge
+attribute) instead of a dict-of-dicts with one attribute dict per edge.
+They implement the read-only Graph and DiGraph API through lightweight
+mapping views, so algorithms that only read a graph run unmodified.
+"""
+#    Copyright (C) 2004-2013 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from array import array
+from bisect import bisect_left
+from copy import deepcopy
+from collections import Mapping
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.exception import NetworkXError
+
+__author__ = """\n""".join(['Aric Hagberg (hagberg@lanl.gov)',
+                            'Pieter Swart (swart@lanl.gov)',
+                            'Dan Schult(dschult@colgate.edu)'])
+__all__ = ['CSRGraph', 'CSRDiGraph', 'csr_arrays']
+
+# missing edge attribute values are stored as NaN
+_MISSING = float('nan')
+
+
+class _EdgeData(dict):
+    """Read-only attribute dictionary of a single edge.
+
+    Copies (copy.copy, copy.deepcopy, copy()) are ordinary dictionaries.
+    """
+    def _frozen(self, *args, **kwds):
+        raise NetworkXError("Frozen graph can't be modified")
+    __setitem__ = __delitem__ = update = setdefault = _frozen
+    pop = popitem = clear = _frozen
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+_NO_DATA = _EdgeData()
+
+
+def _edge_data(columns, p):
+    if not columns:
+        return _NO_DATA
+    # missing values are NaN, which is the only value not equal to itself
+    return _EdgeData((key, column[p]) for key, column in columns.items()
+                     if column[p] == column[p])
+
+
+class _AdjacencyRowView(Mapping):
+    """Read-only neighbor -> edge data mapping of a single node."""
+    __slots__ = ('_graph', '_start', '_end', '_indices', '_edges')
+
+    def __init__(self, graph, start, end, indices, edges):
+        self._graph = graph
+        self._start = start
+        self._end = end
+        self._indices = indices
+        self._edges = edges # None if edges are numbered by position
+
+    def _position(self, nbr):
+        j = self._graph._index[nbr]
+        p = bisect_left(self._indices, j, self._start, self._end)
+        if p < self._end and self._indices[p] == j:
+            return p
+        raise KeyError(nbr)
+
+    def _edge(self, p):
+        if self._edges is None:
+            return p
+        return self._edges[p]
+
+    def __getitem__(self, nbr):
+        return _edge_data(self._graph._columns, self._edge(self._position(nbr)))
+
+    def __contains__(self, nbr):
+        try:
+            self._position(nbr)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+    def __iter__(self):
+        labels = self._graph._labels
+        return (labels[j] for j in self._indices[self._start:self._end])
+
+    def __len__(self):
+        return self._end - self._start
+
+    def iteritems(self):
+        labels = self._graph._labels
+        columns = self._graph._columns
+        for p in range(self._start, self._end):
+            yield labels[self._indices[p]], _edge_data(columns, self._edge(p))
+
+    def items(self):
+        return list(self.iteritems())
+
+    def __repr__(self):
+        return repr(dict(self.iteritems()))
+
+
+class _AdjacencyView(Mapping):
+    """Read-only node -> neighbor mapping backed by CSR arrays."""
+    __slots__ = ('_graph', '_indptr', '_indices', '_edges')
+
+    def __init__(self, graph, indptr, indices, edges=None):
+        self._graph = graph
+        self._indptr = indptr
+        self._indices = indices
+        self._edges = edges
+
+    def __getitem__(self, n):
+        i = self._graph._index[n]
+        return _AdjacencyRowView(self._graph, self._indptr[i],
+                                 self._indptr[i+1], self._indices, self._edges)
+
+    def __contains__(self, n):
+        return n in self._graph._index
+
+    def __iter__(self):
+        return iter(self._graph._labels)
+
+    def __len__(self):
+        return len(self._graph._labels)
+
+
+def _frozen(*args, **kwds):
+    raise NetworkXError("Frozen graph can't be modified")
+
+
+def _float_array(key, values):
+    # the values of an edge attribute as an array of doubles
+    try:
+        return array('d', values)
+    except TypeError:
+        try:
+            return array('d', (float(x) for x in values))
+        except (TypeError, ValueError):
+            raise NetworkXError("Edge attribute %s is not numeric."%key)
+
+
+def _both_directions(rows, cols, values):
+    # the edges with each non-loop edge (u,v) followed by (v,u), so that
+    # the positions keep the input order of the edges
+    m = len(rows) + sum(1 for e, r in enumerate(rows) if r != cols[e])
+    both_rows = array('i', [0]) * m
+    both_cols = array('i', [0]) * m
+    both_values = dict((key, array('d', [0.0]) * m) for key in values)
+    items = [(column, both_values[key]) for key, column in values.items()]
+    p = 0
+    for e, r in enumerate(rows):
+        c = cols[e]
+        both_rows[p] = r
+        both_cols[p] = c
+        for column, both in items:
+            both[p] = column[e]
+        p += 1
+        if r != c:
+            both_rows[p] = c
+            both_cols[p] = r
+            for column, both in items:
+                both[p] = column[e]
+            p += 1
+    return both_rows, both_cols, both_values
+
+
+def _counting_sort(keys, n, order=None):
+    # the positions of keys, integers in range(n), stably sorted by key;
+    # if order is given the positions are taken in that order
+    start = array('l', [0]) * (n + 1)
+    for k in keys:
+        start[k + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+    result = array('l', [0]) * len(keys)
+    if order is None:
+        for p, k in enumerate(keys):
+            result[start[k]] = p
+            start[k] += 1
+    else:
+        for p in order:
+            k = keys[p]
+            result[start[k]] = p
+            start[k] += 1
+    return result
+
+
+class _CSRBase(object):
+    """Construction and storage shared by CSRGraph and CSRDiGraph."""
+
+    add_node = _frozen
+    add_nodes_from = _frozen
+    remove_node = _frozen
+    remove_nodes_from = _frozen
+    add_edge = _frozen
+    add_edges_from = _frozen
+    add_weighted_edges_from = _frozen
+    remove_edge = _frozen
+    remove_edges_from = _frozen
+    add_star = _frozen
+    add_path = _frozen
+    add_cycle = _frozen
+    clear = _frozen
+
+    def __init__(self, data=None, edge_attrs=None, **attr):
+        """Initialize a graph from any NetworkX graph or graph data.
+
+        Parameters
+        ----------
+        data : input graph
+            A NetworkX graph or any data accepted by the Graph (DiGraph)
+            constructor, e.g. an edge list. If data=None (default) an
+            empty graph is created.
+        edge_attrs : list, optional (default=None)
+            Names of the edge attributes to keep. If None, all edge
+            attributes are kept. Kept attributes must be numeric.
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        See Also
+        --------
+        from_edge_arrays
+        """
+        self.graph = {}
+        if data is None:
+            self._build([], [], [], {})
+        else:
+            if not hasattr(data, 'adj'):
+                data = nx.DiGraph(data) if self.is_directed() else nx.Graph(data)
+            if data.is_multigraph():
+                raise NetworkXError("CSR graphs do not support multigraphs.")
+            edges = data.edges_iter
+            if edge_attrs is None:
+                edge_attrs = set()
+                for u, v, d in edges(data=True):
+                    edge_attrs.update(d)
+            columns = {}
+            for key in edge_attrs:
+                try:
+                    columns[key] = array('d', (float(d.get(key, _MISSING))
+                                               for u, v, d in edges(data=True)))
+                except (TypeError, ValueError):
+                    raise NetworkXError("Edge attribute %s is not numeric."%key)
+            self._build(data, (u for u, v in edges()),
+                        (v for u, v in edges()), columns)
+            self.graph.update(data.graph)
+            for n, d in data.node.items():
+                self.node[n].update(d)
+        self.graph.update(attr)
+
+    @classmethod
+    def from_edge_arrays(cls, sources, targets, columns=None, nodes=None,
+                         **attr):
+        """Build a graph in bulk from parallel arrays of edge endpoints.
+
+        Parameters
+        ----------
+        sources, targets : sequences
+            The endpoints of the edges, e.g. lists or NumPy arrays.
+        columns : dict, optional (default=None)
+            Maps edge attribute names to sequences of numeric values
+            aligned with sources and targets, e.g. {'weight': w}.
+        nodes : iterable, optional (default=None)
+            Nodes of the graph in the order of their internal index.
+            Endpoints that are not in nodes are added in order of
+            appearance.
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        Returns
+        -------
+        G : CSRGraph or CSRDiGraph
+
+        Examples
+        --------
+        >>> G = nx.CSRDiGraph.from_edge_arrays([0,1,2], [1,2,0],
+        ...                                    {'weight': [0.5,1.0,2.0]})
+        >>> G[2][0]['weight']
+        2.0
+        """
+        G = cls(**attr)
+        if columns is None:
+            columns = {}
+        G._build([] if nodes is None else nodes, sources, targets, columns)
+        return G
+
+    def _build(self, nodes, sources, targets, columns):
+        # node labels <-> indices
+        self._labels = labels = list(nodes)
+        self._index = index = dict((n, i) for i, n in enumerate(labels))
+        if len(index) != len(labels):
+            raise NetworkXError("Duplicate nodes.")
+        def node_index(n):
+            try:
+                return index[n]
+            except KeyError:
+                index[n] = len(labels)
+                labels.append(n)
+                return index[n]
+        rows = array('i', (node_index(u) for u in sources))
+        cols = array('i', (node_index(v) for v in targets))
+        if len(rows) != len(cols):
+            raise NetworkXError("sources and targets differ in length.")
+        values = {}
+        for key, column in columns.items():
+            values[key] = _float_array(key, column)
+            if len(values[key]) != len(rows):
+                raise NetworkXError("Column %s differs in length."%key)
+        if not self.is_directed():
+            rows, cols, values = _both_directions(rows, cols, values)
+        n = len(labels)
+        self.node = dict((label, {}) for label in labels)
+
+        # sort edges by (row, column) with two stable counting sorts, so
+        # that duplicates stay in input order, and merge duplicates; like
+        # add_edge, later attribute values update earlier ones
+        order = _counting_sort(rows, n, _counting_sort(cols, n))
+        self._indptr = indptr = array('l', [0]) * (n + 1)
+        self._indices = indices = array('i')
+        self._columns = merged = dict((key, array('d')) for key in values)
+        items = list(values.items())
+        last_row = last_col = -1
+        for e in order:
+            r = rows[e]
+            c = cols[e]
+            if r == last_row and c == last_col:
+                for key, column in items:
+                    x = column[e]
+                    if x == x:
+                        merged[key][-1] = x
+                continue
+            last_row, last_col = r, c
+            indptr[r + 1] += 1
+            indices.append(c)
+            for key, column in items:
+                merged[key].append(column[e])
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+        self._init_views()
+
+    def _init_views(self):
+        self.adj = _AdjacencyView(self, self._indptr, self._indices)
+        self.edge = self.adj
+
+    def _rows(self):
+        # the source node index of every edge in CSR order
+        rows = array('i', [0]) * len(self._indices)
+        for i in range(len(self._labels)):
+            for p in range(self._indptr[i], self._indptr[i+1]):
+                rows[p] = i
+        return rows
+
+    def _convert(self, cls, rows, cols, columns):
+        labels = self._labels
+        H = cls.from_edge_arrays([labels[i] for i in rows],
+                                 [labels[j] for j in cols], columns, labels)
+        H.graph = deepcopy(self.graph)
+        H.node = deepcopy(self.node)
+        return H
+
+    def copy(self):
+        """Return a mutable Graph (DiGraph) copy of the graph.
+
+        Graph algorithms that modify a copy of their input work on the
+        returned copy.
+        """
+        if self.is_directed():
+            return nx.DiGraph(self)
+        return nx.Graph(self)
+
+    def subgraph(self, nbunch):
+        """Return the subgraph induced on nodes in nbunch as a graph of the
+        same class.
+
+        Edge attributes are copied, not shared with the graph.
+        """
+        nodes = list(self.nbunch_iter(nbunch))
+        keep = set(nodes)
+        edges = [(u, v, d) for u, v, d in self.edges_iter(nodes, data=True)
+                 if v in keep]
+        columns = dict((key, [d.get(key, _MISSING) for u, v, d in edges])
+                       for key in self._columns)
+        H = self.from_edge_arrays([u for u, v, d in edges],
+                                  [v for u, v, d in edges], columns, nodes)
+        H.graph = self.graph
+        for n in nodes:
+            H.node[n] = self.node[n]
+        return H
+
+    def number_of_edges(self, u=None, v=None):
+        """Return the number of edges between two nodes, or of all edges.
+
+        See Graph.number_of_edges.
+        """
+        if u is None:
+            return self.size()
+        return super(_CSRBase, self).number_of_edges(u, v)
+
+
+class CSRGraph(_CSRBase, Graph):
+    """
+    Immutable undirected graph stored in compressed sparse row arrays.
+
+    A CSRGraph has the same read-only interface as Graph but needs only a
+    few bytes per edge: each edge is stored as two int32 neighbor indices
+    (one per direction) plus one float per numeric edge attribute.
+
+    Parameters
+    ----------
+    data : input graph
+        A NetworkX graph or any data accepted by the Graph constructor.
+    edge_attrs : list, optional (default=None)
+        Names of the (numeric) edge attributes to keep, default all.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Examples
+    --------
+    >>> G = nx.CSRGraph(nx.path_graph(4))
+    >>> G.neighbors(1)
+    [0, 2]
+    >>> nx.shortest_path_length(G, 0, 3)
+    3
+    >>> H = nx.CSRGraph.from_edge_arrays([0,1], [1,2], {'weight': [2,3]})
+    >>> H.degree(1, weight='weight')
+    5.0
+
+    Notes
+    -----
+    Nodes, edges and edge attributes can not be added or removed; edge
+    attributes are read-only and must be numeric. Node attributes and
+    graph attributes are stored in ordinary dictionaries (G.node, G.graph)
+    and can be modified.
+
+    Use copy() to obtain a mutable Graph.
+
+    See Also
+    --------
+    Graph
+    CSRDiGraph
+    """
+    def edges_iter(self, nbunch=None, data=False):
+        """Return an iterator over the edges.
+
+        See Graph.edges_iter.
+        """
+        if nbunch is not None:
+            for e in super(CSRGraph, self).edges_iter(nbunch, data):
+                yield e
+            return
+        labels = self._labels
+        indices = self._indices
+        indptr = self._indptr
+        for i in range(len(labels)):
+            for p in range(bisect_left(indices, i, indptr[i], indptr[i+1]),
+                           indptr[i+1]):
+                if data:
+                    yield (labels[i], labels[indices[p]],
+                           _edge_data(self._columns, p))
+                else:
+                    yield (labels[i], labels[indices[p]])
+
+    def degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, degree).
+
+        See Graph.degree_iter.
+        """
+        if weight is not None:
+            for nd in super(CSRGraph, self).degree_iter(nbunch, weight):
+                yield nd
+            return
+        indptr = self._indptr
+        for n in self.nbunch_iter(nbunch):
+            i = self._index[n]
+            nbrs = self.adj[n]
+            yield (n, indptr[i+1] - indptr[i] + (n in nbrs))
+
+    def size(self, weight=None):
+        """Return the number of edges or the sum of edge weights.
+
+        See Graph.size.
+        """
+        if weight is not None:
+            return super(CSRGraph, self).size(weight)
+        return (len(self._indices) + self.number_of_selfloops()) // 2
+
+    def to_directed(self):
+        """Return a directed representation of the graph as a CSRDiGraph.
+
+        Every edge (u,v) becomes the two directed edges (u,v) and (v,u)
+        with the same attributes. See Graph.to_directed.
+        """
+        return self._convert(CSRDiGraph, self._rows(), self._indices,
+                             self._columns)
+
+
+class CSRDiGraph(_CSRBase, DiGraph):
+    """
+    Immutable directed graph stored in compressed sparse row arrays.
+
+    The successors are stored in CSR and the predecessors in compressed
+    sparse column (CSC) order, so successors(), predecessors(), in_edges()
+    and in/out degrees are as fast as for DiGraph. Edge attributes are
+    stored once per edge.
+
+    Parameters
+    ----------
+    data : input graph
+        A NetworkX graph or any data accepted by the DiGraph constructor.
+    edge_attrs : list, optional (default=None)
+        Names of the (numeric) edge attributes to keep, default all.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Examples
+    --------
+    >>> G = nx.CSRDiGraph([(0,1),(1,2),(2,0)])
+    >>> G.successors(0), G.predecessors(0)
+    ([1], [2])
+
+    Notes
+    -----
+    See CSRGraph.
+
+    See Also
+    --------
+    DiGraph
+    CSRGraph
+    """
+    def _init_views(self):
+        n = len(self._labels)
+        indptr, indices = self._indptr, self._indices
+        # CSC order of the same edges: in_edges[p] is the CSR position of
+        # the p-th edge sorted by (target, source). The CSR positions are
+        # sorted by source, so a stable sort by target gives this order.
+        rows = self._rows()
+        self._in_edges = _counting_sort(indices, n)
+        self._in_indices = in_indices = array('i', [0]) * len(indices)
+        for q, p in enumerate(self._in_edges):
+            in_indices[q] = rows[p]
+        self._in_indptr = array('l', [0]) * (n + 1)
+        for j in indices:
+            self._in_indptr[j + 1] += 1
+        for i in range(n):
+            self._in_indptr[i + 1] += self._in_indptr[i]
+        self.succ = self.adj = _AdjacencyView(self, indptr, indices)
+        self.pred = _AdjacencyView(self, self._in_indptr, self._in_indices,
+                                   self._in_edges)
+        self.edge = self.adj
+
+    def in_degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, in-degree).
+
+        See DiGraph.in_degree_iter.
+        """
+        if weight is not None:
+            for nd in super(CSRDiGraph, self).in_degree_iter(nbunch, weight):
+                yield nd
+            return
+        indptr = self._in_indptr
+        for n in self.nbunch_iter(nbunch):
+            i = self._index[n]
+            yield (n, indptr[i+1] - indptr[i])
+
+    def out_degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, out-degree).
+
+        See DiGraph.out_degree_iter.
+        """
+        if weight is not None:
+            for nd in super(CSRDiGraph, self).out_degree_iter(nbunch, weight):
+                yield nd
+            return
+        indptr = self._indptr
+        for n in self.nbunch_iter(nbunch):
+            i = self._index[n]
+            yield (n, indptr[i+1] - indptr[i])
+
+    def degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, degree).
+
+        See DiGraph.degree_iter.
+        """
+        if weight is not None:
+            for nd in super(CSRDiGraph, self).degree_iter(nbunch, weight):
+                yield nd
+            return
+        out_indptr, in_indptr = self._indptr, self._in_indptr
+        for n in self.nbunch_iter(nbunch):
+            i = self._index[n]
+            yield (n, out_indptr[i+1] - out_indptr[i] +
+                   in_indptr[i+1] - in_indptr[i])
+
+    def size(self, weight=None):
+        """Return the number of edges or the sum of edge weights.
+
+        See Graph.size.
+        """
+        if weight is not None:
+            return super(CSRDiGraph, self).size(weight)
+        return len(self._indices)
+
+    def to_undirected(self, reciprocal=False):
+        """Return an undirected representation of the digraph as a CSRGraph.
+
+        See DiGraph.to_undirected.
+        """
+        rows, cols = self._rows(), self._indices
+        edges = range(len(cols))
+        if reciprocal:
+            labels = self._labels
+            edges = [p for p in edges
+                     if labels[cols[p]] in self.pred[labels[rows[p]]]]
+        return self._convert(CSRGraph, [rows[p] for p in edges],
+                             [cols[p] for p in edges],
+                             dict((key, [column[p] for p in edges])
+                                  for key, column in self._columns.items()))
+
+    def reverse(self, copy=True):
+        """Return the reverse of the graph as a new CSRDiGraph.
+
+        The copy argument is accepted for compatibility with DiGraph;
+        the reverse of an immutable graph is always a new graph.
+        """
+        labels = self._labels
+        H = self.from_edge_arrays([labels[j] for j in self._indices],
+                                  [labels[i] for i in self._rows()],
+                                  self._columns, labels)
+        H.graph = deepcopy(self.graph)
+        H.node = deepcopy(self.node)
+        return H
+
+
+def csr_arrays(G, weight=None, nodelist=None):
+    """Return the adjacency of G as CSR arrays over node indices 0..n-1.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph. For CSRGraph and CSRDiGraph the stored arrays
+        are reused without iterating over the edges.
+    weight : None or string, optional (default=None)
+        The edge attribute holding the edge weight. Edges without the
+        attribute have weight 1. For multigraphs the smallest weight of
+        the parallel edges is used.
+    nodelist : list, optional (default=None)
+        The nodes of G in the order of their indices. If None, the order
+        is given by G.nodes(). Edges to nodes not in nodelist are ignored.
+
+    Returns
+    -------
+    nodelist : list
+        The nodes of G; node nodelist[i] has index i.
+    indptr : NumPy array
+        The neighbors of node i are indices[indptr[i]:indptr[i+1]].
+        For directed graphs these are the successors.
+    indices : NumPy int32 array
+        Neighbor indices, sorted within each node.
+    weights : NumPy float array or None
+        Edge weights aligned with indices, None if weight is None.
+
+    Examples
+    --------
+    >>> nodelist, indptr, indices, weights = nx.csr_arrays(nx.path_graph(3))
+    >>> list(indptr), list(indices)
+    ([0, 1, 3, 4], [1, 0, 2, 1])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("csr_arrays() requires NumPy: http://scipy.org/")
+    def from_array(a, dtype):
+        if len(a) == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.frombuffer(a, dtype=dtype).copy()
+    if isinstance(G, _CSRBase) and (nodelist is None or
+                                    list(nodelist) == G._labels):
+        nodelist = list(G._labels)
+        indptr = from_array(G._indptr, np.int_)
+        indices = from_array(G._indices, np.int32)
+        weights = None
+        if weight is not None:
+            if weight in G._columns:
+                weights = from_array(G._columns[weight], np.float64)
+                weights[np.isnan(weights)] = 1.0
+            else:
+                weights = np.ones(len(indices))
+        return nodelist, indptr, indices, weights
+    if nodelist is None:
+        nodelist = list(G)
+    else:
+        nodelist = list(nodelist)
+    index = dict((n, i) for i, n in enumerate(nodelist))
+    indptr = np.zeros(len(nodelist) + 1, dtype=np.int_)
+    indices = []
+    weights = []
+    for i, n in enumerate(nodelist):
+        nbrs = sorted((index[nbr], d) for nbr, d in G.adj[n].items()
+                      if nbr in index)
+        indptr[i + 1] = indptr[i] + len(nbrs)
+        indices.extend(j for j, d in nbrs)
+        if weight is None:
+            continue
+        if G.is_multigraph():
+            weights.extend(min(dd.get(weight, 1) for dd in d.values())
+                           for j, d in nbrs)
+        else:
+            weights.extend(d.get(weight, 1) for j, d in nbrs)
+    indices = np.array(indices, dtype=np.int32)
+    if weight is None:
+        return nodelist, indptr, indices, None
+    return nodelist, indptr, indices, np.array(weights, dtype=np.float64)
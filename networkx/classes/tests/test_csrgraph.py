@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+import random
+from array import array
+from nose import SkipTest
+from nose.tools import *
+import networkx
+from test_graph import BaseGraphTester
+from test_digraph import BaseDiGraphTester
+
+
+class TestCSRGraph(BaseGraphTester):
+    """Tests of the read-only Graph API on CSRGraph"""
+    def setUp(self):
+        self.Graph=networkx.CSRGraph
+        self.k3edges=[(0, 1), (0, 2), (1, 2)]
+        self.k3nodes=[0, 1, 2]
+        self.K3=self.Graph(self.k3edges)
+
+    def test_selfloop_degree(self):
+        G=self.Graph([(1,1)])
+        assert_equal(list(G.degree().values()),[2])
+        assert_equal(G.degree(),{1:2})
+        assert_equal(G.degree(1),2)
+        assert_equal(G.degree([1]),{1:2})
+        assert_equal(G.degree([1],weight='weight'),{1:2})
+
+    def test_selfloops(self):
+        G=self.Graph(self.k3edges+[(0,0)])
+        assert_equal(G.nodes_with_selfloops(),[0])
+        assert_equal(G.selfloop_edges(),[(0,0)])
+        assert_equal(G.number_of_selfloops(),1)
+        assert_equal(G.size(),4)
+
+    def test_weighted_degree(self):
+        G=self.Graph([(1,2,{'weight':2}),(2,3,{'weight':3})])
+        assert_equal(G.degree(weight='weight'),{1:2,2:5,3:3})
+        assert_equal(G.degree(1,weight='weight'),2)
+        assert_equal(G.degree([1],weight='weight'),{1:2})
+
+    def test_frozen(self):
+        G=self.K3
+        assert_raises(networkx.NetworkXError, G.add_node, 3)
+        assert_raises(networkx.NetworkXError, G.add_edge, 0, 3)
+        assert_raises(networkx.NetworkXError, G.remove_edge, 0, 1)
+        assert_raises(networkx.NetworkXError, G.remove_node, 0)
+        assert_raises(networkx.NetworkXError, G.clear)
+
+    def test_getitem(self):
+        G=self.K3
+        assert_equal(dict(G[0]),{1: {}, 2: {}})
+        assert_raises(KeyError, G.__getitem__, 'j')
+        assert_raises(KeyError, G[0].__getitem__, 0)
+
+    def test_edge_data(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2,{'capacity':3})])
+        assert_equal(G[0][1],{'weight':2.0})
+        assert_equal(G[1][0],{'weight':2.0})
+        assert_equal(G[1][2],{'capacity':3.0})
+        assert_equal(G[1][2].get('weight',1),1)
+        assert_equal(G.get_edge_data(0,2,default=0),0)
+        assert_raises(networkx.NetworkXError, G[0][1].__setitem__, 'weight', 1)
+        assert_equal(sorted(G.edges(data=True)),
+                     [(0,1,{'weight':2.0}),(1,2,{'capacity':3.0})])
+        G=self.Graph([(0,1,{'weight':2})], edge_attrs=[])
+        assert_equal(G[0][1],{})
+        assert_raises(networkx.NetworkXError, self.Graph, [(0,1,{'color':'red'})])
+
+    def test_duplicate_edges(self):
+        G=self.Graph.from_edge_arrays([0,1,0],[1,0,1],{'weight':[1,2,3]})
+        assert_equal(G.size(),1)
+        assert_equal(G[0][1]['weight'],3.0)
+
+    def test_from_edge_arrays(self):
+        G=self.Graph.from_edge_arrays(['a','b'],['b','c'],{'weight':[1,2]},
+                                      nodes=['d','c','b','a'],name='test')
+        assert_equal(G.name,'test')
+        assert_equal(sorted(G),['a','b','c','d'])
+        assert_equal(G.degree('d'),0)
+        assert_equal(G.degree('b',weight='weight'),3)
+        assert_raises(networkx.NetworkXError, self.Graph.from_edge_arrays,
+                      [0,1],[1])
+        assert_raises(networkx.NetworkXError, self.Graph.from_edge_arrays,
+                      [0,1],[1,2],{'weight':['a','b']})
+
+    def test_random_edges(self):
+        # edges in any order with duplicates and self loops
+        random.seed(3)
+        edges=[(random.randrange(20),random.randrange(20),
+                {'weight':random.randrange(5)}) for i in range(200)]
+        H=networkx.Graph(edges)
+        G=self.Graph.from_edge_arrays([u for u,v,d in edges],
+                                      [v for u,v,d in edges],
+                                      {'weight':array('d',(d['weight']
+                                                      for u,v,d in edges))})
+        for u in H:
+            assert_equal(sorted(G[u]),sorted(H[u]))
+            for v in H[u]:
+                assert_equal(G[u][v],H[u][v])
+
+    def test_graph_and_node_attr(self):
+        H=networkx.Graph(self.k3edges,foo='bar')
+        H.node[0]['color']='red'
+        G=self.Graph(H)
+        assert_equal(G.graph,{'foo':'bar'})
+        assert_equal(G.node[0],{'color':'red'})
+        G.node[1]['color']='blue'
+        assert_equal(G.nodes(data=True)[1],(1,{'color':'blue'}))
+
+    def test_copy(self):
+        G=self.Graph([(0,1,{'weight':2})])
+        H=G.copy()
+        assert_false(isinstance(H,self.Graph))
+        assert_equal(sorted(H.edges(data=True)),sorted(G.edges(data=True)))
+        H.add_edge(1,2)
+        H[0][1]['weight']=3
+        assert_equal(G[0][1]['weight'],2)
+
+    def test_subgraph(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2),(2,3)])
+        H=G.subgraph([0,1,2])
+        assert_true(isinstance(H,self.Graph))
+        assert_equal(sorted(H.edges()),[(0,1),(1,2)])
+        assert_equal(H[0][1],{'weight':2})
+
+    def test_to_directed(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2)])
+        D=G.to_directed()
+        assert_true(D.is_directed())
+        assert_equal(sorted(D.edges(data=True)),
+                     [(0,1,{'weight':2}),(1,0,{'weight':2}),(1,2,{}),(2,1,{})])
+
+    def test_algorithms(self):
+        H=networkx.karate_club_graph()
+        G=self.Graph(H)
+        assert_equal(networkx.shortest_path_length(G),
+                     networkx.shortest_path_length(H))
+        assert_equal(networkx.core_number(G),networkx.core_number(H))
+        b1=networkx.betweenness_centrality(G)
+        b2=networkx.betweenness_centrality(H)
+        for n in H:
+            assert_almost_equal(b1[n],b2[n])
+        p1=networkx.pagerank(G)
+        p2=networkx.pagerank(H)
+        for n in H:
+            assert_almost_equal(p1[n],p2[n])
+
+
+class TestCSRDiGraph(BaseDiGraphTester,TestCSRGraph):
+    """Tests of the read-only DiGraph API on CSRDiGraph"""
+    def setUp(self):
+        self.Graph=networkx.CSRDiGraph
+        self.k3edges=[(0, 1), (0, 2), (1, 2)]
+        self.k3nodes=[0, 1, 2]
+        self.K3=self.Graph([(0,1),(0,2),(1,0),(1,2),(2,0),(2,1)])
+        self.P3=self.Graph([(0,1),(1,2)])
+
+    def test_in_degree_iter_weighted(self):
+        G=self.Graph([(0,1,{'weight':0.3,'other':1.2}),(0,2),(1,0),
+                      (1,2),(2,0),(2,1)])
+        assert_equal(list(G.in_degree_iter(weight='weight')),[(0,2),(1,1.3),(2,2)])
+        assert_equal(list(G.in_degree_iter(1,weight='other')),[(1,2.2)])
+
+    def test_out_degree_iter_weighted(self):
+        G=self.Graph([(0,1,{'weight':0.3,'other':1.2}),(0,2),(1,0),
+                      (1,2),(2,0),(2,1)])
+        assert_equal(list(G.out_degree_iter(weight='weight')),[(0,1.3),(1,2),(2,2)])
+        assert_equal(list(G.out_degree_iter(0,weight='other')),[(0,2.2)])
+
+    def test_to_undirected_reciprocal(self):
+        G=self.Graph([(1,2)])
+        assert_true(G.to_undirected().has_edge(1,2))
+        assert_false(G.to_undirected(reciprocal=True).has_edge(1,2))
+        G=self.Graph([(1,2),(2,1)])
+        assert_true(G.to_undirected(reciprocal=True).has_edge(1,2))
+
+    def test_selfloop_degree(self):
+        G=self.Graph([(1,1)])
+        assert_equal(G.degree(),{1:2})
+        assert_equal(G.in_degree(1),1)
+        assert_equal(G.out_degree(1),1)
+
+    def test_selfloops(self):
+        G=self.Graph([(0,1),(0,0)])
+        assert_equal(G.nodes_with_selfloops(),[0])
+        assert_equal(G.selfloop_edges(),[(0,0)])
+        assert_equal(G.number_of_selfloops(),1)
+        assert_equal(G.size(),2)
+
+    def test_size(self):
+        G=self.K3
+        assert_equal(G.size(),6)
+        assert_equal(G.number_of_edges(),6)
+
+    def test_getitem(self):
+        G=self.K3
+        assert_equal(dict(G[0]),{1: {}, 2: {}})
+        assert_raises(KeyError, G.__getitem__, 'j')
+
+    def test_edge_data(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,0,{'weight':3}),(1,2)])
+        assert_equal(G[0][1],{'weight':2.0})
+        assert_equal(G[1][0],{'weight':3.0})
+        assert_equal(G.pred[1][0],{'weight':2.0})
+        assert_equal(sorted(G.in_edges(data=True)),
+                     [(0,1,{'weight':2.0}),(1,0,{'weight':3.0}),(1,2,{})])
+        assert_equal(G.in_degree(weight='weight'),{0:3,1:2,2:1})
+
+    def test_duplicate_edges(self):
+        G=self.Graph.from_edge_arrays([0,1,0],[1,0,1],{'weight':[1,2,3]})
+        assert_equal(G.size(),2)
+        assert_equal(G[0][1]['weight'],3.0)
+        assert_equal(G[1][0]['weight'],2.0)
+
+    def test_from_edge_arrays(self):
+        G=self.Graph.from_edge_arrays(['a','b'],['b','c'],{'weight':[1,2]},
+                                      nodes=['d','c','b','a'],name='test')
+        assert_equal(sorted(G),['a','b','c','d'])
+        assert_equal(G.successors('a'),['b'])
+        assert_equal(G.predecessors('c'),['b'])
+        assert_equal(G.in_degree('b',weight='weight'),1)
+
+    def test_random_edges(self):
+        # edges in any order with duplicates and self loops
+        random.seed(3)
+        edges=[(random.randrange(20),random.randrange(20),
+                {'weight':random.randrange(5)}) for i in range(200)]
+        H=networkx.DiGraph(edges)
+        G=self.Graph(edges)
+        for u in H:
+            assert_equal(sorted(G.succ[u]),sorted(H.succ[u]))
+            assert_equal(G.predecessors(u),sorted(H.pred[u]))
+            for v in H.pred[u]:
+                assert_equal(G.pred[u][v],H.pred[u][v])
+
+    def test_subgraph(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2),(2,3)])
+        H=G.subgraph([0,1,2])
+        assert_true(isinstance(H,self.Graph))
+        assert_equal(sorted(H.edges()),[(0,1),(1,2)])
+        assert_equal(H.predecessors(1),[0])
+
+    def test_to_directed(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2)])
+        assert_equal(sorted(G.to_directed().edges()),[(0,1),(1,2)])
+
+    def test_to_undirected(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2),(2,1)])
+        H=G.to_undirected()
+        assert_false(H.is_directed())
+        assert_equal(sorted(H.edges()),[(0,1),(1,2)])
+        H=G.to_undirected(reciprocal=True)
+        assert_equal(sorted(H.edges()),[(1,2)])
+
+    def test_reverse(self):
+        G=self.Graph([(0,1,{'weight':2}),(1,2)])
+        R=G.reverse()
+        assert_equal(sorted(R.edges(data=True)),[(1,0,{'weight':2}),(2,1,{})])
+        assert_equal(sorted(G.edges()),[(0,1),(1,2)])
+
+    def test_algorithms(self):
+        H=networkx.gnp_random_graph(30,0.1,directed=True,seed=42)
+        for i,(u,v) in enumerate(H.edges()):
+            H[u][v]['weight']=i%7+1
+        G=self.Graph(H)
+        assert_equal(networkx.all_pairs_dijkstra_path_length(G),
+                     networkx.all_pairs_dijkstra_path_length(H))
+        assert_equal(sorted(map(sorted,networkx.strongly_connected_components(G))),
+                     sorted(map(sorted,networkx.strongly_connected_components(H))))
+        p1=networkx.pagerank(G)
+        p2=networkx.pagerank(H)
+        for n in H:
+            assert_almost_equal(p1[n],p2[n])
+
+
+class TestCSRArrays(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_csr_arrays(self):
+        G=networkx.DiGraph()
+        G.add_nodes_from([0,1,2])
+        G.add_edge(0,2,weight=2)
+        G.add_edge(0,1)
+        G.add_edge(2,0,weight=3)
+        for H in [G,networkx.CSRDiGraph(G)]:
+            nodes,indptr,indices,weights=networkx.csr_arrays(H,'weight')
+            assert_equal(nodes,[0,1,2])
+            assert_equal(list(indptr),[0,2,2,3])
+            assert_equal(list(indices),[1,2,0])
+            assert_equal(list(weights),[1,2,3])
+            assert_equal(networkx.csr_arrays(H)[3],None)
+
+    def test_csr_arrays_multigraph(self):
+        G=networkx.MultiGraph([(0,1,{'weight':3}),(0,1,{'weight':2})])
+        nodes,indptr,indices,weights=networkx.csr_arrays(G,'weight')
+        assert_equal(list(indices),[1,0])
+        assert_equal(list(weights),[2,2])
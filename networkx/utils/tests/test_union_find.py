@@ -0,0 +1,34 @@
+from nose.tools import *
+import networkx as nx
+from networkx.utils import ArrayUnionFind
+
+def test_array_union_find():
+    uf=ArrayUnionFind(3)
+    assert_equal(len(uf),3)
+    assert_equal(uf.count,3)
+    assert_equal(uf.add(),3)
+    assert_true(uf.union(0,3))
+    assert_true(uf.union(3,2))
+    assert_false(uf.union(0,2))
+    assert_equal(uf.count,2)
+    assert_equal(uf[0],uf[2])
+    assert_not_equal(uf[0],uf[1])
+    assert_equal(sorted(map(sorted,uf.sets())),[[0,2,3],[1]])
+
+def test_array_union_find_path():
+    # a long chain of unions keeps the trees shallow
+    n=1000
+    uf=ArrayUnionFind(n)
+    for i in range(n-1):
+        uf.union(i,i+1)
+    assert_equal(uf.count,1)
+    assert_true(max(uf.ranks)<=10)
+    root=uf[0]
+    assert_true(all(uf[i]==root for i in range(n)))
+
+def test_union_find():
+    uf=nx.utils.UnionFind()
+    uf.union('a','b')
+    uf.union('c','d')
+    assert_equal(uf['a'],uf['b'])
+    assert_not_equal(uf['a'],uf['c'])
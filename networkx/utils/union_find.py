@@ -7,7 +7,9 @@ Union-find data structure.
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+from array import array
 import networkx as nx
+__all__ = ['UnionFind', 'ArrayUnionFind']
 
 class UnionFind:
     """Union-find data structure.
@@ -72,4 +74,93 @@ class UnionFind:
                 self.parents[r] = heaviest
 
 
+class ArrayUnionFind(object):
+    """Union-find data structure over the integers 0, ..., n-1.
 
+    The parents and ranks are kept in compact integer arrays, which
+    takes far less memory than the dictionaries of UnionFind for many
+    items. Finding uses path compression and union uses union by rank,
+    so a sequence of operations takes almost linear time.
+
+    Parameters
+    ----------
+    n : int, optional (default=0)
+        Number of initial singleton sets {0}, ..., {n-1}. More items
+        are created with add().
+
+    Attributes
+    ----------
+    count : int
+        The number of disjoint sets.
+
+    Examples
+    --------
+    >>> uf = ArrayUnionFind(4)
+    >>> uf.union(0, 1)
+    True
+    >>> uf.union(1, 0)
+    False
+    >>> uf[0] == uf[1]
+    True
+    >>> uf.count
+    3
+    >>> sorted(map(sorted, uf.sets()))
+    [[0, 1], [2], [3]]
+    """
+    def __init__(self, n=0):
+        self.parents = array('l', range(n))
+        self.ranks = array('B', [0])*n
+        self.count = n
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add(self):
+        """Add a new singleton set and return its item."""
+        i = len(self.parents)
+        self.parents.append(i)
+        self.ranks.append(0)
+        self.count += 1
+        return i
+
+    def __getitem__(self, i):
+        """Find and return the name of the set containing item i."""
+        parents = self.parents
+        root = i
+        while parents[root] != root:
+            root = parents[root]
+        # compress the path
+        while parents[i] != root:
+            parents[i], i = root, parents[i]
+        return root
+
+    def union(self, i, j):
+        """Merge the sets containing items i and j. Return True if they
+        were different sets."""
+        ri = self[i]
+        rj = self[j]
+        if ri == rj:
+            return False
+        ranks = self.ranks
+        if ranks[ri] < ranks[rj]:
+            ri, rj = rj, ri
+        self.parents[rj] = ri
+        if ranks[ri] == ranks[rj]:
+            ranks[ri] += 1
+        self.count -= 1
+        return True
+
+    def sets(self):
+        """Return a list of the sets, each a list of its items."""
+        parents = self.parents
+        sets = {}
+        for i in range(len(parents)):
+            root = i
+            while parents[root] != root:
+                root = parents[root]
+            parents[i] = root
+            if root in sets:
+                sets[root].append(i)
+            else:
+                sets[root] = [i]
+        return list(sets.values())
@@ -5,6 +5,7 @@ __author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
 
 import sys
 import logging
+from src.profiletools import timed
 
 # -------------------------------------------------------------------------
 #
@@ -52,6 +53,7 @@ class Config(object):
     #-------------------------------------------------------------------------
     # read_xml_config_file
     #-------------------------------------------------------------------------
+    @timed(items=lambda result, self, *args, **kwargs: len(self.static_parameters) + len(self.variable_parameters))
     def read_xml_config_file(self, config_file_name):
         from xml.etree import ElementTree
         xmlText = open(config_file_name).read()
@@ -6,9 +6,15 @@ dirtystringtools
 
 A collection of methods for cleaning strings
 """
+import re
+import threading
 import unicodedata
+from collections import OrderedDict
+from functools import wraps
 __author__  =  """Michael E. Rose (Michael.Ernst.Rose@gmail.com)"""
-__all__ = ['standardize', 'normalize', 'translit_nordic']
+__all__ = ['standardize', 'normalize', 'translit_nordic', 'translit',
+           'Transliterator', 'NORDIC_TABLE', 'LIGATURE_TABLE', 'TRANSLIT_TABLE',
+           'clean', 'clean_strings', 'StringCache']
 __version__ = 0.13
 
 
@@ -36,17 +42,21 @@ def standardize(ds):
     ds = "".join(i for i in ds if not 91<=ord(i)<=96)
     return "".join(i for i in ds if not 123<=ord(i)<=126)
 
-def normalize(a_dirty_string):
+def normalize(a_dirty_string, transliterate=False):
     """
     Returns the normal form of a Unicode string (transliteration). Removes
     characters in case transliteration is not possible.
 
     Args:
         a_dirty_string (str) -- the string to be cleaned
+        transliterate (bool) -- whether to apply translit() first, so that
+            nordic characters and ligatures are replaced instead of removed
 
     Returns:
         a_clean_string (str) -- the string without interpunctuation
     """
+    if transliterate:
+        a_dirty_string = translit(a_dirty_string)
     try: # Replace by ASCII equivalent
         a_clean_string = ''.join(c for c in unicodedata.normalize('NFKD', unicode(a_dirty_string))
                                  if unicodedata.category(c) != 'Mn')
@@ -70,10 +80,310 @@ def translit_nordic(ascii_string):
     """
     if not isinstance(ascii_string, str):
         raise ValueError('Expects an ascii encoded string')
-    a_cleaner_string = ascii_string.replace('\xc3\x98','O').replace('ø', 'o')
-    a_cleaner_string = a_cleaner_string.replace('\xc3\x86','AE').replace('\xc3\xa6', 'ae')
-    a_cleaner_string = a_cleaner_string.replace('\xc3\x90','D').replace('\xc3\xb0', 'd')
-    a_cleaner_string = a_cleaner_string.replace('\xc3\x9e','TH').replace('\xc3\xbe', 'th')
-    a_cleaner_string = a_cleaner_string.replace('\xc5\x92','OE').replace('\xc5\x93', 'oe')
-    a_clean_string = a_cleaner_string.replace('\xc3\x9f','sz').replace('\xc6\x92', 'f')
-    return a_clean_string
+    return _NORDIC_TRANSLITERATOR(ascii_string)
+
+
+# Characters that have no decomposition in NFKD and would otherwise survive
+# normalize() untouched.
+NORDIC_TABLE = {0xd8: u'O', 0xf8: u'o', 0xc6: u'AE', 0xe6: u'ae',
+                0xd0: u'D', 0xf0: u'd', 0xde: u'TH', 0xfe: u'th',
+                0x152: u'OE', 0x153: u'oe', 0xdf: u'sz', 0x192: u'f'}
+
+LIGATURE_TABLE = {0x132: u'IJ', 0x133: u'ij',
+                  0x1c4: u'DZ', 0x1c5: u'Dz', 0x1c6: u'dz',
+                  0x1c7: u'LJ', 0x1c8: u'Lj', 0x1c9: u'lj',
+                  0x1ca: u'NJ', 0x1cb: u'Nj', 0x1cc: u'nj',
+                  0xfb00: u'ff', 0xfb01: u'fi', 0xfb02: u'fl', 0xfb03: u'ffi',
+                  0xfb04: u'ffl', 0xfb05: u'st', 0xfb06: u'st'}
+
+TRANSLIT_TABLE = dict(NORDIC_TABLE)
+TRANSLIT_TABLE.update(LIGATURE_TABLE)
+
+
+# Ordinals removed by standardize(), kept as a deletion table so that the
+# whole string is cleaned by a single call to translate().
+_PUNCTUATION = ''.join(chr(i) for i in range(32, 48) + range(58, 65) +
+                       range(91, 97) + range(123, 127))
+_UNICODE_PUNCTUATION = dict((ord(c), None) for c in _PUNCTUATION)
+
+class _FoldTable(dict):
+    """
+    Memoized per-codepoint results of the full cleaning chain, i.e. the
+    transliteration by the table of a Transliterator, NFKD form without
+    combining marks and without interpunctuation of a single unicode
+    character.
+    """
+    def __init__(self, table):
+        dict.__init__(self)
+        self.table = table
+
+    def __missing__(self, c):
+        folded = self.table.get(ord(c), c)
+        folded = u''.join(f for f in unicodedata.normalize('NFKD', folded)
+                          if unicodedata.category(f) != 'Mn')
+        folded = folded.translate(_UNICODE_PUNCTUATION)
+        self[c] = folded
+        return folded
+
+
+class Transliterator(object):
+    """
+    Table-driven transliteration of unicode and UTF-8 encoded strings. Every
+    string is transliterated in a single scan, regardless of the size of the
+    table.
+
+    Parameters
+    ----------
+    table: maps codepoints (int) or characters (unicode) to their replacement
+           (unicode); defaults to TRANSLIT_TABLE (dict - o)
+
+    Example
+    -------
+    >>> transliterator = Transliterator()
+    >>> transliterator.update({u'\u0141': u'L', u'\u0142': u'l'})
+    >>> transliterator(u'\u0141\u0142')
+    u'Ll'
+    """
+    def __init__(self, table=None):
+        if table is None:
+            table = TRANSLIT_TABLE
+        self.table = {}
+        self.update(table)
+
+    def update(self, table):
+        """
+        Adds replacements to the table.
+
+        Parameters
+        ----------
+        table: maps codepoints (int) or characters (unicode) to their
+               replacement (unicode) (dict)
+        """
+        for key, replacement in table.items():
+            if isinstance(key, basestring):
+                key = ord(key)
+            self.table[key] = unicode(replacement)
+        # the UTF-8 encoded table is matched by a single alternation; longer
+        # sequences come first so that no prefix shadows them
+        self._byte_table = dict((unichr(key).encode('utf-8'), replacement.encode('utf-8'))
+                                for key, replacement in self.table.items())
+        byte_keys = sorted(self._byte_table, key=len, reverse=True)
+        self._byte_pattern = re.compile('|'.join(re.escape(k) for k in byte_keys))
+        # the memo of clean() depends on the table; ASCII strings can only
+        # skip it if no ASCII character is replaced
+        self._fold_table = _FoldTable(self.table)
+        self._ascii_keys = any(key < 128 for key in self.table)
+
+    def _replace_bytes(self, match):
+        return self._byte_table[match.group()]
+
+    def __call__(self, a_string):
+        """
+        Returns a_string with all characters in the table replaced.
+
+        Parameters
+        ----------
+        a_string: the string to be transliterated, unicode or UTF-8 encoded (str)
+
+        Returns
+        -------
+        the transliterated string, of the same type as the input
+        """
+        if isinstance(a_string, str):
+            if not self._byte_table:
+                return a_string
+            return self._byte_pattern.sub(self._replace_bytes, a_string)
+        return a_string.translate(self.table)
+
+
+_NORDIC_TRANSLITERATOR = Transliterator(NORDIC_TABLE)
+_TRANSLITERATOR = Transliterator(TRANSLIT_TABLE)
+
+
+def translit(a_string):
+    """
+    Replaces nordic characters and ligatures (see TRANSLIT_TABLE) in a single
+    scan. Use a Transliterator for custom tables.
+
+    Parameters
+    ----------
+    a_string: the string to be transliterated, unicode or UTF-8 encoded (str)
+
+    Returns
+    -------
+    the transliterated string, of the same type as the input
+    """
+    return _TRANSLITERATOR(a_string)
+
+
+def clean(a_dirty_string, transliterator=None):
+    """
+    Transliterates, normalizes and standardizes a string in a single pass.
+    For unicode input this is equivalent to
+    standardize(normalize(transliterator(s))), but uses memoized
+    per-character tables instead of repeated scans of the string.
+
+    Parameters
+    ----------
+    a_dirty_string: the string to be cleaned, unicode or UTF-8 encoded (str)
+    transliterator: the transliteration applied first, a table as accepted by
+                    Transliterator or a Transliterator, whose memo is then
+                    reused by later calls; defaults to translit() (obj - o)
+
+    Returns
+    -------
+    a_clean_string: the cleaned string, of the same type as the input
+
+    Example
+    -------
+    >>> transliterator = Transliterator()
+    >>> transliterator.update({u'\u0141': u'L'})
+    >>> clean(u'\u0141\xf3d\u017a', transliterator)
+    u'Lodz'
+
+    Note
+    ----
+    Unlike normalize(), encoded strings are decoded first, so accented
+    characters are transliterated instead of dropped. Bytes that are not
+    valid UTF-8 are dropped; characters that cannot be transliterated to
+    ASCII are kept and the result is UTF-8 encoded.
+    """
+    if transliterator is None:
+        transliterator = _TRANSLITERATOR
+    elif not isinstance(transliterator, Transliterator):
+        transliterator = Transliterator(transliterator)
+    if isinstance(a_dirty_string, str):
+        try:
+            unicode_string = a_dirty_string.decode('ascii')
+            if not transliterator._ascii_keys:  # pure ASCII strings need no folding at all
+                return a_dirty_string.translate(None, _PUNCTUATION)
+        except UnicodeDecodeError:
+            unicode_string = a_dirty_string.decode('utf-8', 'ignore')
+        return clean(unicode_string, transliterator).encode('utf-8')
+    fold_table = transliterator._fold_table
+    return u''.join([fold_table[c] for c in a_dirty_string])
+
+
+def clean_strings(dirty_strings, processes=None, chunksize=10000, transliterator=None):
+    """
+    Applies clean() to every string in an iterable.
+
+    Parameters
+    ----------
+    dirty_strings: the strings to be cleaned, e.g. a list or a column (iterable)
+    processes: the number of worker processes; None cleans in the calling
+               process (int - o)
+    chunksize: the number of strings sent to a worker at a time (int - o)
+    transliterator: the transliteration applied first, see clean() (obj - o)
+
+    Returns
+    -------
+    a list of cleaned strings in the order of dirty_strings
+    """
+    if transliterator is not None and not isinstance(transliterator, Transliterator):
+        transliterator = Transliterator(transliterator)
+    if not processes:
+        return [clean(ds, transliterator) for ds in dirty_strings]
+    from functools import partial
+    from multiprocessing import Pool
+    pool = Pool(processes)
+    try:
+        return pool.map(partial(clean, transliterator=transliterator), dirty_strings, chunksize)
+    finally:
+        pool.close()
+        pool.join()
+
+
+class StringCache(object):
+    """
+    A size-bounded memo for string cleaning functions. One cache can be
+    shared by several functions (and by several Mapping objects), so that
+    each distinct raw string is cleaned exactly once per job. The least
+    recently used entry is evicted once more than maxsize results are stored.
+
+    Parameters
+    ----------
+    maxsize: the maximum number of stored results; None for no bound (int - o)
+
+    Example
+    -------
+    >>> cache = StringCache(maxsize=100000)
+    >>> cached_normalize = cache.memoize(normalize)
+    >>> cached_normalize('Nordea Bank')
+    u'Nordea Bank'
+    >>> cached_normalize('Nordea Bank')
+    u'Nordea Bank'
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+    def __init__(self, maxsize=1000000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, func, *args):
+        """
+        Returns func(*args), computing it only if it is not already stored.
+
+        Parameters
+        ----------
+        func: the cleaning function, part of the cache key (func)
+        args: the hashable arguments passed to func
+
+        Returns
+        -------
+        the (possibly memoized) result of func(*args)
+        """
+        key = (func, args)
+        with self._lock:
+            try:  # re-insert on a hit to mark the entry as recently used
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self.hits += 1
+                return value
+            except KeyError:
+                self.misses += 1
+        value = func(*args)
+        with self._lock:
+            self._entries[key] = value
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def memoize(self, func):
+        """
+        Wraps a cleaning function so that its results are stored in the cache.
+
+        Parameters
+        ----------
+        func: the cleaning function, e.g. normalize (func)
+
+        Returns
+        -------
+        the memoized function
+        """
+        @wraps(func)
+        def memoized(*args):
+            return self.get(func, *args)
+        return memoized
+
+    def info(self):
+        """
+        Returns a dictionary with the hits, misses, size and maxsize of the cache.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """
+        Removes all stored results and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
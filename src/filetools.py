@@ -1,5 +1,6 @@
 __author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
 from math import ceil
+from src.profiletools import timed
 
 #-------------------------------------------------------------------------
 #
@@ -15,6 +16,7 @@ class File(object):
     def __init__(self):
         pass
 
+    @timed(items=lambda result, self, input_file_name, _num_lines, _num_files: int(_num_lines))
     def split_file(self, input_file_name, _num_lines, _num_files):
         """
         Read in a large file with a predetermined number of lines and split it
@@ -6,11 +6,13 @@ iotools
 A collection of methods for input and outputting data
 """
 import csv
+from src.profiletools import timed
 __author__ = """Michael E. Rose (Michael.Ernst.Rose@gmail.com)"""
 __all__ = ['csv_to_dict', 'csv_to_nested_dict', 'nested_dict_to_csv']
 __version__ = 0.5
 
 
+@timed(items=lambda result, *args, **kwargs: len(result))
 def csv_to_dict(filename, key_func, value_func, skip_header=True, **kwargs):
     """
     Reads a csv as a dictionary, where values and keys are set
@@ -37,6 +39,7 @@ def csv_to_dict(filename, key_func, value_func, skip_header=True, **kwargs):
     return aDict
 
 
+@timed(items=lambda result, *args, **kwargs: len(result))
 def csv_to_nested_dict(filename, key_func, ordered=False, **kwargs):
     """
     Reads a csv as a dictionary of dictionaries, where keys are set
@@ -71,6 +74,7 @@ def csv_to_nested_dict(filename, key_func, ordered=False, **kwargs):
     return aDict
 
 
+@timed(items=lambda result, nested_dict, *args, **kwargs: len(nested_dict))
 def nested_dict_to_csv(nested_dict, file_name, fields='', header=True, **kwargs):
     """
     Prints a nested dictionary to csv.
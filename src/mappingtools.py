@@ -6,29 +6,355 @@ mappingtools
 
 A collection of methods for mapping strings
 """
+import os
 import re
+import mmap
+import heapq
+import struct
+import sqlite3
+import weakref
+import tempfile
+import cPickle as pickle
+from collections import Counter
+from itertools import groupby, islice
 from math import sqrt
 from fuzzywuzzy import process, fuzz
+from src.profiletools import timed
 
 __author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
 __version__ = 0.91
 
 
+def _standardize_string(original_string, redundant_strings):
+    """
+    Implementation of Mapping.standardize_string, kept at module level so that
+    its results can be shared in a StringCache across Mapping objects.
+    """
+    # all in upper case letters
+    original_string = original_string.upper().strip()
+
+    # special characters should be removed from all strings
+    special_characters = "/,\'“”\?\.\"-"
+    for special_character in special_characters:
+        original_string = original_string.replace(special_character, "")
+
+    # replace whitespace
+    original_string = original_string.replace(" ", "")
+
+    # actually remove redundant strings
+    for redundant_string in redundant_strings:
+        original_string = re.sub(redundant_string, '', original_string)
+
+    return original_string
+
+
+class _FrozenStrings(object):
+    """
+    An immutable sequence of redundant strings that is hashed and compared by identity, so that the cache keys of
+    standardize_string share it instead of copying and hashing all redundant strings on every call.
+    """
+    __slots__ = ('strings', '__weakref__')
+
+    def __init__(self, strings):
+        self.strings = strings
+
+    def __iter__(self):
+        return iter(self.strings)
+
+
+# Mapping objects with equal redundant strings get the same _FrozenStrings and thus share cache entries
+_frozen_strings = weakref.WeakValueDictionary()
+
+
+def _freeze_strings(redundant_strings):
+    strings = tuple(redundant_strings)
+    frozen = _frozen_strings.get(strings)
+    if frozen is None:
+        frozen = _frozen_strings[strings] = _FrozenStrings(strings)
+    return frozen
+
+
+_SOUNDEX_CODES = dict((letter, str(code)) for code, letters in
+                      enumerate(['AEIOUYHW', 'BFPV', 'CGJKQSXZ', 'DT', 'L', 'MN', 'R'])
+                      for letter in letters)
+
+
+def soundex(a_string):
+    """
+    Compute the (American) Soundex code of a string, e.g. 'R163' for 'Robert' and 'Rupert'.
+
+    Parameters
+    ----------
+    a_string: the string to be encoded (str)
+
+    Returns
+    -------
+    the four character Soundex code, or '' if the string contains no letters
+    """
+    letters = [c for c in a_string.upper() if c in _SOUNDEX_CODES]
+    if not letters:
+        return ''
+    code = letters[0]
+    previous = _SOUNDEX_CODES[letters[0]]
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES[letter]
+        if digit != '0' and digit != previous:
+            code += digit
+        if letter not in 'HW':  # H and W do not separate letters with the same code
+            previous = digit
+    return (code + '000')[:4]
+
+
+def field_blocking_key(index):
+    """
+    Blocking key for Mapping.find_best_matches_tuple: tuples are only compared if entry index matches exactly.
+    """
+    return lambda t: t[index]
+
+
+def phonetic_blocking_key(index):
+    """
+    Blocking key for Mapping.find_best_matches_tuple: tuples are only compared if entry index sounds alike.
+    """
+    return lambda t: soundex(t[index])
+
+
+class _Neighbourhood(object):
+    """
+    The tuples at positions start to stop - 1 of the sorted tuples with their frequencies. A read-only view that is
+    used like a block of Mapping.block_tuples, without copying the tuples.
+    """
+    __slots__ = ('sorted_tuples', 'frequencies', 'start', 'stop')
+
+    def __init__(self, sorted_tuples, frequencies, start, stop):
+        self.sorted_tuples = sorted_tuples
+        self.frequencies = frequencies
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __iter__(self):
+        return islice(self.sorted_tuples, self.start, self.stop)
+
+    def __getitem__(self, a_tuple):
+        return self.frequencies[a_tuple]
+
+
+def _select_best_match(matching_string, original_frequency, matching_options, original_strings,
+                       threshold_fuzziness, debug=None):
+    """
+    Select the best match among the fuzzy matching_options of a string, see Mapping.find_best_match.
+    """
+    # we start with the original string
+    best_match_precision = 0.0  # original string is not in the reduced list of all entries
+    best_match = matching_string
+
+    # the best matching option is found by checking fuzziness and relative frequency of all matches
+    for matching_option in matching_options:
+        match_fuzziness = matching_option[1]
+        match_frequency = original_strings[matching_option[0]]
+
+        # we replace a name with a similar name only if the similar name
+        # has a higher frequency; we also check that we only consider
+        # reasonable matches, otherwise we might match with a fairly
+        # different, but very prominent name
+        matching_precision = match_fuzziness/100.0*match_frequency - original_frequency
+
+        # finally, do the comparison by finding best match and checking that fuzziness is above some threshold
+        if matching_precision > best_match_precision and match_fuzziness > threshold_fuzziness:
+            best_match_precision = matching_precision
+            best_match = matching_option[0]
+
+        if debug:  # debug
+            print matching_string + "[" + str(original_frequency) + "] vs.", matching_option, "-->", best_match, best_match_precision
+
+    return best_match
+
+
+def write_table(table, out_file_name, separator=";"):
+    """
+    Write a frequency table or mapping result to out_file, one "key;value" line per entry.
+
+    Parameters
+    ----------
+    table: dictionary or iterable of (key, value) pairs, e.g. frequencies or best matches
+    out_file_name: the name of the output file (str)
+    separator: the separator between key and value (str - o)
+    """
+    if isinstance(table, dict):
+        table = table.iteritems()
+    with open(out_file_name, 'w') as out_file:
+        out_file.writelines(key + separator + str(value) + "\n" for key, value in table)
+
+
+def read_table(in_file_name, value_type=str, separator=";"):
+    """
+    Read a table written by write_table.
+
+    Parameters
+    ----------
+    in_file_name: the name of the input file (str)
+    value_type: function converting the value, e.g. int for frequency tables (func - o)
+    separator: the separator between key and value (str - o)
+
+    Returns
+    -------
+    Dictionary object containing the keys and values of the table
+    """
+    table = {}
+    with open(in_file_name, 'r') as in_file:
+        for line in in_file:
+            key, value = line.rstrip("\n").rsplit(separator, 1)
+            table[key] = value_type(value)
+    return table
+
+
+# binary tables start with the magic string, a format version, the value kind ('i' for integers, 's' for
+# strings) and the number of entries; then come the offsets and bytes of the sorted keys, followed by the values
+_TABLE_HEADER = struct.Struct('<4sBcQ')
+_TABLE_MAGIC = 'ECTB'
+_OFFSET = struct.Struct('<Q')
+_INTEGER = struct.Struct('<q')
+
+
+def _write_packed(out_file, fmt, values, chunk_size=65536):
+    for i in xrange(0, len(values), chunk_size):
+        chunk = values[i:i + chunk_size]
+        out_file.write(struct.pack('<%d%s' % (len(chunk), fmt), *chunk))
+
+
+def _write_strings(out_file, strings):
+    offsets = [0]
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    _write_packed(out_file, 'Q', offsets)
+    for string in strings:
+        out_file.write(string)
+
+
+def write_binary_table(table, out_file_name):
+    """
+    Write a frequency table or mapping result to a compact binary file, which can be opened with MappedTable
+    without parsing.
+
+    Parameters
+    ----------
+    table: dictionary with string keys and either integer values (frequencies) or string values (best matches)
+    out_file_name: the name of the output file (str)
+
+    Note
+    ----
+    Unicode keys and values are stored UTF-8 encoded.
+    """
+    encode = lambda s: s.encode('utf-8') if isinstance(s, unicode) else s
+    items = sorted((encode(key), value) for key, value in table.iteritems())
+    integer_values = all(isinstance(value, (int, long)) for _, value in items)
+
+    with open(out_file_name, 'wb') as out_file:
+        out_file.write(_TABLE_HEADER.pack(_TABLE_MAGIC, 1, 'i' if integer_values else 's', len(items)))
+        _write_strings(out_file, [key for key, _ in items])
+        if integer_values:
+            _write_packed(out_file, 'q', [value for _, value in items])
+        else:
+            _write_strings(out_file, [encode(value) for _, value in items])
+
+
+class MappedTable(object):
+    """
+    Read-only, memory-mapped view of a table written by write_binary_table. Lookups use a binary search over the
+    sorted keys, so a table can be shared by several processes without loading it into memory.
+
+    Parameters
+    ----------
+    in_file_name: the name of the binary table file (str)
+    """
+    def __init__(self, in_file_name):
+        with open(in_file_name, 'rb') as in_file:
+            self._map = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.kind, self._size = _TABLE_HEADER.unpack_from(self._map, 0)
+        if magic != _TABLE_MAGIC:
+            raise ValueError(in_file_name + " is not a binary table")
+        self._key_offsets = _TABLE_HEADER.size
+        self._keys = self._key_offsets + _OFFSET.size*(self._size + 1)
+        self._values = self._keys + self._offset(self._key_offsets, self._size)
+        if self.kind == 's':
+            self._value_strings = self._values + _OFFSET.size*(self._size + 1)
+
+    def _offset(self, offsets, i):
+        return _OFFSET.unpack_from(self._map, offsets + _OFFSET.size*i)[0]
+
+    def _string(self, offsets, strings, i):
+        return self._map[strings + self._offset(offsets, i):strings + self._offset(offsets, i + 1)]
+
+    def key(self, i):
+        return self._string(self._key_offsets, self._keys, i)
+
+    def value(self, i):
+        if self.kind == 'i':
+            return _INTEGER.unpack_from(self._map, self._values + _INTEGER.size*i)[0]
+        return self._string(self._values, self._value_strings, i)
+
+    def _find(self, key):
+        if isinstance(key, unicode):
+            key = key.encode('utf-8')
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._size and self.key(low) == key:
+            return low
+        return -1
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self.value(i)
+
+    def get(self, key, default=None):
+        i = self._find(key)
+        return self.value(i) if i >= 0 else default
+
+    def __iter__(self):
+        return (self.key(i) for i in xrange(self._size))
+
+    def iteritems(self):
+        return ((self.key(i), self.value(i)) for i in xrange(self._size))
+
+    def close(self):
+        self._map.close()
+
+
 class Mapping(object):
 
-    identifier = ""
-    from_strings = []  # contains the raw from_strings
-    reduced_from_strings = {}  # contains the reduced from_strings with unique entries and relative frequencies
-    mapping_original_standardized_from_strings = {}  # contains the original string as key and the corresponding standardized string as value
+    def __init__(self, string_cache=None):
+        self.identifier = ""
+        self.from_strings = []  # contains the raw from_strings
+        self.reduced_from_strings = {}  # contains the reduced from_strings with unique entries and relative frequencies
+        self.mapping_original_standardized_from_strings = {}  # contains the original string as key and the corresponding standardized string as value
 
-    # NOTE: this variable is not always needed, e.g. when there is only one input file but with multiple
-    #       occurences of certain strings. in this case the mapping is not between files, but from the various
-    #       forms a given string is written to it's unique (correct) form
-    to_string_array = []  # contains the raw to_strings
-    to_string_dict = {}  # contains the reduced to_strings with unique entries and relative frequencies
+        # NOTE: this variable is not always needed, e.g. when there is only one input file but with multiple
+        #       occurences of certain strings. in this case the mapping is not between files, but from the various
+        #       forms a given string is written to it's unique (correct) form
+        self.to_string_array = []  # contains the raw to_strings
+        self.to_string_dict = {}  # contains the reduced to_strings with unique entries and relative frequencies
 
-    def __init__(self):
-        pass
+        # an optional dirtystringtools.StringCache, which can be shared by several
+        # Mapping objects so that each raw string is standardized only once
+        self.string_cache = string_cache
+        # the last list of redundant strings and its frozen form, see standardize_string
+        self._redundant_strings = (None, None)
 
     def tuple_to_string(self, t):
         """
@@ -64,8 +390,10 @@ class Mapping(object):
                 redundant_strings.append(line.strip())
                 # we also remove the upper case version of each string
                 redundant_strings.append(line.strip().upper())
+        self._redundant_strings = (redundant_strings, _freeze_strings(redundant_strings))
         return redundant_strings
 
+    @timed(items=lambda result, *args, **kwargs: 1)
     def standardize_string(self, original_string, redundant_strings):
         """
         Take an original string and standardize it by stripping special characters and redundant strings.
@@ -84,25 +412,18 @@ class Mapping(object):
           Examples: 'the', 'of'
         - Each string in the redundant_strings_file is in a single line
         - The uppercase version of each redundant string is also automatically removed
+        - If the Mapping was created with a string_cache, results are memoized there. The redundant strings are
+          frozen when a list is first passed, so pass a new list rather than changing it in place
         """
-        # all in upper case letters
-        original_string = original_string.upper().strip()
-
-        # special characters should be removed from all strings
-        special_characters = "/,\'“”\?\.\"-"
-        for special_character in special_characters:
-            original_string = original_string.replace(special_character, "")
-
-        # replace whitespace
-        original_string = original_string.replace(" ", "")
-
-        # actually remove redundant strings
-        for redundant_string in redundant_strings:
-            original_string = re.sub(redundant_string, '', original_string)
-
-        return original_string
-
-
+        if self.string_cache is not None:
+            last_strings, frozen_strings = self._redundant_strings
+            if redundant_strings is not last_strings:
+                frozen_strings = _freeze_strings(redundant_strings)
+                self._redundant_strings = (redundant_strings, frozen_strings)
+            return self.string_cache.get(_standardize_string, original_string, frozen_strings)
+        return _standardize_string(original_string, redundant_strings)
+
+    @timed(items=lambda result, *args, **kwargs: sum(result.itervalues()))
     def compute_string_frequency(self, string_array):
         """
         Compute the absolute frequency of every string in a string_array.
@@ -120,9 +441,9 @@ class Mapping(object):
         Absolute frequency is the number of occurences of a unique string.
         This method takes any hashable object and computes the frequency, including tuples.
         """
-        from collections import Counter
         return Counter(string_array)
 
+    @timed(items=lambda result, *args, **kwargs: 1)
     def find_best_match(self, matching_string, original_strings,
                         number_of_fuzzy_options, threshold_fuzziness,
                         debug=None):
@@ -152,32 +473,70 @@ class Mapping(object):
             limit=number_of_fuzzy_options
         )
 
-        # we start with the original string
         original_frequency = original_strings[matching_string]
-        best_match_precision = 0.0  # original string is not in the reduced list of all entries
-        best_match = matching_string
+        return _select_best_match(matching_string, original_frequency, matching_options, original_strings,
+                                  threshold_fuzziness, debug)
 
-        # the best matching option is found by checking fuzziness and relative frequency of all matches
-        for matching_option in matching_options:
-            match_fuzziness = matching_option[1]
-            match_frequency = original_strings[matching_option[0]]
+    @timed(items=lambda result, *args, **kwargs: len(result))
+    def find_best_matches(self, original_strings, number_of_fuzzy_options,
+                          threshold_fuzziness, mapping_store=None):
+        """
+        Find the best match of every string in an array of strings, optionally reusing the results of a previous run.
 
-            # we replace a name with a similar name only if the similar name
-            # has a higher frequency; we also check that we only consider
-            # reasonable matches, otherwise we might match with a fairly
-            # different, but very prominent name
-            matching_precision = match_fuzziness/100.0*match_frequency - original_frequency
+        Parameters
+        ----------
+        original_strings: dictionary with unique strings as keys and their frequencies as values (dict)
+        number_of_fuzzy_options: the number of alternatives of the matching_string fuzzywuzzy should find in the original_strings
+        threshold_fuzziness: the lower threshold for the precision of fuzzy matches
+        mapping_store: a MappingStore with the matches and frequencies of a previous run (MappingStore - o)
 
-            # finally, do the comparison by finding best match and checking that fuzziness is above some threshold
-            if matching_precision > best_match_precision and match_fuzziness > threshold_fuzziness:
-                best_match_precision = matching_precision
-                best_match = matching_option[0]
+        Returns
+        -------
+        Dictionary object containing every string as key and its best match as value
 
-            if debug:  # debug
-                print matching_string + "[" + str(original_frequency) + "] vs.", matching_option, "-->", best_match, best_match_precision
+        Note
+        ----
+        With a mapping_store only strings that are new or whose frequency changed since the previous run are matched,
+        all other strings keep their stored match. The store is updated with the new matches and frequencies afterwards.
+        """
+        previous_matches = {}
+        previous_frequencies = {}
+        if mapping_store is not None:
+            previous_matches = mapping_store.load_matches()
+            previous_frequencies = mapping_store.load_frequencies()
+
+        best_matches = {}
+        for matching_string in original_strings:
+            if matching_string in previous_matches and \
+                    previous_frequencies.get(matching_string) == original_strings[matching_string]:
+                best_matches[matching_string] = previous_matches[matching_string]
+            else:
+                best_matches[matching_string] = self.find_best_match(matching_string,
+                                                                     original_strings,
+                                                                     number_of_fuzzy_options,
+                                                                     threshold_fuzziness)
+
+        if mapping_store is not None:
+            mapping_store.save(best_matches, original_strings)
+        return best_matches
+
+    def build_matcher(self, original_strings, number_of_fuzzy_options, threshold_fuzziness):
+        """
+        Build a Matcher, which answers find_best_match queries against original_strings from several threads.
 
-        return best_match
+        Parameters
+        ----------
+        original_strings: dictionary with unique strings as keys and their frequencies as values (dict)
+        number_of_fuzzy_options: the number of alternatives of the matching_string fuzzywuzzy should find in the original_strings
+        threshold_fuzziness: the lower threshold for the precision of fuzzy matches
 
+        Returns
+        -------
+        Matcher object
+        """
+        return Matcher(original_strings, number_of_fuzzy_options, threshold_fuzziness)
+
+    @timed(items=lambda result, *args, **kwargs: 1)
     def find_best_match_tuple(self, matching_tuple, original_tuples,
                               threshold_fuzziness, matching_scaling_factor,
                               debug=None):
@@ -249,6 +608,104 @@ class Mapping(object):
 
         return [best_match, best_distance]
 
+    def block_tuples(self, original_tuples, blocking_key):
+        """
+        Split tuples into blocks of tuples with the same blocking key.
+
+        Parameters
+        ----------
+        original_tuples: dictionary with unique tuples as keys and their frequencies as values (dict)
+        blocking_key: function mapping a tuple to its block, e.g. field_blocking_key(0) (func)
+
+        Returns
+        -------
+        Dictionary object containing the blocking keys as keys and dictionaries of tuples and frequencies as values
+        """
+        blocks = {}
+        for original_tuple, frequency in original_tuples.iteritems():
+            blocks.setdefault(blocking_key(original_tuple), {})[original_tuple] = frequency
+        return blocks
+
+    def sorted_neighbourhood_blocks(self, original_tuples, window):
+        """
+        Construct the sorted neighbourhood of every tuple, i.e. the tuples at most window - 1 positions away when all
+        tuples are sorted by their string form.
+
+        Parameters
+        ----------
+        original_tuples: dictionary with unique tuples as keys and their frequencies as values (dict)
+        window: the size of the sliding window (int)
+
+        Returns
+        -------
+        Dictionary object containing every tuple as key and a read-only mapping of its neighbours to their frequencies
+        as value
+        """
+        return dict(self._sorted_neighbourhoods(original_tuples, window))
+
+    def _sorted_neighbourhoods(self, original_tuples, window):
+        # generate (tuple, sorted neighbourhood) pairs, sliding the window over a single sorted list
+        sorted_tuples = sorted(original_tuples, key=self.tuple_to_string)
+        number_of_tuples = len(sorted_tuples)
+        for i, original_tuple in enumerate(sorted_tuples):
+            yield original_tuple, _Neighbourhood(sorted_tuples, original_tuples,
+                                                 max(0, i - window + 1), min(number_of_tuples, i + window))
+
+    def block_size_distribution(self, blocks):
+        """
+        Compute the distribution of block sizes, e.g. to tune a blocking strategy.
+
+        Parameters
+        ----------
+        blocks: blocks as returned by block_tuples or sorted_neighbourhood_blocks (dict)
+
+        Returns
+        -------
+        Dictionary object containing the block size as key and the number of blocks of that size as value
+        """
+        return Counter(len(block) for block in blocks.itervalues())
+
+    @timed(items=lambda result, *args, **kwargs: len(result))
+    def find_best_matches_tuple(self, original_tuples, threshold_fuzziness, matching_scaling_factor,
+                                blocking_key=None, window=None):
+        """
+        Find the best match of every tuple in an array of tuples, comparing only tuples in the same block.
+
+        Parameters
+        ----------
+        original_tuples: dictionary with unique tuples as keys and their frequencies as values (dict)
+        threshold_fuzziness: the lower threshold for the precision of fuzzy matches
+        matching_scaling_factor: see find_best_match_tuple
+        blocking_key: function mapping a tuple to its block, e.g. field_blocking_key(0) or
+                      phonetic_blocking_key(0) (func - o)
+        window: the window size for sorted neighbourhood blocking, used instead of blocking_key (int - o)
+
+        Returns
+        -------
+        Dictionary object containing every tuple as key and [best_match, best_distance] as value
+
+        Note
+        ----
+        Without blocking_key and window every tuple is compared with all other tuples, as in find_best_match_tuple.
+        """
+        if window is not None:
+            # the neighbourhoods are generated one at a time while the window slides over the sorted tuples
+            candidates = self._sorted_neighbourhoods(original_tuples, window)
+        elif blocking_key is not None:
+            blocks = self.block_tuples(original_tuples, blocking_key)
+            candidates = ((t, blocks[blocking_key(t)]) for t in original_tuples)
+        else:
+            candidates = ((t, original_tuples) for t in original_tuples)
+
+        best_matches = {}
+        for matching_tuple, block in candidates:
+            best_matches[matching_tuple] = self.find_best_match_tuple(matching_tuple,
+                                                                      block,
+                                                                      threshold_fuzziness,
+                                                                      matching_scaling_factor)
+        return best_matches
+
+    @timed(items=lambda result, self, *args, **kwargs: len(self.reduced_from_strings))
     def write_reduced_from_strings(self, out_file_name):
         """
         Write the reduced from string array to out_file
@@ -257,8 +714,294 @@ class Mapping(object):
         -----------
         out_file_name (str): the name of the output file
         """
-        out_text = ""
-        for key in self.reduced_from_strings.keys():
-            out_text += key + ";" + str(self.reduced_from_strings[key]) + "\n"
-        with open(out_file_name, 'w') as out_file:
-            out_file.write(out_text)
+        write_table(self.reduced_from_strings, out_file_name)
+
+
+class Matcher(object):
+    """
+    A reusable best match index. The index is built once and read-only afterwards, so a single Matcher can serve
+    concurrent queries, e.g. from a thread pool in a long-running mapping service.
+
+    Parameters
+    ----------
+    original_strings: dictionary with unique strings as keys and their frequencies as values (dict)
+    number_of_fuzzy_options: the number of alternatives of the matching_string fuzzywuzzy should find in the original_strings
+    threshold_fuzziness: the lower threshold for the precision of fuzzy matches
+    """
+    def __init__(self, original_strings, number_of_fuzzy_options, threshold_fuzziness):
+        self._frequencies = dict(original_strings)
+        self._strings = tuple(self._frequencies)
+        self.number_of_fuzzy_options = number_of_fuzzy_options
+        self.threshold_fuzziness = threshold_fuzziness
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, a_string):
+        return a_string in self._frequencies
+
+    def frequency(self, a_string):
+        """
+        Returns the frequency of a string in the index, 0 if it is not in the index.
+        """
+        return self._frequencies.get(a_string, 0)
+
+    @timed(name='src.mappingtools.Matcher.match', items=lambda result, *args, **kwargs: 1)
+    def match(self, matching_string):
+        """
+        Find the best match of a string in the index, as Mapping.find_best_match.
+
+        Parameters
+        ----------
+        matching_string: the string that is to be matched, which need not be in the index (str)
+
+        Returns
+        -------
+        String with best match to matching_string in the index.
+        """
+        # rather than copying the index without the matching_string, we ask for one more option and drop the
+        # matching_string from the result
+        matching_options = process.extract(matching_string, self._strings, limit=self.number_of_fuzzy_options + 1)
+        matching_options = [option for option in matching_options if option[0] != matching_string]
+        matching_options = matching_options[:self.number_of_fuzzy_options]
+
+        return _select_best_match(matching_string, self.frequency(matching_string), matching_options,
+                                  self._frequencies, self.threshold_fuzziness)
+
+    def match_all(self, matching_strings, num_threads=None):
+        """
+        Find the best match of every string in an iterable.
+
+        Parameters
+        ----------
+        matching_strings: the strings that are to be matched (iterable)
+        num_threads: the number of threads; None matches in the calling thread (int - o)
+
+        Returns
+        -------
+        List of best matches in the order of matching_strings
+        """
+        if not num_threads:
+            return [self.match(matching_string) for matching_string in matching_strings]
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(num_threads)
+        try:
+            return pool.map(self.match, matching_strings)
+        finally:
+            pool.close()
+            pool.join()
+
+
+class MappingStore(object):
+    """
+    A persistent store of mapping results in an SQLite file. It records the best match of every standardized string
+    and a snapshot of the string frequencies, so that later runs only need to match new or changed strings (see
+    Mapping.find_best_matches).
+
+    Parameters
+    ----------
+    file_name: the name of the SQLite file, created if it does not exist (str)
+    """
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.connection = sqlite3.connect(file_name)
+        self.connection.text_factory = str  # keep byte strings as they were stored
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS matches (string TEXT PRIMARY KEY, best_match TEXT)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS frequencies (string TEXT PRIMARY KEY, frequency INTEGER)")
+
+    def load_matches(self):
+        """
+        Returns
+        -------
+        Dictionary object containing the stored strings as keys and their best matches as values
+        """
+        return dict(self.connection.execute("SELECT string, best_match FROM matches"))
+
+    def load_frequencies(self):
+        """
+        Returns
+        -------
+        Dictionary object containing the stored strings as keys and their frequencies as values
+        """
+        return dict(self.connection.execute("SELECT string, frequency FROM frequencies"))
+
+    def save(self, best_matches, frequencies):
+        """
+        Replace the stored matches and frequency snapshot.
+
+        Parameters
+        ----------
+        best_matches: dictionary with strings as keys and their best matches as values (dict)
+        frequencies: dictionary with strings as keys and their frequencies as values (dict)
+        """
+        with self.connection:  # a single transaction
+            self.connection.execute("DELETE FROM matches")
+            self.connection.execute("DELETE FROM frequencies")
+            self.connection.executemany("INSERT INTO matches VALUES (?, ?)", best_matches.iteritems())
+            self.connection.executemany("INSERT INTO frequencies VALUES (?, ?)", frequencies.iteritems())
+
+    def close(self):
+        self.connection.close()
+
+
+class StreamingCounter(object):
+    """
+    Count the absolute frequency of strings (or any sortable, picklable objects) in bounded memory. Whenever more
+    than max_entries distinct strings are held in memory, the partial counts are spilled to a sorted run on disk.
+    The runs are merged when the counts are read.
+
+    Parameters
+    ----------
+    max_entries: the maximum number of distinct strings counted in memory (int - o)
+    temp_dir: the directory for the sorted runs, defaults to the system temp directory (str - o)
+
+    Note
+    ----
+    Counters of parallel workers are combined with merge(). A counter can be returned from a worker process as
+    long as its runs are written to a directory that is shared with the parent process and the worker returns
+    counter.hand_over(), so that the copy in the parent process removes the runs. Other copies, e.g. by pickle or
+    copy.deepcopy, read the runs of the original counter but never remove them.
+
+    The runs are removed by close(), at the end of a with block or when the counter is garbage collected:
+    >>> with StreamingCounter(max_entries=2) as counter:
+    ...     counter.update(['foo', 'bar', 'baz', 'foo'])
+    ...     frequencies = counter.to_dict()
+    """
+    def __init__(self, max_entries=1000000, temp_dir=None):
+        self.max_entries = max_entries
+        self.temp_dir = temp_dir
+        self.counts = Counter()
+        self.runs = []  # file names of the sorted runs on disk
+        self._owned_runs = set()  # the runs removed by close(), not those of other counters
+        self._hand_over = set()  # the runs taken over by the next copy
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # e.g. at interpreter shutdown
+            pass
+
+    def __getstate__(self):
+        # only the copy of a counter that was handed over removes the runs
+        state = self.__dict__.copy()
+        state['_owned_runs'] = self._hand_over
+        state['_hand_over'] = set()
+        return state
+
+    def hand_over(self):
+        """
+        Pass the ownership of the runs on to the next copy of this counter, e.g. the one a worker process returns to
+        its parent. This counter keeps its counts but no longer removes the runs.
+
+        Returns
+        -------
+        The counter itself
+        """
+        self._hand_over = self._owned_runs
+        self._owned_runs = set()
+        return self
+
+    def update(self, strings):
+        """
+        Count every string of an iterable, e.g. a file or a generator.
+
+        Parameters
+        ----------
+        strings: the strings to be counted (iterable)
+        """
+        counts = self.counts
+        for string in strings:
+            counts[string] += 1
+            if len(counts) > self.max_entries:
+                self.spill()
+                counts = self.counts
+
+    def spill(self):
+        """
+        Write the counts held in memory to a sorted run on disk.
+        """
+        if not self.counts:
+            return
+        handle, run_file_name = tempfile.mkstemp(suffix='.run', dir=self.temp_dir)
+        with os.fdopen(handle, 'wb') as run_file:
+            for entry in sorted(self.counts.iteritems()):
+                pickle.dump(entry, run_file, pickle.HIGHEST_PROTOCOL)
+        self.runs.append(run_file_name)
+        self._owned_runs.add(run_file_name)
+        self.counts = Counter()
+
+    def merge(self, other):
+        """
+        Add the counts of another StreamingCounter, e.g. one filled by a parallel worker. The other counter hands
+        over its runs and is empty afterwards; runs that belong to a third counter, e.g. if other is a copy, are read
+        but not removed by this counter.
+
+        Parameters
+        ----------
+        other: the counter to be merged (StreamingCounter)
+        """
+        self.runs.extend(other.runs)
+        self._owned_runs.update(other._owned_runs)
+        other.runs = []
+        other._owned_runs = set()
+        for string, count in other.counts.iteritems():
+            self.counts[string] += count
+        other.counts = Counter()
+        if len(self.counts) > self.max_entries:
+            self.spill()
+
+    def _read_run(self, run_file_name):
+        with open(run_file_name, 'rb') as run_file:
+            while True:
+                try:
+                    yield pickle.load(run_file)
+                except EOFError:
+                    return
+
+    def iteritems(self):
+        """
+        Iterate over the merged counts in sorted order of the strings.
+
+        Returns
+        -------
+        Iterator of (string, frequency) pairs
+        """
+        sorted_runs = [self._read_run(run_file_name) for run_file_name in self.runs]
+        sorted_runs.append(iter(sorted(self.counts.iteritems())))
+        for string, entries in groupby(heapq.merge(*sorted_runs), key=lambda entry: entry[0]):
+            yield string, sum(count for _, count in entries)
+
+    def to_dict(self):
+        """
+        Returns
+        -------
+        Counter object containing unique string as key and frequency as value, as compute_string_frequency
+        """
+        return Counter(dict(self.iteritems()))
+
+    def write(self, out_file_name):
+        """
+        Write the merged counts to out_file, one "string;frequency" line per string.
+
+        Parameters:
+        -----------
+        out_file_name (str): the name of the output file
+        """
+        write_table(self.iteritems(), out_file_name)
+
+    def close(self):
+        """
+        Remove the runs on disk, unless they belong to another counter.
+        """
+        while self.runs:
+            run_file_name = self.runs.pop()
+            if run_file_name in self._owned_runs and os.path.exists(run_file_name):
+                os.remove(run_file_name)
+        self._owned_runs = set()
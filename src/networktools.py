@@ -3,6 +3,7 @@ __author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
 import networkx as nx
 from math import sqrt
 from src.node import Node
+from src.profiletools import timed
 
 
 #-------------------------------------------------------------------------
@@ -48,6 +49,7 @@ class Network(object):
     #-------------------------------------------------------------------------
     #
     #-------------------------------------------------------------------------
+    @timed(items=lambda result, self, G_agg, G: G.number_of_edges())
     def add_networks(self, G_agg, G):
         """
         Adds the second network to the first
@@ -70,6 +72,7 @@ class Network(object):
             add_link(G_agg, str(u), str(v), edata['weight'])
 
 
+    @timed(items=lambda result, self, G: G.number_of_nodes())
     def compute_node_properties(self, G):
         """
         Parameters
@@ -0,0 +1,188 @@
+"""
+============
+profiletools
+============
+
+Opt-in timing of the econlib pipelines. Instrumented functions record their
+number of calls, cumulative and per-call latency and number of items
+processed in a global registry, which can be reported or exported to JSON.
+Instrumentation is disabled by default and costs a single flag check per
+call until enable() is called.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+__author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
+__all__ = ['enable', 'disable', 'is_enabled', 'reset', 'timed', 'timer',
+           'get_stats', 'report', 'to_json']
+__version__ = 0.1
+
+_enabled = False
+_registry = {}
+_lock = threading.Lock()
+
+
+class _Stats(object):
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.min_time = None
+        self.max_time = 0.0
+        self.items = 0
+
+    def add(self, elapsed, items):
+        self.calls += 1
+        self.total_time += elapsed
+        if self.min_time is None or elapsed < self.min_time:
+            self.min_time = elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.items += items
+
+    def as_dict(self):
+        return {'calls': self.calls,
+                'total_time': self.total_time,
+                'mean_time': self.total_time/self.calls if self.calls else 0.0,
+                'min_time': self.min_time or 0.0,
+                'max_time': self.max_time,
+                'items': self.items}
+
+
+def _record(name, elapsed, items):
+    with _lock:
+        if name not in _registry:
+            _registry[name] = _Stats()
+        _registry[name].add(elapsed, items)
+
+
+def enable():
+    """
+    Start recording instrumented calls.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Stop recording instrumented calls. Recorded statistics are kept.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """
+    Remove all recorded statistics.
+    """
+    with _lock:
+        _registry.clear()
+
+
+def timed(name=None, items=None):
+    """
+    Decorator recording the calls of a function while instrumentation is enabled.
+
+    Parameters
+    ----------
+    name: the name in the registry, defaults to module.function (str - o)
+    items: function returning the number of items processed by a call; it is
+           called with the result followed by the arguments of the call (func - o)
+
+    Example
+    -------
+    >>> @timed(items=lambda result, strings: len(strings))
+    ... def clean_all(strings):
+    ...     return [s.strip() for s in strings]
+    """
+    def decorator(func):
+        record_name = name or func.__module__ + "." + func.__name__
+
+        @wraps(func)
+        def instrumented(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start_time = time.time()
+            result = func(*args, **kwargs)
+            elapsed = time.time() - start_time
+            _record(record_name, elapsed, items(result, *args, **kwargs) if items else 0)
+            return result
+        return instrumented
+    return decorator
+
+
+class _Timer(object):
+    def __init__(self, items):
+        self.items = items
+
+
+@contextmanager
+def timer(name, items=0):
+    """
+    Context manager recording the execution of a block while instrumentation
+    is enabled. The number of items can be set on the yielded object.
+
+    Parameters
+    ----------
+    name: the name in the registry (str)
+    items: the number of items processed in the block (int - o)
+
+    Example
+    -------
+    >>> with timer('read names') as t:
+    ...     names = ['foo', 'bar']
+    ...     t.items = len(names)
+    """
+    block = _Timer(items)
+    start_time = time.time()
+    try:
+        yield block
+    finally:
+        if _enabled:
+            _record(name, time.time() - start_time, block.items)
+
+
+def get_stats():
+    """
+    Returns
+    -------
+    dictionary object with the recorded name as key and a dictionary of calls,
+    total_time, mean_time, min_time, max_time (in seconds) and items as value
+    """
+    with _lock:
+        return dict((name, stats.as_dict()) for name, stats in _registry.items())
+
+
+def report():
+    """
+    Returns
+    -------
+    a human-readable table of the recorded statistics, sorted by cumulative time (str)
+    """
+    stats = sorted(get_stats().items(), key=lambda entry: -entry[1]['total_time'])
+    width = max([len(name) for name, _ in stats] + [len('name')])
+    lines = ["name".ljust(width) + "      calls    total [s]  per call [ms]        items      items/s"]
+    for name, entry in stats:
+        rate = entry['items']/entry['total_time'] if entry['total_time'] > 0 else 0.0
+        lines.append("%s %10d %12.4f %14.4f %12d %12.0f" % (name.ljust(width), entry['calls'], entry['total_time'],
+                                                             1000*entry['mean_time'], entry['items'], rate))
+    return "\n".join(lines)
+
+
+def to_json(file_name=None):
+    """
+    Export the recorded statistics to JSON.
+
+    Parameters
+    ----------
+    file_name: the name of the output file; if None the JSON string is returned (str - o)
+    """
+    if file_name is None:
+        return json.dumps(get_stats(), indent=2, sort_keys=True)
+    with open(file_name, 'w') as f:
+        json.dump(get_stats(), f, indent=2, sort_keys=True)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python2.7
+# -*- coding: utf-8 -*-
+
+__author__ = """Michael E. Rose (Michael.Ernst.Rose@gmail.com)"""
+
+#-------------------------------------------------------------------------
+#
+#  dirtystringtools.py is a collection of methods for cleaning strings
+#
+#-------------------------------------------------------------------------
+if __name__ == '__main__':
+
+#
+# VARIABLES
+#
+    import sys
+
+    import src.dirtystringtools as DST
+
+    args = sys.argv
+
+    # we have multiple tests here, the first argument specifies which test
+    # to run
+    test_number = args[1]
+
+    #
+    # TEST 1: clean_strings
+    #
+    if test_number == "1":
+        input_file_name = args[2]
+
+        with open(input_file_name, 'r') as input_file:
+            dirty_strings = [line.strip() for line in input_file.readlines()]
+
+        clean_strings = DST.clean_strings(dirty_strings)
+        parallel_clean_strings = DST.clean_strings(dirty_strings, processes=2, chunksize=2)
+
+        print "DirtyStringTools version: " + str(DST.__version__)
+        for dirty_string, clean_string in zip(dirty_strings, clean_strings):
+            print dirty_string + "  -->  " + clean_string
+        print "serial and parallel cleaning agree:", clean_strings == parallel_clean_strings
+
+
+    #
+    # TEST 2: StringCache
+    #
+    if test_number == "2":
+        input_file_name = args[2]
+        maxsize = int(args[3])
+
+        string_cache = DST.StringCache(maxsize)
+        cached_normalize = string_cache.memoize(DST.normalize)
+        cached_standardize = string_cache.memoize(DST.standardize)
+
+        print "DirtyStringTools version: " + str(DST.__version__)
+        with open(input_file_name, 'r') as input_file:
+            for line in input_file.readlines():
+                print line.strip() + "  -->  " + cached_standardize(cached_normalize(line.strip()))
+        print "cache info: ", string_cache.info()
+
+
+    #
+    # TEST 3: translit and Transliterator
+    #
+    if test_number == "3":
+        input_file_name = args[2]
+
+        # extend the default table by polish characters
+        transliterator = DST.Transliterator()
+        transliterator.update({u'Ł': u'L', u'ł': u'l'})
+
+        print "DirtyStringTools version: " + str(DST.__version__)
+        with open(input_file_name, 'r') as input_file:
+            for line in input_file.readlines():
+                print line.strip() + "  -->  " + DST.translit(line.strip()) + " | " + transliterator(line.strip())
+        with open(input_file_name, 'r') as input_file:
+            dirty_strings = [line.strip() for line in input_file.readlines()]
+        # clean() with the extended table
+        for dirty_string, clean_string in zip(dirty_strings, DST.clean_strings(dirty_strings, transliterator=transliterator)):
+            print dirty_string + "  -->  " + clean_string
+        # a table with ASCII keys also applies to pure ASCII strings
+        ampersand = DST.Transliterator({u'&': u'and'})
+        for dirty_string in ['A&B', u'A&B', 'A&B\xc3\xa9']:
+            print repr(dirty_string) + "  -->  " + repr(DST.clean(dirty_string, ampersand))
@@ -0,0 +1,10 @@
+#!/bin/bash
+
+# clean_strings
+./test_dirtystringtools.py 1 samples/dirtystringtools/dirty_strings_sample_file.csv
+
+# StringCache
+./test_dirtystringtools.py 2 samples/mappingtools/string_frequency_sample_file.csv 4
+
+# translit
+./test_dirtystringtools.py 3 samples/dirtystringtools/dirty_strings_sample_file.csv
@@ -13,6 +13,7 @@ if __name__ == '__main__':
 #
 # VARIABLES
 #
+    import os
     import sys
 
     import src.mappingtools as MT
@@ -146,3 +147,211 @@ if __name__ == '__main__':
             )
 
             print matching_tuple, " -->", best_match, "with best_distance:", best_distance
+
+
+    #
+    # TEST 5: standardize_string with a shared string cache
+    #
+    if test_number == "5":
+        input_file_name = args[2]
+        redundant_strings_file_name = args[3]
+
+        from src.dirtystringtools import StringCache
+        string_cache = StringCache(maxsize=1000)
+
+        # two mappings share the cache, so every distinct string is standardized once
+        from_mapping = MT.Mapping(string_cache)
+        to_mapping = MT.Mapping(string_cache)
+        redundant_strings = from_mapping.read_redundant_strings(redundant_strings_file_name)
+
+        print "MappingTools version: " + str(MT.__version__)
+        with open(input_file_name, 'r') as input_file:
+            for line in input_file.readlines():
+                from_string = from_mapping.standardize_string(line.strip(), redundant_strings)
+                to_string = to_mapping.standardize_string(line.strip(), redundant_strings)
+                print line.strip() + "  -->  " + from_string, to_string
+        print "cache info: ", string_cache.info()
+
+
+    #
+    # TEST 6: incremental best matches with a mapping store
+    #
+    if test_number == "6":
+        input_file_name = args[2]
+        update_file_name = args[3]
+        store_file_name = args[4]
+
+        mapping = MT.Mapping()
+        mapping_store = MT.MappingStore(store_file_name)
+
+        print "MappingTools version: " + str(MT.__version__)
+        number_of_fuzzy_options = 4
+        threshold_fuzziness = 80
+
+        # the first run matches all strings, the second run only the new and changed ones
+        for run, file_name in enumerate([input_file_name, update_file_name]):
+            with open(file_name, 'r') as input_file:
+                from_strings = [line.strip() for line in input_file.readlines()]
+            reduced_from_strings = mapping.compute_string_frequency(from_strings)
+            previous_frequencies = mapping_store.load_frequencies()
+
+            best_matches = mapping.find_best_matches(reduced_from_strings,
+                                                     number_of_fuzzy_options,
+                                                     threshold_fuzziness,
+                                                     mapping_store)
+            print "<< RUN" + str(run + 1) + ": "
+            for matching_string in sorted(best_matches):
+                rematched = previous_frequencies.get(matching_string) != reduced_from_strings[matching_string]
+                print matching_string + " --> " + best_matches[matching_string], "(rematched)" if rematched else ""
+        mapping_store.close()
+
+
+    #
+    # TEST 7: find matching tuples with blocking
+    #
+    if test_number == "7":
+        input_file_name = args[2]
+
+        mapping = MT.Mapping()
+
+        with open(input_file_name, 'r') as input_file:
+            from_tuples = [tuple(line.strip().split(",")) for line in input_file.readlines()]
+        reduced_from_tuples = mapping.compute_string_frequency(from_tuples)
+
+        print "MappingTools version: " + str(MT.__version__)
+        threshold_fuzziness = 80.0
+        matching_scaling_factor = 50.0
+
+        strategies = [("exact second field", mapping.block_tuples(reduced_from_tuples, MT.field_blocking_key(1)),
+                       dict(blocking_key=MT.field_blocking_key(1))),
+                      ("phonetic first field", mapping.block_tuples(reduced_from_tuples, MT.phonetic_blocking_key(0)),
+                       dict(blocking_key=MT.phonetic_blocking_key(0))),
+                      ("sorted neighbourhood", mapping.sorted_neighbourhood_blocks(reduced_from_tuples, 3),
+                       dict(window=3))]
+        for name, blocks, blocking in strategies:
+            print "<< " + name + ", block size distribution:", dict(mapping.block_size_distribution(blocks))
+            best_matches = mapping.find_best_matches_tuple(reduced_from_tuples,
+                                                           threshold_fuzziness,
+                                                           matching_scaling_factor,
+                                                           **blocking)
+            for matching_tuple in sorted(best_matches):
+                print matching_tuple, " -->", best_matches[matching_tuple][0]
+
+
+    #
+    # TEST 8: streaming string frequency
+    #
+    if test_number == "8":
+        input_file_name = args[2]
+        max_entries = int(args[3])
+
+        # two workers count one half of the file each, with very little memory
+        with MT.StreamingCounter(max_entries) as first_counter, MT.StreamingCounter(max_entries) as second_counter:
+            with open(input_file_name, 'r') as input_file:
+                for i, line in enumerate(input_file):
+                    if i % 2 == 0:
+                        first_counter.update([line.strip()])
+                    else:
+                        second_counter.update([line.strip()])
+            first_counter.merge(second_counter)
+
+            print "MappingTools version: " + str(MT.__version__)
+            print "number of sorted runs: ", len(first_counter.runs)
+            print first_counter.to_dict()
+            run_file_names = list(first_counter.runs)
+        print "runs removed: ", not any(os.path.exists(run_file_name) for run_file_name in run_file_names)
+
+
+    #
+    # TEST 9: concurrent queries to a Matcher
+    #
+    if test_number == "9":
+        input_file_name = args[2]
+        num_threads = int(args[3])
+
+        mapping = MT.Mapping()
+        with open(input_file_name, 'r') as input_file:
+            mapping.from_strings = [line.strip() for line in input_file.readlines()]
+        mapping.reduced_from_strings = mapping.compute_string_frequency(mapping.from_strings)
+
+        number_of_fuzzy_options = 4
+        threshold_fuzziness = 80
+        matcher = mapping.build_matcher(mapping.reduced_from_strings, number_of_fuzzy_options, threshold_fuzziness)
+
+        print "MappingTools version: " + str(MT.__version__)
+        # the matcher also answers queries for strings that are not in the index
+        matching_strings = sorted(mapping.reduced_from_strings) + ["foooo", "bra"]
+        best_matches = matcher.match_all(matching_strings, num_threads)
+        for matching_string, best_match in zip(matching_strings, best_matches):
+            if matching_string in matcher:
+                expected = mapping.find_best_match(matching_string, mapping.reduced_from_strings,
+                                                   number_of_fuzzy_options, threshold_fuzziness)
+                print matching_string + " --> " + best_match, "(agrees with find_best_match: " + str(expected == best_match) + ")"
+            else:
+                print matching_string + " --> " + best_match
+
+
+    #
+    # TEST 10: text and binary tables
+    #
+    if test_number == "10":
+        input_file_name = args[2]
+        out_file_name = args[3]
+
+        mapping = MT.Mapping()
+        with open(input_file_name, 'r') as input_file:
+            mapping.from_strings = [line.strip() for line in input_file.readlines()]
+        mapping.reduced_from_strings = mapping.compute_string_frequency(mapping.from_strings)
+        best_matches = mapping.find_best_matches(mapping.reduced_from_strings, 4, 80)
+
+        print "MappingTools version: " + str(MT.__version__)
+        mapping.write_reduced_from_strings(out_file_name + ".csv")
+        print "text table reads back: ", MT.read_table(out_file_name + ".csv", int) == mapping.reduced_from_strings
+
+        MT.write_binary_table(mapping.reduced_from_strings, out_file_name + ".freq")
+        MT.write_binary_table(best_matches, out_file_name + ".map")
+        frequencies = MT.MappedTable(out_file_name + ".freq")
+        matches = MT.MappedTable(out_file_name + ".map")
+        print "binary tables read back: ", dict(frequencies.iteritems()) == mapping.reduced_from_strings, \
+            dict(matches.iteritems()) == best_matches
+        for matching_string in ["fo", "foo", "unknown"]:
+            print matching_string + " --> " + matches.get(matching_string, "-"), frequencies.get(matching_string, 0)
+        frequencies.close()
+        matches.close()
+
+
+    #
+    # TEST 11: copies of a streaming counter
+    #
+    if test_number == "11":
+        import cPickle as pickle
+        input_file_name = args[2]
+        max_entries = int(args[3])
+
+        with open(input_file_name, 'r') as input_file:
+            strings = [line.strip() for line in input_file]
+
+        print "MappingTools version: " + str(MT.__version__)
+        with MT.StreamingCounter(max_entries) as counter:
+            counter.update(strings)
+            frequencies = counter.to_dict()
+            # pickling does not change the counter, and the copy does not remove its runs
+            copied_counter = pickle.loads(pickle.dumps(counter))
+            print "original counts kept after pickling: ", counter.to_dict() == frequencies
+            print "copy has the same counts: ", copied_counter.to_dict() == frequencies
+            copied_counter.close()
+            print "original counts kept after closing the copy: ", counter.to_dict() == frequencies
+
+            # merging a copy reads its runs, but the merged counter does not remove them
+            with MT.StreamingCounter(max_entries) as merged_counter:
+                merged_counter.merge(pickle.loads(pickle.dumps(counter)))
+                print "merged copy has the same counts: ", merged_counter.to_dict() == frequencies
+            print "original counts kept after closing the merged counter: ", counter.to_dict() == frequencies
+
+            # a counter that is handed over, e.g. by a worker process, passes its runs on to the copy
+            returned_counter = pickle.loads(pickle.dumps(counter.hand_over()))
+            run_file_names = list(counter.runs)
+        print "runs kept by the returned copy: ", all(os.path.exists(run_file_name) for run_file_name in run_file_names)
+        print "returned copy has the same counts: ", returned_counter.to_dict() == frequencies
+        returned_counter.close()
+        print "runs removed: ", not any(os.path.exists(run_file_name) for run_file_name in run_file_names)
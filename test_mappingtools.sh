@@ -6,3 +6,25 @@
 # best matches
 ./test_mappingtools.py 3 samples/mappingtools/best_match_sample_file.csv
 ./test_mappingtools.py 4 samples/mappingtools/best_tuple_match_sample_file.csv
+
+# standardize strings with a shared cache
+./test_mappingtools.py 5 samples/mappingtools/string_frequency_sample_file.csv samples/mappingtools/redundant_strings.csv
+
+# incremental best matches
+rm -f best_match_store.sqlite
+./test_mappingtools.py 6 samples/mappingtools/best_match_sample_file.csv samples/mappingtools/best_match_update_sample_file.csv best_match_store.sqlite
+rm -f best_match_store.sqlite
+
+# best tuple matches with blocking
+./test_mappingtools.py 7 samples/mappingtools/best_tuple_match_sample_file.csv
+
+# streaming string frequency
+./test_mappingtools.py 8 samples/mappingtools/string_frequency_sample_file.csv 2
+./test_mappingtools.py 11 samples/mappingtools/string_frequency_sample_file.csv 2
+
+# concurrent matcher queries
+./test_mappingtools.py 9 samples/mappingtools/best_match_sample_file.csv 4
+
+# text and binary tables
+./test_mappingtools.py 10 samples/mappingtools/best_match_sample_file.csv best_match_tables
+rm -f best_match_tables.csv best_match_tables.freq best_match_tables.map
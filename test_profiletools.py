@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__author__ = """Co-Pierre Georg (co-pierre.georg@uct.ac.za)"""
+
+#-------------------------------------------------------------------------
+#
+#  profiletools.py records the timing of the econlib pipelines
+#
+#-------------------------------------------------------------------------
+if __name__ == '__main__':
+
+#
+# VARIABLES
+#
+    import sys
+
+    import src.profiletools as profiletools
+    import src.iotools as iotools
+    import src.mappingtools as MT
+
+    args = sys.argv
+    best_match_file_name = args[1]
+    csv_file_name = args[2]
+
+    profiletools.enable()
+
+    mapping = MT.Mapping()
+    with profiletools.timer('read strings') as t:
+        with open(best_match_file_name, 'r') as input_file:
+            mapping.from_strings = [line.strip() for line in input_file.readlines()]
+        t.items = len(mapping.from_strings)
+    mapping.reduced_from_strings = mapping.compute_string_frequency(mapping.from_strings)
+    mapping.find_best_matches(mapping.reduced_from_strings, 4, 80)
+    iotools.csv_to_dict(csv_file_name, lambda row: " ".join(row[:2]), lambda row: row[2])
+    # keyword arguments are passed on to the item counts
+    mapping.compute_string_frequency(string_array=mapping.from_strings)
+
+    # calls after disable() are not recorded
+    profiletools.disable()
+    mapping.compute_string_frequency(mapping.from_strings)
+
+    print "ProfileTools version: " + str(profiletools.__version__)
+    print profiletools.report()
+    stats = profiletools.get_stats()
+    print "compute_string_frequency calls: ", stats['src.mappingtools.compute_string_frequency']['calls']
+    print "find_best_match calls: ", stats['src.mappingtools.find_best_match']['calls']
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# timing of the mapping and io pipelines
+./test_profiletools.py samples/mappingtools/best_match_sample_file.csv samples/iotools/csv_to_dict_sample_file.csv